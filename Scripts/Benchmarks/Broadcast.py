@@ -0,0 +1,66 @@
+"""
+Feeds three consumers with the items of one source: by walking the source three times, by materializing it in a list, and through a Broadcaster with one thread per consumer. Prints the time and the peak memory of each.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Broadcast [itemCount] [capacity]
+"""
+
+import sys
+import threading
+import tracemalloc
+
+from time import perf_counter
+
+def main() -> None:
+    from WinCopies.Collections.Enumeration import GetNativeIterator
+    from WinCopies.Collections.Enumeration.Broadcast import Broadcaster
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    capacity: int = int(sys.argv[2]) if len(sys.argv) > 2 else 4096
+
+    def getItems():
+        # Stands for a directory walk: each item costs some work.
+        for i in range(count):
+            yield str(i * 7919 % 1000003)
+
+    def consume(items) -> None: # type: ignore
+        for _ in items:
+            pass
+
+    def walk() -> None:
+        for _ in range(3):
+            consume(getItems())
+
+    def materialize() -> None:
+        items: list[str] = list(getItems())
+
+        for _ in range(3):
+            consume(items)
+
+    def broadcast() -> None:
+        broadcaster: Broadcaster[str] = Broadcaster[str](getItems(), 3, capacity)
+        threads: list[threading.Thread] = [threading.Thread(target = consume, args = (GetNativeIterator(enumerator),)) for enumerator in broadcaster.GetEnumerators()]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    print(f"{'3 consumers of ' + str(count) + ' items':<40}{'time':>12}{'peak':>14}")
+
+    for name, func in (("3 walks", walk), ("list", materialize), ("Broadcaster, capacity = " + str(capacity), broadcast)):
+        tracemalloc.start()
+
+        start: float = perf_counter()
+
+        func()
+
+        elapsed: float = perf_counter() - start
+        peak: int = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.stop()
+
+        print(f"{name:<40}{elapsed:>10.4f} s{peak / 1048576:>11.2f} MiB")
+
+if __name__ == "__main__":
+    main()
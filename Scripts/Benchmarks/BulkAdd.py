@@ -0,0 +1,42 @@
+"""
+Compares adding items to linked lists one at a time and adding them all at once, with AddLastItems and PushItems.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.BulkAdd [itemCount]
+"""
+
+import sys
+
+from collections.abc import Callable
+from time import perf_counter
+
+def measure(add: Callable[[range], object], count: int) -> float:
+    start: float = perf_counter()
+
+    add(range(count))
+
+    return perf_counter() - start
+
+def main() -> None:
+    from WinCopies.Collections.Linked import Doubly, Singly
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    def addEach(add: Callable[[int], object]) -> Callable[[range], None]:
+        def addItems(items: range) -> None:
+            for item in items:
+                add(item)
+
+        return addItems
+
+    print(f"{'add of ' + str(count) + ' items':<40}{'time':>12}")
+
+    for name, factory in (("Doubly.List", Doubly.List[int]), ("Doubly.CountableList", Doubly.CountableList[int])):
+        print(f"{name + '.AddLast':<40}{measure(addEach(factory().AddLast), count):>10.4f} s")
+        print(f"{name + '.AddLastItems':<40}{measure(factory().AddLastItems, count):>10.4f} s")
+
+    for name, factory in (("Singly.Queue", Singly.Queue[int]), ("Singly.Stack", Singly.Stack[int]), ("Singly.CountableQueue", Singly.CountableQueue[int])):
+        print(f"{name + '.Push':<40}{measure(addEach(factory().Push), count):>10.4f} s")
+        print(f"{name + '.PushItems':<40}{measure(factory().PushItems, count):>10.4f} s")
+
+if __name__ == "__main__":
+    main()
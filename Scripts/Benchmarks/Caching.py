@@ -0,0 +1,36 @@
+"""
+Measures the first enumeration of a source through a CachingEnumerable, which records it, then its replays, served from memory or from a temporary file.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Caching [itemCount]
+"""
+
+import sys
+
+from time import perf_counter
+
+def main() -> None:
+    from WinCopies.Collections.Enumeration.Caching import CachingEnumerable
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    def getItems():
+        for i in range(count):
+            yield str(i * 7919 % 1000003)
+
+    def measure(iterable) -> float: # type: ignore
+        start: float = perf_counter()
+
+        for _ in iterable:
+            pass
+
+        return perf_counter() - start
+
+    print(f"{'enumeration of ' + str(count) + ' items':<40}{'first':>12}{'replay':>12}")
+    print(f"{'source':<40}{measure(getItems()):>10.4f} s{measure(getItems()):>10.4f} s")
+
+    for threshold in (None, count // 10):
+        with CachingEnumerable[str](getItems(), threshold) as items:
+            print(f"{'CachingEnumerable, threshold = ' + str(threshold):<40}{measure(items):>10.4f} s{measure(items):>10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Measures a doubly linked list used as a queue whose items are added and removed in turn, with and without reusing its removed nodes, and counts the nodes allocated per operation.
+
+The queue first holds size items; each operation then adds an item at its end and removes its first one. The nodes are only reused when the list does not hand them out, so the items are added with AddLastValues, which does not return their node, and, for comparison, with AddLast, which does.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Churn [operationCount] [size]
+"""
+
+import sys
+
+from collections.abc import Callable
+from time import perf_counter
+
+def main() -> None:
+    from WinCopies.Collections.Linked import Doubly
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    size: int = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    class UnpooledList(Doubly.List[int]):
+        _NodePoolCapacity: int = 0
+
+    allocations: int = 0
+
+    def onAllocated(*_: object) -> None:
+        nonlocal allocations
+
+        allocations += 1
+
+    # Only the calls of the initializer of the nodes are reported, so that the other calls are not slowed down.
+    monitoring = sys.monitoring
+    tool: int = monitoring.PROFILER_ID
+
+    monitoring.use_tool_id(tool, "Churn")
+    monitoring.register_callback(tool, monitoring.events.PY_START, onAllocated)
+
+    def measure(factory: Callable[[], Doubly.List[int]], handOut: bool) -> tuple[float, float]:
+        nonlocal allocations
+
+        def run() -> None:
+            add: Callable[[int], object] = l.AddLast if handOut else l.AddLastValues
+
+            for i in range(count):
+                add(i)
+                l.TryRemoveFirstValue(None)
+
+        l: Doubly.List[int] = factory()
+
+        l.AddLastItems(range(size))
+
+        start: float = perf_counter()
+
+        run()
+
+        time: float = perf_counter() - start
+
+        allocations = 0
+
+        monitoring.set_local_events(tool, Doubly.DoublyLinkedNodeBase.__init__.__code__, monitoring.events.PY_START)
+
+        try:
+            run()
+
+        finally:
+            monitoring.set_local_events(tool, Doubly.DoublyLinkedNodeBase.__init__.__code__, 0)
+
+        return (allocations / count, time)
+
+    try:
+        print(f"{'churn of ' + str(count) + ' items (' + str(size) + ' queued)':<40}{'nodes/op':>10}{'time':>12}")
+
+        for name, factory, handOut in (("AddLast, unpooled", UnpooledList, True), ("AddLast, pooled", Doubly.List[int], True), ("AddLastValues, unpooled", UnpooledList, False), ("AddLastValues, pooled", Doubly.List[int], False)):
+            allocated, time = measure(factory, handOut)
+
+            print(f"{name:<40}{allocated:>10.4f}{time:>10.4f} s")
+
+    finally:
+        monitoring.register_callback(tool, monitoring.events.PY_START, None)
+        monitoring.free_tool_id(tool)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares the enumeration of items built by successive concatenations when each concatenation nests a generator and when it adds a segment to a ConcatenationBuilder.
+
+Each concatenation appends a single item to the previous ones, so that the nested generators are as deep as the number of concatenations, which is therefore limited by the recursion limit for them.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Concatenation [itemCount] [concatenationCount]
+"""
+
+import sys
+
+from collections.abc import Callable, Iterable
+from time import perf_counter
+
+def measure(build: Callable[[], Iterable[int]]) -> tuple[int, float]:
+    start: float = perf_counter()
+    enumerated: int = sum(1 for _ in build())
+
+    return (enumerated, perf_counter() - start)
+
+def main() -> None:
+    from WinCopies.Collections import Iteration
+    from WinCopies.Collections.Enumeration.Extensions import ConcatenationBuilder
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    concatenations: int = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    def nest() -> Iterable[int]:
+        items: Iterable[int] = range(count)
+
+        for i in range(concatenations):
+            items = Iteration.AppendItem(items, i)
+
+        return items
+    def build() -> Iterable[int]:
+        builder: ConcatenationBuilder[int] = ConcatenationBuilder[int](range(count))
+
+        for i in range(concatenations):
+            builder.Append((i,))
+
+        return builder
+
+    print(f"{str(count) + ' items, ' + str(concatenations) + ' concatenations':<40}{'items':>10}{'time':>12}")
+
+    for name, function in (("Iteration.AppendItem", nest), ("ConcatenationBuilder.Append", build)):
+        enumerated, time = measure(function)
+
+        print(f"{name:<40}{enumerated:>10}{time:>10.4f} s")
+
+if __name__ == "__main__":
+    main()
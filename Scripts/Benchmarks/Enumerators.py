@@ -0,0 +1,63 @@
+"""
+Measures the cost of short-lived enumerators: construction, enumeration of a small tuple and memory of a started enumerator.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Enumerators [enumeratorCount]
+"""
+
+import sys
+import tracemalloc
+
+from time import perf_counter
+
+def measureConstruction(count: int) -> float:
+    from WinCopies.Collections.Enumeration import Iterator
+
+    items: tuple[int, ...] = (1, 2, 3)
+    start: float = perf_counter()
+
+    for _ in range(count):
+        Iterator[int](iter(items))
+
+    return perf_counter() - start
+
+def measureEnumeration(count: int) -> float:
+    from WinCopies.Collections.Enumeration import Iterator
+
+    items: tuple[int, ...] = (1, 2, 3)
+    start: float = perf_counter()
+
+    for _ in range(count):
+        enumerator: Iterator[int] = Iterator[int](iter(items))
+
+        while enumerator.MoveNext():
+            enumerator.GetCurrent()
+
+    return perf_counter() - start
+
+def measureMemory(count: int) -> float:
+    from WinCopies.Collections.Enumeration import Iterator
+
+    items: tuple[int, ...] = (1, 2, 3)
+
+    tracemalloc.start()
+
+    enumerators: list[Iterator[int]] = [Iterator[int](iter(items)) for _ in range(count)]
+
+    for enumerator in enumerators:
+        enumerator.MoveNext()
+
+    size: int = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    return size / count
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    print(f"construction of {count} enumerators: {measureConstruction(count):.4f} s")
+    print(f"enumeration of {count} 3-item tuples: {measureEnumeration(count):.4f} s")
+    print(f"memory of a started enumerator: {measureMemory(min(count, 10000)):.0f} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares the cost of the runtime call-site guards when they are enabled and disabled.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Guards [itemCount] [rowCount]
+
+Guards are read once at import, so each measure runs in its own process with WINCOPIES_GUARDS set accordingly.
+"""
+
+import os
+import subprocess
+import sys
+
+from time import perf_counter
+
+def measureListInsert(count: int) -> float:
+    from WinCopies.Collections.Linked.Doubly import List
+
+    l: List[int] = List[int]()
+
+    start: float = perf_counter()
+
+    for i in range(count):
+        l.AddLast(i)
+
+    return perf_counter() - start
+
+def measureRowIteration(count: int) -> float:
+    from WinCopies.Collections import MakeSequence
+    from WinCopies.Collections.Abstraction.Collection import Array
+    from WinCopies.Data import Column
+    from WinCopies.Data.Field import FieldAttributes, IntegerMode
+    from WinCopies.Data.Set.Extensions import TableParameterSet, ColumnParameterSet
+    from WinCopies.Data.SQLite import Connection
+    from WinCopies.Typing.Object import String
+
+    connection: Connection = Connection(":memory:")
+    connection.Open()
+    connection.CreateTable("items", MakeSequence(connection.GetFieldFactory().CreateInteger("value", FieldAttributes.Null, IntegerMode.Long)))
+    connection.GetQueryFactory().GetMultiInsertionQuery("items", Array[String]([String("value")]), ((i,) for i in range(count))).Execute()
+
+    start: float = perf_counter()
+
+    # One query per 100 rows so that the per-result guards are measured as well as the row loop.
+    for _ in range(100):
+        result = connection.GetQueryFactory().GetSelectionQuery(TableParameterSet.Create(MakeSequence(String("items"))), ColumnParameterSet({Column("value"): None})).Execute()
+
+        if result is not None:
+            for _ in result.AsIterable():
+                pass
+
+    elapsed: float = perf_counter() - start
+
+    connection.Close()
+
+    return elapsed
+
+def runChild(guards: str, itemCount: int, rowCount: int) -> str:
+    env: dict[str, str] = dict(os.environ, WINCOPIES_GUARDS = guards)
+
+    return subprocess.run([sys.executable, "-m", __spec__.name, "--child", str(itemCount), str(rowCount)], env = env, capture_output = True, text = True, check = True).stdout.strip()
+
+def main() -> None:
+    itemCount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rowCount: int = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    print(f"{'guards':<8}{'list insert (' + str(itemCount) + ')':>28}{'row iteration (100x' + str(rowCount) + ')':>32}")
+
+    for label, guards in (("on", "1"), ("off", "0")):
+        insert, rows = runChild(guards, itemCount, rowCount).split()
+
+        print(f"{label:<8}{float(insert):>26.4f} s{float(rows):>30.4f} s")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        print(measureListInsert(int(sys.argv[2])), measureRowIteration(int(sys.argv[3])))
+
+    else:
+        main()
@@ -0,0 +1,86 @@
+"""
+Measures a plain for loop over the main enumerable collections, compared to the same loop over a list, then the MoveNext loop of some enumerators, compared to reading them per batch.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Iteration [itemCount]
+"""
+
+import sys
+
+from time import perf_counter
+
+def measure(iterable: object) -> float:
+    start: float = perf_counter()
+
+    for _ in iterable: # type: ignore
+        pass
+
+    return perf_counter() - start
+
+def measureMoveNext(enumerator: object) -> float:
+    start: float = perf_counter()
+
+    while enumerator.MoveNext(): # type: ignore
+        enumerator.GetCurrent() # type: ignore
+
+    return perf_counter() - start
+
+def measureBatches(enumerator: object, size: int) -> float:
+    from WinCopies.Collections.Enumeration import EnumerateBatches
+
+    start: float = perf_counter()
+
+    for batch in EnumerateBatches(enumerator, size): # type: ignore
+        for _ in batch:
+            pass
+
+    return perf_counter() - start
+
+def getIterator(count: int) -> object:
+    from WinCopies.Collections.Enumeration import Iterator
+
+    return Iterator[int](iter(range(count)))
+
+def getDoublyList(count: int) -> object:
+    from WinCopies.Collections.Linked.Doubly import List
+
+    l: List[int] = List[int]()
+    l.AddLastItems(range(count))
+
+    return l
+
+def getDictionary(count: int) -> object:
+    from WinCopies.Collections.Abstraction.Collection import Dictionary
+
+    return Dictionary[int, int]({i: i for i in range(count)})
+
+def getSelectionResult(count: int) -> object:
+    from WinCopies.Collections import MakeSequence
+    from WinCopies.Collections.Abstraction.Collection import Array
+    from WinCopies.Data import Column
+    from WinCopies.Data.Field import FieldAttributes, IntegerMode
+    from WinCopies.Data.Set.Extensions import TableParameterSet, ColumnParameterSet
+    from WinCopies.Data.SQLite import Connection
+    from WinCopies.Typing.Object import String
+
+    connection: Connection = Connection(":memory:")
+    connection.Open()
+    connection.CreateTable("items", MakeSequence(connection.GetFieldFactory().CreateInteger("value", FieldAttributes.Null, IntegerMode.Long)))
+    connection.GetQueryFactory().GetMultiInsertionQuery("items", Array[String]([String("value")]), ((i,) for i in range(count))).Execute()
+
+    return connection.GetQueryFactory().GetSelectionQuery(TableParameterSet.Create(MakeSequence(String("items"))), ColumnParameterSet({Column("value"): None})).Execute()
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print(f"{'collection (' + str(count) + ' items)':<36}{'time':>12}")
+
+    for label, iterable in (("list", list(range(count))), ("Linked.Doubly.List", getDoublyList(count)), ("Abstraction.Collection.Dictionary", getDictionary(count)), ("SQLite selection result", getSelectionResult(count))):
+        print(f"{label:<36}{measure(iterable):>10.4f} s")
+    
+    print(f"\n{'enumerator (' + str(count) + ' items)':<36}{'MoveNext':>12}{'batches of 1000':>18}")
+
+    for label, provider in (("Enumeration.Iterator", getIterator), ("SQLite selection result", lambda count: getSelectionResult(count).GetEnumerator())): # type: ignore
+        print(f"{label:<36}{measureMoveNext(provider(count)):>10.4f} s{measureBatches(provider(count), 1000):>16.4f} s")
+
+if __name__ == "__main__":
+    main()
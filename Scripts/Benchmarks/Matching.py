@@ -0,0 +1,54 @@
+"""
+Compares the search of many patterns in the same items with ContainsSequenceMultipleTimes, once per pattern, and with a PatternMatcher, in a single pass.
+
+The items are random words, as in a token stream; the patterns are runs of words, half of them taken from the items.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Matching [itemCount] [patternCount]
+"""
+
+import random
+import sys
+
+from time import perf_counter
+
+def main() -> None:
+    from WinCopies.Collections import ContainsSequenceMultipleTimes
+    from WinCopies.Collections.Matching import PatternMatcher
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    patternCount: int = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    random.seed(0)
+
+    words: list[str] = [f"word{i}" for i in range(5000)]
+    items: list[str] = random.choices(words, k = count)
+    patterns: list[list[str]] = []
+
+    for i in range(patternCount):
+        length: int = random.randint(2, 6)
+        start: int = random.randrange(count - length)
+
+        patterns.append(items[start:start + length] if i % 2 == 0 else random.choices(words, k = length))
+
+    print(f"{str(count) + ' items, ' + str(patternCount) + ' patterns':<40}{'found':>10}{'time':>12}")
+
+    start: float = perf_counter()
+    found: int = sum(1 for pattern in patterns if ContainsSequenceMultipleTimes(items, pattern)[0] is not None)
+
+    print(f"{'ContainsSequenceMultipleTimes':<40}{found:>10}{perf_counter() - start:>10.4f} s")
+
+    start = perf_counter()
+    matcher: PatternMatcher[str] = PatternMatcher[str](patterns)
+    compilation: float = perf_counter() - start
+    found = sum(1 for result in matcher.ContainsMultipleTimes(items) if result is not None)
+
+    print(f"{'PatternMatcher.ContainsMultipleTimes':<40}{found:>10}{perf_counter() - start:>10.4f} s")
+    print(f"{'of which compilation':<40}{'':>10}{compilation:>10.4f} s")
+
+    start = perf_counter()
+    found = sum(1 for count in matcher.GetCounts(iter(items)) if count > 0)
+
+    print(f"{'PatternMatcher.GetCounts, streamed':<40}{found:>10}{perf_counter() - start:>10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares Iteration.Select with Parallel.Select, using a thread pool for a blocking converter and a process pool for a CPU-bound one.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Parallel [itemCount]
+"""
+
+import os
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from time import perf_counter
+
+def wait(value: int) -> int:
+    time.sleep(0.0001)
+
+    return value
+
+def compute(value: int) -> int:
+    result: int = value
+
+    for i in range(2000):
+        result = (result * 31 + i) % 1000003
+
+    return result
+
+def measure(func) -> float: # type: ignore
+    start: float = perf_counter()
+
+    for _ in func():
+        pass
+
+    return perf_counter() - start
+
+def main() -> None:
+    from WinCopies.Collections import Iteration, Parallel
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    workers: int = os.cpu_count() or 1
+
+    print(f"{'converter (' + str(count) + ' items)':<32}{'sequential':>12}{'parallel':>12}")
+
+    with ThreadPoolExecutor(32) as executor:
+        print(f"{'blocking, 32 threads':<32}{measure(lambda: Iteration.Select(range(count), wait)):>10.4f} s{measure(lambda: Parallel.Select(range(count), wait, executor, 64)):>10.4f} s")
+
+    with ProcessPoolExecutor(workers) as executor:
+        print(f"{'CPU-bound, ' + str(workers) + ' processes':<32}{measure(lambda: Iteration.Select(range(count), compute)):>10.4f} s{measure(lambda: Parallel.Select(range(count), compute, executor)):>10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares the sequential recursive enumeration of a tree with Parallel.EnumerateRecursively when listing the children of a node waits, as a directory scan on a network share does.
+
+Each node has branching children down to the given depth, and each listing sleeps for latency milliseconds.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.ParallelRecursive [branching] [depth] [latency]
+"""
+
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+def main() -> None:
+    from WinCopies.Collections import EnumerationOrder, Generator, Parallel
+
+    branching: int = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    depth: int = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    latency: float = (float(sys.argv[3]) if len(sys.argv) > 3 else 1) / 1000
+
+    def getChildren(path: tuple[int, ...]) -> list[tuple[int, ...]]:
+        time.sleep(latency)
+
+        return [path + (i,) for i in range(branching)] if len(path) < depth else []
+
+    def enumerate(path: tuple[int, ...]) -> Generator[tuple[int, ...]]:
+        # The sequential pre-order enumeration, with the same listings.
+        stack: list[list[tuple[int, ...]]] = [[path]]
+
+        while len(stack) > 0:
+            if len(stack[-1]) == 0:
+                stack.pop()
+
+                continue
+
+            item: tuple[int, ...] = stack[-1].pop()
+
+            yield item
+
+            stack.append(getChildren(item)[::-1])
+
+    def measure(func) -> tuple[int, float]: # type: ignore
+        count: int = 0
+        start: float = perf_counter()
+
+        for _ in func():
+            count += 1
+
+        return (count, perf_counter() - start)
+
+    print(f"{'enumeration (' + str(branching) + '^' + str(depth) + ', ' + str(latency * 1000) + ' ms)':<40}{'nodes':>10}{'time':>12}")
+
+    count, elapsed = measure(lambda: enumerate(()))
+
+    print(f"{'sequential':<40}{count:>10}{elapsed:>10.4f} s")
+
+    for workers in (4, 16, 64):
+        with ThreadPoolExecutor(workers) as executor:
+            for enumerationOrder in (EnumerationOrder.Null, EnumerationOrder.FIFO):
+                count, elapsed = measure(lambda: Parallel.EnumerateRecursively([()], getChildren, executor, enumerationOrder))
+
+                print(f"{str(workers) + ' workers, ' + enumerationOrder.name:<40}{count:>10}{elapsed:>10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compares a five-operator pipeline of nested Iteration generators with the same pipeline as a fused Query.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Query [itemCount]
+"""
+
+import sys
+
+from time import perf_counter
+
+def measure(iterable: object) -> float:
+    start: float = perf_counter()
+
+    for _ in iterable: # type: ignore
+        pass
+
+    return perf_counter() - start
+
+def isOdd(value: int) -> bool:
+    return value % 2 == 1
+
+def increment(value: int) -> int:
+    return value + 1
+
+def isNotMultipleOf3(value: int) -> bool:
+    return value % 3 != 0
+
+def double(value: int) -> int:
+    return value * 2
+
+def main() -> None:
+    from WinCopies.Collections import Iteration
+    from WinCopies.Collections.Query import Query
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    isLast = lambda value: value >= 4 * count
+
+    print(f"{'pipeline (' + str(count) + ' items)':<32}{'time':>12}")
+    print(f"{'nested Iteration functions':<32}{measure(Iteration.DoIncludeUntil(Iteration.Select(Iteration.Include(Iteration.Select(Iteration.Include(range(count), isOdd), increment), isNotMultipleOf3), double), isLast)):>10.4f} s")
+    print(f"{'Query':<32}{measure(Query[int](range(count)).Include(isOdd).Select(increment).Include(isNotMultipleOf3).Select(double).DoIncludeUntil(isLast)):>10.4f} s")
+
+if __name__ == "__main__":
+    main()
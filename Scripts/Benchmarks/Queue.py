@@ -0,0 +1,39 @@
+"""
+Compares the pop throughput of linked queues when each item is returned in an INullable and when it is returned directly.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Queue [itemCount]
+"""
+
+import sys
+
+from collections.abc import Callable
+from time import perf_counter
+
+def measure(count: int, push: Callable[[int], None], pop: Callable[[], bool]) -> float:
+    for i in range(count):
+        push(i)
+
+    start: float = perf_counter()
+
+    while pop():
+        pass
+
+    return perf_counter() - start
+
+def main() -> None:
+    from WinCopies.Collections.Linked import Doubly, Singly
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    missing: object = object()
+
+    singly: Singly.Queue[int] = Singly.Queue[int]()
+    doubly: Doubly.List[int] = Doubly.List[int]()
+
+    print(f"{'pop of ' + str(count) + ' items':<40}{'time':>12}")
+    print(f"{'Singly.Queue.TryPop':<40}{measure(count, singly.Push, lambda: singly.TryPop().HasValue()):>10.4f} s")
+    print(f"{'Singly.Queue.TryPopValue':<40}{measure(count, singly.Push, lambda: singly.TryPopValue(missing) is not missing):>10.4f} s")
+    print(f"{'Doubly.List.TryRemoveFirst':<40}{measure(count, doubly.AddLast, lambda: doubly.TryRemoveFirst().HasValue()):>10.4f} s")
+    print(f"{'Doubly.List.TryRemoveFirstValue':<40}{measure(count, doubly.AddLast, lambda: doubly.TryRemoveFirstValue(missing) is not missing):>10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measures the recursive enumeration of a deep tree, in FIFO and LIFO order, then limited to its first three levels.
+
+The tree is made of branches of depth nodes each, hanging from a single root.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Recursive [nodeCount] [depth]
+"""
+
+import sys
+
+from time import perf_counter
+
+def main() -> None:
+    from WinCopies.Collections import EnumerationOrder
+    from WinCopies.Collections.Enumeration import IEnumerable, IEnumerator, Iterator
+    from WinCopies.Collections.Enumeration.Recursive import RecursivelyEnumerable
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    depth: int = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    # children[i] is the list of the children of the node i; the node 0 is the root.
+    children: list[list[int]] = [[] for _ in range(count)]
+
+    for i in range(1, count):
+        children[0 if i % depth == 1 or depth == 1 else i - 1].append(i)
+
+    class Tree(RecursivelyEnumerable[int]):
+        def __init__(self, items: list[int]):
+            super().__init__()
+
+            self.__items: list[int] = items
+
+        def TryGetEnumerator(self) -> IEnumerator[int]|None:
+            return Iterator[int](iter(self.__items))
+
+        def _AsRecursivelyEnumerable(self, container: int) -> IEnumerable[int]:
+            return Tree(children[container])
+
+    def measure(enumerationOrder: EnumerationOrder, maxDepth: int|None = None) -> tuple[int, float]:
+        enumerator: IEnumerator[int] = Tree([0]).GetRecursiveEnumerator(enumerationOrder, maxDepth = maxDepth)
+        enumerated: int = 0
+        start: float = perf_counter()
+
+        while enumerator.MoveNext():
+            enumerated += 1
+
+        return (enumerated, perf_counter() - start)
+
+    print(f"{'order (' + str(count) + ' nodes, ' + str(depth) + ' deep)':<40}{'nodes':>10}{'time':>12}")
+
+    for enumerationOrder in (EnumerationOrder.FIFO, EnumerationOrder.LIFO):
+        enumerated, time = measure(enumerationOrder)
+
+        print(f"{enumerationOrder.name:<40}{enumerated:>10}{time:>10.4f} s")
+
+    for enumerationOrder in (EnumerationOrder.FIFO, EnumerationOrder.LIFO):
+        enumerated, time = measure(enumerationOrder, 2)
+
+        print(f"{enumerationOrder.name + ', maxDepth = 2':<40}{enumerated:>10}{time:>10.4f} s")
+
+    start: float = perf_counter()
+    enumerated: int = sum(len(level) for level in Tree([0]).GetLevelEnumerable(2))
+
+    print(f"{'levels, maxDepth = 2':<40}{enumerated:>10}{perf_counter() - start:>10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compares repeated ContainsOnlyOne, FindFirstIndex and Contains queries on a large Tuple before and after a SequenceIndex is attached to it.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.SequenceIndex [itemCount] [queryCount]
+"""
+
+import random
+import sys
+
+from collections.abc import Callable
+from time import perf_counter
+
+def measure(values: list[int], query: Callable[[int], object]) -> float:
+    start: float = perf_counter()
+
+    for value in values:
+        query(value)
+
+    return perf_counter() - start
+
+def main() -> None:
+    from WinCopies.Collections import ContainsOnlyOne
+    from WinCopies.Collections.Abstraction.Collection import Tuple
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    queryCount: int = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    random.seed(0)
+
+    items: Tuple[int] = Tuple[int](random.choices(range(count), k = count))
+    values: list[int] = random.choices(range(count), k = queryCount)
+
+    queries: tuple[tuple[str, Callable[[int], object]], ...] = (
+        ("ContainsOnlyOne", lambda value: ContainsOnlyOne(items, value)),
+        ("FindFirstIndex", items.FindFirstIndex),
+        ("Contains", items.Contains))
+
+    print(f"{str(count) + ' items, ' + str(queryCount) + ' queries':<40}{'time':>12}")
+
+    for name, query in queries:
+        print(f"{name:<40}{measure(values, query):>10.4f} s")
+
+    start: float = perf_counter()
+
+    items.AttachIndex()
+
+    print(f"{'AttachIndex':<40}{perf_counter() - start:>10.4f} s")
+
+    for name, query in queries:
+        print(f"{name + ', indexed':<40}{measure(values, query):>10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares GetIndexOfSequence with the item by item matcher that it replaces, on a list of hashable items, a list of unhashable items, a string and bytes, whose only occurrence of the searched sequence is at their end.
+
+The previous matcher returned the index of the last item of the occurrence instead of the first one.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.SequenceSearch [itemCount] [valueCount]
+"""
+
+import random
+import sys
+
+from collections.abc import Callable, Sequence
+from time import perf_counter
+
+def naive(l: Sequence[object], values: Sequence[object]) -> int|None:
+    j: int = 0
+
+    for i in range(len(l)):
+        if l[i] == values[j]:
+            j += 1
+
+            if j == len(values):
+                return i
+        
+        else:
+            j = 0
+    
+    return None
+
+def measure(search: Callable[[], int|None]) -> tuple[int|None, float]:
+    start: float = perf_counter()
+    index: int|None = search()
+
+    return (index, perf_counter() - start)
+
+def main() -> None:
+    from WinCopies.Collections import IndexOfSequence
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    valueCount: int = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    random.seed(0)
+
+    # The searched sequence is the only one that contains the value 1000.
+    integers: list[int] = random.choices(range(1000), k = count - valueCount)
+    values: list[int] = [*random.choices(range(1000), k = valueCount - 1), 1000]
+
+    integers.extend(values)
+
+    pool: list[list[int]] = [[i] for i in range(1001)]
+    text: str = ''.join(chr(ord('a') + i % 26) for i in integers[:-1]) + '!'
+
+    cases: tuple[tuple[str, Sequence[object], Sequence[object]], ...] = (
+        ("hashable items", integers, values),
+        ("unhashable items", [pool[i] for i in integers], [pool[i] for i in values]),
+        ("str", text, text[-valueCount:]),
+        ("bytes", text.encode(), text[-valueCount:].encode()))
+
+    print(f"{str(count) + ' items, ' + str(valueCount) + ' values':<40}{'index':>10}{'time':>12}")
+
+    for name, l, _values in cases:
+        for implementation, search in (("previous", naive), ("GetIndexOfSequence", IndexOfSequence)):
+            index, time = measure(lambda: search(l, _values))
+
+            print(f"{name + ', ' + implementation:<40}{str(index):>10}{time:>10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compares the scans of a numeric array.array by a Python predicate and in native code: GetIndexOf without and with its native scan, and ForEachItemUntil with a lambda and with a Comparison. When NumPy is installed, the same scans are measured on an ndarray.
+
+The only matching item is the last one, so that all the items are compared.
+
+Run from the repository root, so that WinCopies can be imported: python -m Scripts.Benchmarks.Vectorization [itemCount]
+"""
+
+import sys
+
+from array import array
+from collections.abc import Callable
+from time import perf_counter
+
+def measure(scan: Callable[[], object]) -> tuple[object, float]:
+    start: float = perf_counter()
+    result: object = scan()
+
+    return (result, perf_counter() - start)
+
+def main() -> None:
+    from WinCopies.Collections import GetIndexOf
+    from WinCopies.Collections.Loop import ForEachItemUntil
+    from WinCopies.Collections.Vectorization import Comparison, ComparisonOperator
+
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+    items: array = array('d', range(count))
+    value: float = float(count - 1)
+    comparison: Comparison[float] = Comparison[float](ComparisonOperator.GreaterOrEqual, value)
+
+    scans: list[tuple[str, Callable[[], object]]] = [
+        ("GetIndexOf, Python predicate", lambda: GetIndexOf(items, value, predicate = lambda item, value: item == value).GetKey()), # type: ignore
+        ("GetIndexOf, array", lambda: GetIndexOf(items, value).GetKey()), # type: ignore
+        ("ForEachItemUntil, lambda", lambda: ForEachItemUntil(items, lambda item: item >= value)),
+        ("ForEachItemUntil, Comparison, array", lambda: ForEachItemUntil(items, comparison)),
+        ("ForEachItemUntil, Comparison, memoryview", lambda: ForEachItemUntil(memoryview(items), comparison))]
+
+    try:
+        import numpy
+
+        ndarray = numpy.arange(count, dtype = numpy.float64)
+
+        scans.append(("GetIndexOf, ndarray", lambda: GetIndexOf(ndarray, value).GetKey())) # type: ignore
+        scans.append(("ForEachItemUntil, Comparison, ndarray", lambda: ForEachItemUntil(ndarray, comparison)))
+
+    except ImportError:
+        print("NumPy is not installed: the ndarray scans are skipped.")
+
+    print(f"{str(count) + ' items':<40}{'result':>10}{'time':>12}")
+
+    for name, scan in scans:
+        result, time = measure(scan)
+
+        print(f"{name:<40}{str(result):>10}{time:>10.4f} s")
+
+if __name__ == "__main__":
+    main()
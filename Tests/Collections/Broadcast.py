@@ -0,0 +1,172 @@
+"""
+Tests unitaires pour la diffusion d'une énumération (WinCopies.Collections.Enumeration.Broadcast)
+"""
+
+import threading
+import time
+import unittest
+
+from WinCopies.Collections.Enumeration import IEnumerator, GetNativeIterator
+from WinCopies.Collections.Enumeration.Broadcast import Broadcaster
+from WinCopies.Typing import InvalidOperationError
+
+def enumerate(enumerator: IEnumerator[int]) -> list[int]:
+    return list(enumerator.AsIterator())
+
+class TestBroadcast(unittest.TestCase):
+    def test_unbounded(self):
+        """Without capacity, the enumerators can be used one after the other"""
+        broadcaster: Broadcaster[int] = Broadcaster[int](range(1000), 3, None)
+
+        self.assertEqual(enumerate(broadcaster.GetEnumerator(0)), list(range(1000)))
+        self.assertEqual(broadcaster.GetBufferedCount(), 1000)
+        self.assertEqual(list(GetNativeIterator(broadcaster.GetEnumerator(1))), list(range(1000)))
+        self.assertEqual(enumerate(broadcaster.GetEnumerator(2)), list(range(1000)))
+        self.assertEqual(broadcaster.GetBufferedCount(), 0)
+
+    def test_source_read_once(self):
+        read: list[int] = []
+
+        def getItems():
+            for i in range(100):
+                read.append(i)
+
+                yield i
+
+        broadcaster: Broadcaster[int] = Broadcaster[int](getItems(), 2, None)
+
+        for enumerator in broadcaster.GetEnumerators():
+            self.assertEqual(enumerate(enumerator), list(range(100)))
+
+        self.assertEqual(read, list(range(100)))
+
+    def test_threads(self):
+        """Each enumerator returns all the items, and no more than capacity items are buffered"""
+        buffered: list[int] = []
+
+        def getItems():
+            for i in range(20000):
+                # Source is read without the lock of the broadcaster.
+                buffered.append(broadcaster.GetBufferedCount())
+
+                yield i
+
+        broadcaster: Broadcaster[int] = Broadcaster[int](getItems(), 3, 50)
+        results: list[list[int]] = [[] for _ in range(3)]
+
+        def read(i: int) -> None:
+            enumerator: IEnumerator[int] = broadcaster.GetEnumerator(i)
+
+            while enumerator.MoveNext():
+                results[i].append(enumerator.GetCurrent()) # type: ignore
+
+                # The last enumerator is the slowest one.
+                if i == 2 and len(results[i]) % 1000 == 0:
+                    time.sleep(0.001)
+
+        threads: list[threading.Thread] = [threading.Thread(target = read, args = (i,)) for i in range(3)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        for result in results:
+            self.assertEqual(result, list(range(20000)))
+
+        self.assertLessEqual(max(buffered), 50)
+
+    def test_read_without_lock(self):
+        """The enumerators read the buffered items while another one waits for source"""
+        reached: threading.Event = threading.Event()
+        resume: threading.Event = threading.Event()
+
+        def getItems():
+            yield from range(10)
+
+            reached.set()
+            resume.wait()
+
+            yield 10
+
+        broadcaster: Broadcaster[int] = Broadcaster[int](getItems(), 2, None)
+        results: list[list[int]] = []
+        items: list[int] = []
+
+        def readBuffered() -> None:
+            enumerator: IEnumerator[int] = broadcaster.GetEnumerator(1)
+
+            while len(items) < 10 and enumerator.MoveNext():
+                items.append(enumerator.GetCurrent()) # type: ignore
+
+        reader: threading.Thread = threading.Thread(target = lambda: results.append(enumerate(broadcaster.GetEnumerator(0))))
+        reader.start()
+
+        try:
+            self.assertTrue(reached.wait(5))
+
+            thread: threading.Thread = threading.Thread(target = readBuffered)
+            thread.start()
+            thread.join(5)
+
+            self.assertEqual(items, list(range(10)))
+            # Both enumerators have read the buffered items, which are no longer kept.
+            self.assertEqual(broadcaster.GetBufferedCount(), 0)
+
+        finally:
+            resume.set()
+            reader.join()
+
+        self.assertEqual(results, [list(range(11))])
+        self.assertEqual(enumerate(broadcaster.GetEnumerator(1)), [10])
+
+    def test_stop(self):
+        """A stopped enumerator no longer holds the buffer"""
+        broadcaster: Broadcaster[int] = Broadcaster[int](range(1000), 2, 10)
+        stopped: IEnumerator[int] = broadcaster.GetEnumerator(1)
+
+        stopped.MoveNext()
+        stopped.Stop()
+
+        self.assertEqual(enumerate(broadcaster.GetEnumerator(0)), list(range(1000)))
+        self.assertFalse(stopped.MoveNext())
+
+    def test_exception(self):
+        """The error of source is raised by every enumerator, after the items read before it"""
+        def getItems():
+            yield 1
+            yield 2
+
+            raise KeyError()
+
+        broadcaster: Broadcaster[int] = Broadcaster[int](getItems(), 2, None)
+
+        for enumerator in broadcaster.GetEnumerators():
+            items: list[int] = []
+
+            with self.assertRaises(KeyError):
+                while enumerator.MoveNext():
+                    items.append(enumerator.GetCurrent()) # type: ignore
+
+            self.assertEqual(items, [1, 2])
+
+    def test_dispose(self):
+        broadcaster: Broadcaster[int] = Broadcaster[int](range(100), 2)
+
+        broadcaster.Dispose()
+
+        self.assertTrue(broadcaster.IsDisposed())
+
+        with self.assertRaises(InvalidOperationError):
+            broadcaster.GetEnumerator(0).MoveNext()
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Broadcaster[int](range(10), 0)
+
+        with self.assertRaises(ValueError):
+            Broadcaster[int](range(10), 2, 0)
+
+if __name__ == '__main__':
+    unittest.main()
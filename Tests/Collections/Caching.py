@@ -0,0 +1,214 @@
+"""
+Tests unitaires pour l'énumérable mis en cache (WinCopies.Collections.Enumeration.Caching)
+"""
+
+import pickle
+import threading
+import unittest
+
+from WinCopies.Collections.Enumeration import IEnumerator
+from WinCopies.Collections.Enumeration.Caching import CachingEnumerable
+from WinCopies.Typing import InvalidOperationError
+
+class Source:
+    def __init__(self, count: int):
+        self.Count: int = count
+        self.Enumerations: int = 0
+
+    def __iter__(self):
+        self.Enumerations += 1
+
+        return iter(range(self.Count))
+
+class PickledOnError:
+    def __init__(self):
+        self.Pickles: int = 0
+
+    def __reduce__(self):
+        self.Pickles += 1
+
+        # Only the first attempt fails.
+        if self.Pickles == 1:
+            raise pickle.PicklingError()
+
+        return (int, (0,))
+
+class TestCaching(unittest.TestCase):
+    def test_replay(self):
+        """The source is enumerated only once, whatever the threshold"""
+        for threshold in (None, 0, 10, 999, 1000):
+            with self.subTest(threshold = threshold):
+                source: Source = Source(1000)
+
+                with CachingEnumerable[int](source, threshold) as items:
+                    self.assertEqual(list(items), list(range(1000)))
+                    self.assertEqual(list(items), list(range(1000)))
+                    self.assertEqual(source.Enumerations, 1)
+                    self.assertTrue(items.IsCompleted())
+                    self.assertEqual(items.GetRecordedCount(), 1000)
+                    self.assertEqual(items.IsSpilled(), threshold is not None and 1000 - threshold >= 256)
+
+    def test_lazy(self):
+        """The source is only read as far as the enumerators go"""
+        source: Source = Source(1000)
+        items: CachingEnumerable[int] = CachingEnumerable[int](source)
+
+        self.assertEqual(source.Enumerations, 0)
+        self.assertFalse(items.IsCompleted())
+
+        enumerator: IEnumerator[int] = items.GetEnumerator()
+
+        for _ in range(3):
+            enumerator.MoveNext()
+
+        self.assertEqual(items.GetRecordedCount(), 3)
+
+    def test_reset(self):
+        """A reset enumerator replays the recorded items"""
+        with CachingEnumerable[int](iter(range(100)), 10) as items:
+            enumerator: IEnumerator[int] = items.GetEnumerator()
+
+            for _ in range(50):
+                enumerator.MoveNext()
+
+            self.assertEqual(enumerator.GetCurrent(), 49)
+            self.assertTrue(enumerator.TryReset())
+            self.assertEqual(list(enumerator.AsIterator()), list(range(100)))
+
+    def test_interleaved(self):
+        """Enumerators at different positions of the file do not interfere"""
+        with CachingEnumerable[int](iter(range(1000)), 5) as items:
+            first: IEnumerator[int] = items.GetEnumerator()
+            second: IEnumerator[int] = items.GetEnumerator()
+            read: tuple[list[int], list[int]] = ([], [])
+
+            for i in range(2000):
+                enumerator: IEnumerator[int] = first if i % 3 == 0 or i >= 1500 else second
+
+                if enumerator.MoveNext():
+                    read[0 if enumerator is first else 1].append(enumerator.GetCurrent()) # type: ignore
+
+            self.assertEqual(read[0], list(range(1000)))
+            self.assertEqual(read[1], list(range(1000)))
+
+    def test_concurrent(self):
+        with CachingEnumerable[int](iter(range(20000)), 100) as items:
+            results: list[list[int]] = [[] for _ in range(8)]
+
+            def read(i: int) -> None:
+                results[i] = list(items)
+
+            threads: list[threading.Thread] = [threading.Thread(target = read, args = (i,)) for i in range(8)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            for result in results:
+                self.assertEqual(result, list(range(20000)))
+
+    def test_read_without_lock(self):
+        """The enumerators replay the recorded items while another one waits for source"""
+        reached: threading.Event = threading.Event()
+        resume: threading.Event = threading.Event()
+
+        def getItems():
+            yield from range(10)
+
+            reached.set()
+            resume.wait()
+
+            yield 10
+
+        items: CachingEnumerable[int] = CachingEnumerable[int](getItems())
+        results: list[list[int]] = []
+        replayed: list[int] = []
+
+        def read() -> None:
+            enumerator: IEnumerator[int] = items.GetEnumerator()
+            result: list[int] = []
+
+            # The items are read one by one, so that the first ten are recorded before source blocks.
+            while enumerator.MoveNext():
+                result.append(enumerator.GetCurrent()) # type: ignore
+
+            results.append(result)
+
+        def replay() -> None:
+            enumerator: IEnumerator[int] = items.GetEnumerator()
+
+            while len(replayed) < 10 and enumerator.MoveNext():
+                replayed.append(enumerator.GetCurrent()) # type: ignore
+
+        reader: threading.Thread = threading.Thread(target = read)
+        reader.start()
+
+        try:
+            self.assertTrue(reached.wait(5))
+
+            thread: threading.Thread = threading.Thread(target = replay)
+            thread.start()
+            thread.join(5)
+
+            self.assertEqual(replayed, list(range(10)))
+
+        finally:
+            resume.set()
+            reader.join()
+
+        self.assertEqual(results, [list(range(11))])
+        self.assertEqual(list(items), list(range(11)))
+
+    def test_write_error(self):
+        """The items that could not be written to the file are written with the next ones"""
+        item: PickledOnError = PickledOnError()
+
+        with CachingEnumerable[object](iter([item, *range(1, 1000)]), 0) as items:
+            with self.assertRaises(pickle.PicklingError):
+                list(items)
+
+            self.assertEqual(list(items)[1:], list(range(1, 1000)))
+            self.assertEqual(item.Pickles, 2)
+            self.assertEqual(list(items), [0, *range(1, 1000)])
+
+    def test_source_error(self):
+        """The error of source is raised by every enumeration, after the items read before it"""
+        def getItems():
+            yield 1
+            yield 2
+
+            raise KeyError()
+
+        with CachingEnumerable[int](getItems()) as items:
+            for _ in range(2):
+                read: list[int] = []
+
+                with self.assertRaises(KeyError):
+                    for item in items:
+                        read.append(item)
+
+                self.assertEqual(read, [1, 2])
+
+    def test_dispose(self):
+        items: CachingEnumerable[int] = CachingEnumerable[int](iter(range(100)), 10)
+        enumerator: IEnumerator[int] = items.GetEnumerator()
+
+        enumerator.MoveNext()
+        items.Dispose()
+
+        self.assertTrue(items.IsDisposed())
+
+        with self.assertRaises(InvalidOperationError):
+            enumerator.MoveNext()
+
+        with self.assertRaises(InvalidOperationError):
+            items.GetEnumerator()
+
+    def test_invalid_threshold(self):
+        with self.assertRaises(ValueError):
+            CachingEnumerable[int](range(10), -1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,387 @@
+"""
+Tests unitaires pour les énumérateurs (WinCopies.Collections.Enumeration)
+"""
+
+import asyncio
+import gc
+import sys
+import threading
+import unittest
+import weakref
+
+from concurrent.futures import ThreadPoolExecutor
+
+from WinCopies.Collections.Enumeration import Iterator, EnumeratorProvider, ConverterEnumerator, GetNativeIterator, EnumerateBatches
+from WinCopies.Collections.Enumeration.Async import AsyncIterator, AsyncIteratorProvider, ThreadedAsyncEnumerator, ThreadedAsyncEnumerable
+from WinCopies.Collections.Enumeration.Extensions import ConcatenationBuilder
+from WinCopies.Collections.Iteration import Batch, SelectBatch
+from WinCopies.Collections.Linked.Enumeration import NodeEnumerator
+from WinCopies.Collections.Linked.Node import ILinkedNode
+from WinCopies.Collections.Linked.Doubly import List
+from WinCopies.Typing.Reflection import ClearTypeCache
+
+class EqualToNone:
+    def __init__(self, value: int):
+        self.value: int = value
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or (isinstance(other, EqualToNone) and other.value == self.value)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+class HookedIterator(Iterator[int]):
+    def __init__(self, items: list[int]):
+        super().__init__(iter(items))
+
+        self.events: list[str] = []
+
+    def _OnStarting(self) -> bool:
+        self.events.append("starting")
+
+        return super()._OnStarting()
+
+    def _OnCompleted(self) -> None:
+        self.events.append("completed")
+
+        super()._OnCompleted()
+
+class TestNativeIterator(unittest.TestCase):
+    def test_native_iterator_used(self):
+        self.assertNotIsInstance(GetNativeIterator(Iterator[int](iter([1, 2]))), Iterator)
+
+    def test_hooks_disable_native_iterator(self):
+        enumerator: HookedIterator = HookedIterator([1, 2])
+
+        self.assertIs(GetNativeIterator(enumerator), enumerator)
+
+    def test_hooks_called(self):
+        enumerator: HookedIterator = HookedIterator([1, 2])
+
+        self.assertEqual(list(EnumeratorProvider[int](lambda: enumerator)), [1, 2])
+        self.assertEqual(enumerator.events, ["starting", "completed"])
+
+    def test_started_enumerator(self):
+        enumerator: Iterator[int] = Iterator[int](iter([1, 2, 3]))
+        enumerator.MoveNext()
+
+        self.assertEqual(list(GetNativeIterator(enumerator)), [2, 3])
+
+    def test_stops_at_none(self):
+        self.assertEqual(list(GetNativeIterator(Iterator[int|None](iter([1, None, 3])))), [1])
+
+    def test_subclasses(self):
+        plain: type = type("Plain", (Iterator,), {})
+        hooked: type = type("Hooked", (HookedIterator,), {})
+
+        # Each class is checked twice, the second time from the cached answer.
+        for _ in range(2):
+            self.assertNotIsInstance(GetNativeIterator(plain(iter([1]))), Iterator)
+            self.assertIs(type(GetNativeIterator(hooked([1]))), hooked)
+
+    def test_classes_are_not_kept_alive(self):
+        cls: type = type("Dynamic", (Iterator,), {})
+        reference: weakref.ref[type] = weakref.ref(cls)
+
+        list(GetNativeIterator(cls(iter([1, 2]))))
+        cls(iter([1, 2])).MoveNextBatch([], 2)
+
+        del cls
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_method_assigned_after_check(self):
+        cls: type = type("Assigned", (Iterator,), {})
+
+        self.assertNotIsInstance(GetNativeIterator(cls(iter([1]))), Iterator)
+
+        cls._OnStarting = lambda self: True
+
+        try:
+            # The members of a class are only inspected once, until the type cache is cleared.
+            ClearTypeCache()
+
+            self.assertIs(type(GetNativeIterator(cls(iter([1])))), cls)
+        finally:
+            ClearTypeCache()
+
+    def test_list(self):
+        l: List[int] = List[int]()
+        l.AddLastItems([1, 2, 3])
+
+        self.assertEqual(list(l), [1, 2, 3])
+        self.assertEqual(list(l), [1, 2, 3])
+
+class TestStateMachine(unittest.TestCase):
+    def test_no_instance_dictionary(self):
+        self.assertFalse(hasattr(Iterator[int](iter([])), "__dict__"))
+        self.assertFalse(hasattr(ConverterEnumerator[int, str](Iterator[int](iter([])), str), "__dict__"))
+
+    def test_completed(self):
+        enumerator: HookedIterator = HookedIterator([1])
+
+        self.assertTrue(enumerator.MoveNext())
+        self.assertTrue(enumerator.IsStarted())
+        self.assertFalse(enumerator.MoveNext())
+        self.assertFalse(enumerator.MoveNext())
+        self.assertFalse(enumerator.IsStarted())
+        self.assertTrue(enumerator.HasProcessedItems())
+        self.assertEqual(enumerator.events, ["starting", "completed"])
+
+    def test_stop_and_reset(self):
+        l: List[int] = List[int]()
+        l.AddLastItems([1, 2, 3])
+
+        enumerator: NodeEnumerator[int] = NodeEnumerator[int](l.GetFirst()) # type: ignore
+
+        self.assertTrue(enumerator.MoveNext())
+        self.assertTrue(enumerator.MoveNext())
+
+        enumerator.Stop()
+
+        self.assertFalse(enumerator.IsStarted())
+        self.assertTrue(enumerator.TryReset())
+        self.assertFalse(enumerator.HasProcessedItems())
+        self.assertEqual([node.GetValue() for node in enumerator], [1, 2, 3])
+
+    def test_reset_not_supported(self):
+        enumerator: Iterator[int] = Iterator[int](iter([1, 2]))
+
+        self.assertTrue(enumerator.MoveNext())
+        self.assertIsNone(enumerator.TryReset())
+        self.assertFalse(enumerator.MoveNext())
+
+class TestBatches(unittest.TestCase):
+    def test_iterator(self):
+        enumerator: Iterator[int] = Iterator[int](iter(range(5)))
+        items: list[int] = []
+
+        self.assertEqual(enumerator.MoveNextBatch(items, 3), 3)
+        self.assertEqual(enumerator.GetCurrent(), 2)
+        self.assertEqual(enumerator.MoveNextBatch(items, 3), 2)
+        self.assertEqual(items, [0, 1, 2, 3, 4])
+        self.assertFalse(enumerator.MoveNext())
+        self.assertEqual(enumerator.MoveNextBatch(items, 3), 0)
+
+    def test_mixed_with_move_next(self):
+        enumerator: Iterator[int] = Iterator[int](iter(range(5)))
+        items: list[int] = []
+
+        self.assertTrue(enumerator.MoveNext())
+        self.assertEqual(enumerator.MoveNextBatch(items, 2), 2)
+        self.assertTrue(enumerator.MoveNext())
+        self.assertEqual(enumerator.GetCurrent(), 3)
+        self.assertEqual(items, [1, 2])
+
+    def test_hooks_called(self):
+        enumerator: HookedIterator = HookedIterator([1, 2, 3])
+
+        self.assertEqual(list(EnumerateBatches(enumerator, 2)), [[1, 2], [3]])
+        self.assertEqual(enumerator.events, ["starting", "completed"])
+
+    def test_converter(self):
+        enumerator: ConverterEnumerator[int|None, str] = ConverterEnumerator[int|None, str](Iterator[int|None](iter([1, 2, None, 4])), str)
+
+        self.assertEqual(list(EnumerateBatches(enumerator, 5)), [["1", "2"]])
+        self.assertFalse(enumerator.MoveNext())
+
+    def test_converter_items_equal_to_none(self):
+        def getEnumerator() -> ConverterEnumerator[EqualToNone, int]:
+            return ConverterEnumerator[EqualToNone, int](Iterator[EqualToNone](iter(EqualToNone(i) for i in range(1, 5))), lambda item: item.value)
+
+        self.assertEqual(list(getEnumerator()), [1, 2, 3, 4])
+        self.assertEqual(list(EnumerateBatches(getEnumerator(), 5)), [[1, 2, 3, 4]])
+
+    def test_nodes(self):
+        l: List[int] = List[int]()
+        l.AddLastItems(range(5))
+
+        self.assertEqual([[node.GetValue() for node in batch] for batch in EnumerateBatches(NodeEnumerator[int](l.GetFirst()), 2)], [[0, 1], [2, 3], [4]]) # type: ignore
+
+    def test_iteration(self):
+        self.assertEqual(list(Batch(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(SelectBatch(Iterator[int](iter(range(3))), str, 2)), [["0", "1"], ["2"]])
+        self.assertEqual(list(Batch(None, 2)), [])
+
+        with self.assertRaises(ValueError):
+            list(Batch(range(5), 0))
+
+class HookedAsyncIterator(AsyncIterator[int]):
+    def __init__(self, items: list[int]):
+        async def iterate():
+            try:
+                for item in items:
+                    yield item
+            finally:
+                self.events.append("closed")
+
+        super().__init__(iterate())
+
+        self.events: list[str] = []
+
+    def _OnStarting(self) -> bool:
+        self.events.append("starting")
+
+        return super()._OnStarting()
+
+    def _OnCompleted(self) -> None:
+        self.events.append("completed")
+
+        super()._OnCompleted()
+
+class TestAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_async_generator(self):
+        async def iterate():
+            for i in range(3):
+                yield i
+
+        enumerable: AsyncIteratorProvider[int] = AsyncIteratorProvider[int](iterate)
+
+        self.assertEqual([item async for item in enumerable], [0, 1, 2])
+        self.assertEqual([item async for item in enumerable], [0, 1, 2])
+
+    async def test_hooks_called(self):
+        enumerator: HookedAsyncIterator = HookedAsyncIterator([1, 2])
+
+        self.assertEqual([item async for item in enumerator], [1, 2])
+        self.assertEqual(enumerator.events, ["starting", "closed", "completed"])
+        self.assertFalse(await enumerator.MoveNextAsync())
+
+    async def test_stop(self):
+        enumerator: HookedAsyncIterator = HookedAsyncIterator([1, 2])
+
+        self.assertTrue(await enumerator.MoveNextAsync())
+        self.assertTrue(enumerator.IsStarted())
+
+        await enumerator.StopAsync()
+
+        self.assertFalse(enumerator.IsStarted())
+        self.assertEqual(enumerator.events, ["starting", "closed"])
+        self.assertIsNone(await enumerator.TryResetAsync())
+        self.assertFalse(await enumerator.MoveNextAsync())
+
+    async def test_threaded(self):
+        l: List[int] = List[int]()
+        l.AddLastItems(range(10))
+
+        self.assertEqual([item async for item in ThreadedAsyncEnumerable[int](l, batchSize = 3)], list(range(10)))
+
+        with ThreadPoolExecutor(1) as executor:
+            enumerator: ThreadedAsyncEnumerator[ILinkedNode[int]] = ThreadedAsyncEnumerator[ILinkedNode[int]](NodeEnumerator[int](l.GetFirst()), executor, 4) # type: ignore
+
+            self.assertTrue(await enumerator.MoveNextAsync())
+            self.assertEqual(enumerator.GetCurrent().GetValue(), 0) # type: ignore
+            self.assertTrue(await enumerator.TryResetAsync())
+            self.assertEqual([node.GetValue() async for node in enumerator], list(range(10)))
+
+    async def test_threaded_cancelled(self):
+        event: threading.Event = threading.Event()
+
+        def iterate():
+            event.wait()
+
+            yield from range(6)
+
+        with ThreadPoolExecutor(1) as executor:
+            enumerator: ThreadedAsyncEnumerator[int] = ThreadedAsyncEnumerator[int](Iterator[int](iterate()), executor, 3)
+
+            with self.assertRaises(TimeoutError):
+                await asyncio.wait_for(enumerator.MoveNextAsync(), 0.05)
+
+            event.set()
+
+            self.assertEqual([item async for item in enumerator], list(range(6)))
+
+    def test_batch_size(self):
+        with self.assertRaises(ValueError):
+            ThreadedAsyncEnumerator[int](Iterator[int](iter([])), batchSize = 0)
+
+class TestConcatenationBuilder(unittest.TestCase):
+    def test_order(self):
+        """The prepended segments are returned before the appended ones, in the order they would be if they were added one by one"""
+        builder: ConcatenationBuilder[int] = ConcatenationBuilder[int](range(2, 4))
+
+        builder.AppendItem(4)
+        builder.AppendValues(5, 6)
+        builder.AppendIterable([[7], None, (8,)])
+        builder.PrependItem(1)
+        builder.PrependItem(0)
+        builder.PrependIterable([[-3], None, (-2, -1)])
+
+        self.assertEqual(list(builder), list(range(-3, 9)))
+        self.assertEqual(list(builder), list(range(-3, 9)))
+
+    def test_items_are_grouped(self):
+        """The items added one by one are kept in a single segment"""
+        builder: ConcatenationBuilder[int] = ConcatenationBuilder[int]()
+
+        for i in range(100):
+            builder.AppendItem(i)
+            builder.PrependItem(-i)
+
+        self.assertEqual(builder.GetSegmentCount(), 2)
+
+    def test_snapshot(self):
+        """The items added after an enumeration started are not returned by this enumeration"""
+        builder: ConcatenationBuilder[int] = ConcatenationBuilder[int]([0])
+
+        builder.AppendItem(1)
+
+        iterator = iter(builder)
+
+        builder.AppendItem(2)
+        builder.PrependItem(-1)
+
+        self.assertEqual(list(iterator), [0, 1])
+        self.assertEqual(list(builder), [-1, 0, 1, 2])
+
+    def test_splice(self):
+        """The segments of a builder are copied into another one, which is not updated by the next changes of the first one"""
+        first: ConcatenationBuilder[int] = ConcatenationBuilder[int]()
+
+        first.AppendValues(1, 2)
+        first.AppendItem(3)
+
+        second: ConcatenationBuilder[int] = ConcatenationBuilder[int]([0])
+
+        second.Append(first)
+        second.Prepend(first)
+        first.AppendItem(4)
+        first.PrependItem(0)
+
+        self.assertEqual(list(second), [1, 2, 3, 0, 1, 2, 3])
+        self.assertEqual(list(first), [0, 1, 2, 3, 4])
+        self.assertEqual(second.GetSegmentCount(), 5)
+
+        second.Append(second)
+
+        self.assertEqual(list(second), 2 * [1, 2, 3, 0, 1, 2, 3])
+
+    def test_clear(self):
+        """A cleared builder is empty, and the running enumerations are not updated"""
+        builder: ConcatenationBuilder[int] = ConcatenationBuilder[int]([0, 1])
+        iterator = iter(builder)
+
+        builder.Clear()
+
+        self.assertEqual(list(builder), [])
+        self.assertEqual(list(iterator), [0, 1])
+
+    def test_deep_concatenation(self):
+        """The number of concatenations is not limited by the recursion limit"""
+        count: int = 5 * sys.getrecursionlimit()
+        builder: ConcatenationBuilder[int] = ConcatenationBuilder[int]()
+
+        for i in range(count):
+            builder.Append(range(i, i + 1))
+
+        self.assertEqual(list(builder), list(range(count)))
+
+        enumerator = builder.GetEnumerator()
+
+        self.assertTrue(enumerator.MoveNext())
+        self.assertEqual(enumerator.GetCurrent(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
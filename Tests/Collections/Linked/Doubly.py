@@ -298,6 +298,22 @@ class TestList(unittest.TestCase):
         """Remove all items from the end"""
         assertRemoveAll(self, self.__list, lambda l: l.RemoveLast())
 
+    def test_try_remove_value_empty_list(self):
+        """TryRemoveFirstValue and TryRemoveLastValue on an empty list must return the default value"""
+        default: object = object()
+
+        self.assertIs(self.__list.TryRemoveFirstValue(default), default)
+        self.assertIs(self.__list.TryRemoveLastValue(default), default)
+
+    def test_try_remove_value_with_items(self):
+        """TryRemoveFirstValue and TryRemoveLastValue must remove and return the items"""
+        populateList(self.__list)
+
+        self.assertEqual(self.__list.TryRemoveFirstValue(-1), 1)
+        self.assertEqual(self.__list.TryRemoveLastValue(-1), 3)
+        assertValueAndEmpty(self, self.__list, 2, self.__list.TryRemoveFirst())
+        self.assertEqual(self.__list.TryRemoveLastValue(-1), -1)
+
     # Clear tests
 
     def test_clear_empty_list(self):
@@ -556,6 +572,11 @@ class TestCountableList(unittest.TestCase):
         """The counter must decrement after a call to RemoveLast"""
         assertRemove(self, self.__list, lambda l: l.RemoveLast())
 
+    def test_count_after_try_remove_value(self):
+        """The counter must decrement after a call to TryRemoveFirstValue or TryRemoveLastValue"""
+        assertRemove(self, self.__list, lambda l: l.TryRemoveFirstValue(None)) # type: ignore
+        assertRemove(self, self.__list, lambda l: l.TryRemoveLastValue(None)) # type: ignore
+
     def test_count_after_clear(self):
         """The counter must be 0 after a call to Clear"""
         populateList(self.__list)
@@ -700,5 +721,156 @@ class TestEdgeCases(unittest.TestCase):
         # Backward navigation
         navigate(lambda l: l.GetLast(), lambda node: node.GetPrevious(), [5, 4, 3, 2, 1])
 
+class TestNodePool(unittest.TestCase):
+    """Tests for the reuse of the removed nodes"""
+
+    def test_removed_node_is_reused(self):
+        """A removed node that was never handed out must hold the next item"""
+        l: IList[int] = List[int]()
+
+        l.AddLastValues(1, 2)
+
+        # The node is read without being handed out, and only its identity is kept.
+        first: int = id(l._GetFirst()) # type: ignore
+
+        self.assertEqual(l.TryRemoveFirstValue(None), 1)
+
+        l.AddLastValues(3)
+
+        self.assertEqual(id(l._GetLast()), first) # type: ignore
+        self.assertEqual(l.TryGetFirstValue(None), 2)
+        self.assertEqual(l.TryGetLastValue(None), 3)
+
+    def test_held_node_is_not_reused(self):
+        """A removed node handed out to a caller must not be reused"""
+        l: IList[int] = List[int]()
+
+        node: IDoublyLinkedNode[int] = l.AddLast(1)
+
+        l.AddLastValues(2)
+
+        self.assertEqual(l.TryRemoveFirst().GetValue(), 1)
+
+        l.AddFirstValues(0)
+
+        self.assertIsNot(l.GetFirst(), node)
+        self.assertEqual(node.GetValue(), 1)
+        self.assertIsNone(node.GetNext())
+        self.assertEqual(tuple(l), (0, 2))
+
+    def test_enumerated_node_is_not_reused(self):
+        """The current node of an enumerator must not be reused once removed"""
+        l: IList[int] = List[int]()
+
+        l.AddLastValues(1, 2, 3)
+
+        enumerator: IEnumerator[int] = assertNotNone(self, l.TryGetEnumerator())
+
+        self.assertTrue(enumerator.MoveNext())
+        self.assertEqual(enumerator.GetCurrent(), 1)
+
+        l.TryRemoveFirstValue(None)
+        l.AddFirstValues(0)
+
+        # The removed node no longer leads to the other ones; it would lead to them again if it held the new first item.
+        self.assertFalse(enumerator.MoveNext())
+        self.assertEqual(tuple(l), (0, 2, 3))
+
+    def test_nodes_are_reused_once_emptied(self):
+        """The removed nodes must be reused again once the list that handed out nodes is empty"""
+        l: IList[int] = List[int]()
+
+        node: IDoublyLinkedNode[int] = l.AddLast(1)
+
+        l.Clear()
+        l.AddLastValues(2, 3)
+
+        first: int = id(l._GetFirst()) # type: ignore
+
+        l.TryRemoveFirstValue(None)
+        l.AddFirstValues(4)
+
+        self.assertEqual(id(l._GetFirst()), first) # type: ignore
+        self.assertEqual(node.GetValue(), 1)
+        self.assertEqual(tuple(l), (4, 3))
+
+    def test_countable_list_reuses_nodes(self):
+        """A countable list must count the items held by the reused nodes"""
+        l: ICountableList[int] = CountableList[int]()
+
+        l.AddLastValues(1, 2, 3)
+
+        l.TryRemoveFirstValue(None)
+        l.TryRemoveLastValue(None)
+        l.AddLastValues(4)
+        l.AddFirstValues(0)
+
+        assertCount(self, l, 3)
+        self.assertEqual(tuple(l), (0, 2, 4))
+
+class TestBulkAdd(unittest.TestCase):
+    """Tests for the addition of several items at once"""
+
+    def test_add_items_links_nodes(self):
+        """The nodes added at once must be linked in both directions"""
+        l: IList[int] = List[int]()
+
+        self.assertTrue(l.AddLastItems(item for item in (3, 4)))
+        self.assertTrue(l.AddFirstItems([1, 2]))
+        self.assertTrue(l.AddLastItems(()))
+
+        values: PyList[int] = []
+        node: IDoublyLinkedNode[int]|None = l.GetLast()
+
+        while node is not None:
+            self.assertIs(node.GetList(), l)
+
+            values.append(node.GetValue())
+
+            node = node.GetPrevious()
+
+        self.assertEqual(values, [4, 3, 2, 1])
+        self.assertEqual(tuple(l), (1, 2, 3, 4))
+
+    def test_added_nodes_can_be_updated(self):
+        """The nodes added at once must support the node operations"""
+        l: IList[int] = List[int]()
+
+        l.AddLastItems(range(5))
+
+        middle: IDoublyLinkedNode[int] = assertNotNone(self, assertNotNone(self, l.GetFirst()).GetNext())
+
+        middle.SetNext(9)
+
+        self.assertEqual(middle.Remove(), 1)
+        self.assertEqual(assertNotNone(self, l.GetLast()).SetNext(5).GetValue(), 5)
+        self.assertEqual(tuple(l), (0, 9, 2, 3, 4, 5))
+
+    def test_add_items_reuses_nodes(self):
+        """The removed nodes must hold the items added at once"""
+        l: IList[int] = List[int]()
+
+        l.AddLastItems(range(3))
+
+        for _ in range(3):
+            l.TryRemoveLastValue(None)
+
+        l.AddLastItems(range(4))
+
+        self.assertEqual(tuple(l), (0, 1, 2, 3))
+        self.assertEqual(tuple(node.GetValue() for node in l.GetNodeEnumerator().AsIterator()), (0, 1, 2, 3))
+
+    def test_countable_list_counts_added_items(self):
+        """A countable list must count the items added at once"""
+        l: ICountableList[int] = CountableList[int]()
+
+        l.AddLastItems(range(3, 6))
+        l.AddFirstValues(1, 2)
+        assertNotNone(self, l.GetLast()).SetNext(6)
+
+        assertCount(self, l, 6)
+        self.assertEqual(tuple(l), (1, 2, 3, 4, 5, 6))
+        self.assertIs(assertNotNone(self, l.GetLast()).GetList(), l)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Tests unitaires pour les listes simplement chaînées (WinCopies.Collections.Linked.Singly)
+"""
+
+import unittest
+
+from WinCopies.Collections.Linked.Singly import IList, Queue, Stack, CountableQueue, CountableStack
+
+class TestTryValue(unittest.TestCase):
+    """Tests for the methods that return a default value rather than an INullable."""
+
+    def test_queue(self):
+        """TryPeekValue and TryPopValue must return the items in FIFO order, then the default value"""
+        queue: IList[int] = Queue[int](1, 2)
+        default: object = object()
+
+        self.assertEqual(queue.TryPeekValue(default), 1)
+        self.assertEqual(queue.TryPopValue(default), 1)
+        self.assertEqual(queue.TryPopValue(default), 2)
+        self.assertIs(queue.TryPeekValue(default), default)
+        self.assertIs(queue.TryPopValue(default), default)
+        self.assertTrue(queue.IsEmpty())
+
+        # The queue must still be usable once emptied.
+        queue.Push(3)
+
+        self.assertEqual(queue.TryPop().GetValue(), 3)
+        self.assertFalse(queue.TryPop().HasValue())
+
+    def test_stack(self):
+        """TryPopValue must return the items in LIFO order"""
+        stack: IList[int] = Stack[int](1, 2, 3)
+
+        self.assertEqual([stack.TryPopValue(None) for _ in range(4)], [3, 2, 1, None])
+
+    def test_count(self):
+        """The counter must only decrement when an item is popped"""
+        queue: CountableQueue[int] = CountableQueue[int]()
+
+        queue.PushValues(1, 2)
+
+        self.assertEqual(queue.TryPopValue(None), 1)
+        self.assertEqual(queue.GetCount(), 1)
+        self.assertEqual(queue.TryPopValue(None), 2)
+        self.assertIsNone(queue.TryPopValue(None))
+        self.assertEqual(queue.GetCount(), 0)
+
+    def test_clear(self):
+        """Clear must empty the list"""
+        stack: IList[int] = Stack[int](1, 2, 3)
+
+        stack.Clear()
+
+        self.assertTrue(stack.IsEmpty())
+        self.assertFalse(stack.TryPeek().HasValue())
+
+class TestExtend(unittest.TestCase):
+    """Tests for the methods that push several items at once."""
+
+    def test_queue(self):
+        """Extend must push the items after the queued ones, whatever the number of items of the queue"""
+        queue: IList[int] = Queue[int]()
+
+        self.assertEqual(queue.Extend(iter([1])), 1)
+        self.assertEqual(queue.Extend([2, 3]), 2)
+        self.assertEqual(queue.Extend(()), 0)
+
+        queue.Push(4)
+        queue.PushItems(item for item in (5, 6))
+
+        self.assertEqual([queue.TryPopValue(None) for _ in range(7)], [1, 2, 3, 4, 5, 6, None])
+
+        # The queue must still be usable once emptied.
+        queue.PushValues(7, 8)
+        queue.Push(9)
+
+        self.assertEqual([queue.TryPopValue(None) for _ in range(4)], [7, 8, 9, None])
+
+    def test_stack(self):
+        """Extend must push the items as if they were pushed one at a time"""
+        stack: IList[int] = Stack[int](1)
+
+        self.assertEqual(stack.Extend(range(2, 5)), 3)
+
+        stack.Push(5)
+
+        self.assertEqual([stack.TryPopValue(None) for _ in range(6)], [5, 4, 3, 2, 1, None])
+
+    def test_count(self):
+        """The counter must be incremented by the number of pushed items"""
+        queue: CountableQueue[int] = CountableQueue[int](1)
+        stack: CountableStack[int] = CountableStack[int]()
+
+        queue.PushItems(item for item in (2, 3))
+        stack.PushItems(range(4))
+
+        self.assertEqual(queue.Extend([]), 0)
+        self.assertEqual(queue.GetCount(), 3)
+        self.assertEqual(stack.GetCount(), 4)
+        self.assertFalse(queue.TryPushItems(None))
+        self.assertEqual(queue.GetCount(), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Tests unitaires pour la recherche de plusieurs séquences à la fois (WinCopies.Collections.Matching)
+"""
+
+import random
+import unittest
+
+from WinCopies.Collections import ContainsSequenceMultipleTimes
+from WinCopies.Collections.Matching import PatternMatcher
+
+class TestPatternMatcher(unittest.TestCase):
+    def setUp(self):
+        self.__matcher: PatternMatcher[str] = PatternMatcher[str](["he", "she", "his", "hers", "e"])
+
+    def test_matches(self):
+        """The occurrences are returned by end, from the longest pattern, including the ones that overlap"""
+        self.assertEqual(list(self.__matcher.EnumerateMatches("ushers")), [(1, 1), (2, 0), (3, 4), (2, 3)])
+
+    def test_counts(self):
+        """The occurrences of each pattern are counted up to the maximum"""
+        self.assertEqual(self.__matcher.GetCounts("she sells his shells"), [2, 2, 1, 0, 3])
+        self.assertEqual(self.__matcher.GetCounts("she sells his shells", 1), [1, 1, 1, 0, 1])
+
+        with self.assertRaises(ValueError):
+            self.__matcher.GetCounts("", 0)
+
+    def test_first_indices(self):
+        """The first occurrence of each pattern is returned, and the items are not read after the last one"""
+        items = iter("his hero" + 100 * "x")
+
+        self.assertEqual(self.__matcher.GetFirstIndices(items), [4, None, 0, None, 5])
+        self.assertEqual(self.__matcher.GetFirstIndices(iter("she hers")), [1, 0, None, 4, 2])
+        self.assertEqual(next(iter(PatternMatcher([[1]]).GetFirstIndices(iter([1, 2])))), 0)
+
+    def test_contains(self):
+        """The results are those of the functions that search a single sequence"""
+        random.seed(0)
+
+        for _ in range(500):
+            patterns: list[list[int]] = [[random.randrange(3) for _ in range(random.randint(1, 4))] for _ in range(random.randint(1, 5))]
+            items: list[int] = [random.randrange(4) for _ in range(random.randrange(30))]
+            matcher: PatternMatcher[int] = PatternMatcher[int](patterns)
+
+            with self.subTest(patterns = patterns, items = items):
+                self.assertEqual(matcher.ContainsMultipleTimes(iter(items)), [ContainsSequenceMultipleTimes(items, pattern)[0] for pattern in patterns])
+
+        self.assertEqual(self.__matcher.ContainsOnlyOne("hers"), [True, None, None, True, True])
+
+    def test_empty_pattern(self):
+        """An empty pattern is refused"""
+        with self.assertRaises(ValueError):
+            PatternMatcher([[1], []])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests unitaires pour l'empreinte mémoire des éléments des collections (WinCopies.Collections)
+"""
+
+import tracemalloc
+import unittest
+
+from collections.abc import Callable
+
+from WinCopies.Collections.Abstraction.Collection import Dictionary, List, Tuple
+from WinCopies.Collections.Linked import Doubly, Singly
+from WinCopies.Typing import GetNullable
+from WinCopies.Typing.Object import Integer, String
+from WinCopies.Typing.Pairing import DualResult, KeyValuePair
+
+COUNT: int = 10000
+
+def measure(create: Callable[[int], object]) -> float:
+    """Returns the number of bytes allocated per element by create, called with the number of elements to create."""
+    tracemalloc.start()
+
+    try:
+        result: object = create(COUNT)
+        size: int = tracemalloc.get_traced_memory()[0]
+
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return size / COUNT
+
+def createDoublyList(count: int) -> Doubly.List[int]:
+    l: Doubly.List[int] = Doubly.List[int]()
+
+    for i in range(count):
+        l.AddLast(i)
+
+    return l
+
+def createSinglyList[T: Singly.List[int]](type: Callable[[], T], count: int) -> T:
+    l: T = type()
+
+    for i in range(count):
+        l.Push(i)
+
+    return l
+
+class TestMemory(unittest.TestCase):
+    def test_elements_have_no_dictionary(self):
+        for item in (createDoublyList(1).GetFirst(), Singly.SinglyLinkedNode[int](1, None), KeyValuePair(1, 2), DualResult(1, True), GetNullable(1), Integer(1), String("a"), next(iter(Dictionary[int, int]({1: 1}).GetEnumerator())), Tuple[int]((1,)).GetEnumerator()):
+            with self.subTest(type = type(item).__qualname__):
+                self.assertFalse(hasattr(item, "__dict__"))
+
+    def test_bytes_per_element(self):
+        sizes: dict[str, float] = {
+            "Doubly.List": measure(createDoublyList),
+            "Singly.Queue": measure(lambda count: createSinglyList(Singly.Queue[int], count)),
+            "Singly.Stack": measure(lambda count: createSinglyList(Singly.Stack[int], count)),
+            "Abstraction.Dictionary": measure(lambda count: Dictionary[int, int]({i: i for i in range(count)})),
+            "Abstraction.Tuple": measure(lambda count: Tuple[int](range(count))),
+            "Abstraction.List": measure(lambda count: List[int](list(range(count)))),
+            "KeyValuePair": measure(lambda count: [KeyValuePair(i, i) for i in range(count)]),
+            "Integer": measure(lambda count: [Integer(i) for i in range(count)])}
+
+        print()
+
+        for name, size in sizes.items():
+            print(f"{name:<24}{size:>8.1f} bytes per element")
+
+        # A slotted node only holds its value and links, far less than an instance dictionary.
+        self.assertLess(sizes["Doubly.List"], 128)
+        self.assertLess(sizes["Singly.Queue"], 96)
+
+if __name__ == '__main__':
+    unittest.main()
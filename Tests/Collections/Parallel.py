@@ -0,0 +1,190 @@
+"""
+Tests unitaires pour les sélections parallèles (WinCopies.Collections.Parallel)
+"""
+
+import sys
+import threading
+import time
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from WinCopies.Collections import EnumerationOrder, Parallel
+
+def isEven(value: int) -> bool:
+    return value % 2 == 0
+
+def fail(value: int) -> int:
+    if value == 5:
+        raise KeyError(value)
+
+    return value
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_ordered(self):
+        self.assertEqual(list(Parallel.Select(range(100), str, self.executor, 7)), [str(i) for i in range(100)])
+        self.assertEqual(list(Parallel.WhereSelect(range(10), isEven, str, self.executor, 3)), ["0", "2", "4", "6", "8"])
+        self.assertEqual(list(Parallel.SelectWhere(range(10), abs, isEven, self.executor, 3)), [0, 2, 4, 6, 8])
+        self.assertEqual(list(Parallel.Include(range(10), isEven, self.executor, 3)), [0, 2, 4, 6, 8])
+        self.assertEqual(list(Parallel.Exclude(range(10), isEven, self.executor, 3)), [1, 3, 5, 7, 9])
+        self.assertEqual(list(Parallel.Select(None, str, self.executor)), [])
+
+    def test_unordered(self):
+        def convert(value: int) -> int:
+            # The first chunk completes last.
+            if value == 0:
+                time.sleep(0.05)
+
+            return value
+
+        result: list[int] = list(Parallel.Select(range(20), convert, self.executor, 5, False))
+
+        self.assertEqual(sorted(result), list(range(20)))
+        self.assertNotEqual(result[0], 0)
+
+    def test_exception(self):
+        with self.assertRaises(KeyError):
+            list(Parallel.Select(range(20), fail, self.executor, 2))
+
+    def test_max_pending(self):
+        read: list[int] = []
+
+        def getItems():
+            for i in range(100):
+                read.append(i)
+
+                yield i
+
+        items = Parallel.Select(getItems(), str, self.executor, 10, maxPending = 2)
+
+        next(items)
+
+        self.assertLessEqual(len(read), 30)
+
+        items.close()
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Parallel.Select(range(10), str, self.executor, 0)
+
+        with self.assertRaises(ValueError):
+            Parallel.Select(range(10), str, self.executor, maxPending = 0)
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(2) as executor:
+            self.assertEqual(list(Parallel.Include(range(100), isEven, executor, 10)), list(range(0, 100, 2)))
+
+    def test_threads_used(self):
+        threads: set[int] = set()
+        lock: threading.Lock = threading.Lock()
+
+        def convert(value: int) -> int:
+            with lock:
+                threads.add(threading.get_ident())
+
+            time.sleep(0.001)
+
+            return value
+
+        list(Parallel.Select(range(40), convert, self.executor, 1))
+
+        self.assertGreater(len(threads), 1)
+
+class TestEnumerateRecursively(unittest.TestCase):
+    def setUp(self):
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(4)
+        self.children: dict[int, list[int]] = {1: [2, 5], 2: [3, 4], 6: [7]}
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def getChildren(self, item: int) -> list[int]|None:
+        # The nodes are not listed in the order they are found.
+        time.sleep(0.001 * (item % 3))
+
+        return self.children.get(item)
+
+    def test_ordered(self):
+        """The ordered enumerations return the items in the same order as the sequential ones"""
+        self.assertEqual(list(Parallel.EnumerateRecursively([1, 6], self.getChildren, self.executor, EnumerationOrder.FIFO)), [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(list(Parallel.EnumerateRecursively([1, 6], self.getChildren, self.executor, EnumerationOrder.LIFO)), [3, 4, 2, 5, 1, 7, 6])
+
+    def test_unordered(self):
+        self.assertEqual(sorted(Parallel.EnumerateRecursively([1, 6], self.getChildren, self.executor)), list(range(1, 8)))
+        self.assertEqual(list(Parallel.EnumerateRecursively(None, self.getChildren, self.executor)), [])
+        self.assertEqual(list(Parallel.EnumerateRecursively([], self.getChildren, self.executor)), [])
+
+    def test_deep_tree(self):
+        """A single branch is enumerated without recursion"""
+        depth: int = 5 * sys.getrecursionlimit()
+        getChildren = lambda item: [item + 1] if item < depth else None
+
+        self.assertEqual(list(Parallel.EnumerateRecursively([0], getChildren, self.executor, EnumerationOrder.FIFO)), list(range(depth + 1)))
+        self.assertEqual(list(Parallel.EnumerateRecursively([0], getChildren, self.executor, EnumerationOrder.LIFO)), list(range(depth, -1, -1)))
+
+    def test_work_stealing(self):
+        """The subtrees of a single root are shared between the workers"""
+        threads: set[int] = set()
+        lock: threading.Lock = threading.Lock()
+
+        def getChildren(item: int) -> list[int]|None:
+            with lock:
+                threads.add(threading.get_ident())
+
+            time.sleep(0.001)
+
+            return [10 * item + i for i in range(1, 4)] if item < 1000 else None
+
+        self.assertEqual(len(list(Parallel.EnumerateRecursively([0], getChildren, self.executor, maxWorkers = 4))), 1 + 3 + 9 + 27 + 81)
+        self.assertGreater(len(threads), 1)
+
+    def test_more_workers_than_threads(self):
+        """The nodes of the workers that the executor cannot run are taken over by the others"""
+        with ThreadPoolExecutor(1) as executor:
+            self.assertEqual(sorted(Parallel.EnumerateRecursively([1, 6, 8, 9], self.getChildren, executor, maxWorkers = 8)), list(range(1, 10)))
+            self.assertEqual(list(Parallel.EnumerateRecursively([1, 6], self.getChildren, executor, EnumerationOrder.FIFO, 8)), [1, 2, 3, 4, 5, 6, 7])
+
+    def test_exception(self):
+        def getChildren(item: int) -> list[int]:
+            if item == 5:
+                raise KeyError(item)
+
+            return [item + 1]
+
+        for enumerationOrder in EnumerationOrder:
+            with self.subTest(enumerationOrder = enumerationOrder):
+                with self.assertRaises(KeyError):
+                    list(Parallel.EnumerateRecursively([0], getChildren, self.executor, enumerationOrder))
+
+    def test_close(self):
+        """The workers stop once the enumeration is closed"""
+        expanded: list[int] = []
+
+        def getChildren(item: int) -> list[int]:
+            expanded.append(item)
+
+            return [item + 1]
+
+        items = Parallel.EnumerateRecursively([0], getChildren, self.executor, EnumerationOrder.FIFO)
+
+        next(items)
+        items.close()
+
+        count: int = len(expanded)
+
+        time.sleep(0.01)
+
+        self.assertLessEqual(len(expanded), count + 4)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Parallel.EnumerateRecursively([0], self.getChildren, self.executor, maxWorkers = 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests unitaires pour les requêtes fusionnées (WinCopies.Collections.Query)
+"""
+
+import unittest
+
+from itertools import dropwhile, takewhile
+
+from WinCopies.Collections import Iteration
+from WinCopies.Collections.Query import Query
+
+def isOdd(value: int) -> bool:
+    return value % 2 == 1
+
+def triple(value: int) -> int:
+    return value * 3
+
+class TestQuery(unittest.TestCase):
+    def test_filters_and_selectors(self):
+        query: Query[str] = Query[int](range(30)).Include(isOdd).Exclude(lambda value: value == 5).Select(triple).Select(str)
+
+        self.assertEqual(list(query), list(Iteration.Select(Iteration.Select(Iteration.Exclude(Iteration.Include(range(30), isOdd), lambda value: value == 5), triple), str)))
+
+        # A query can be iterated again.
+        self.assertEqual(list(query), list(query))
+
+    def test_where_select(self):
+        self.assertEqual(list(Query[int](range(10)).WhereSelect(isOdd, triple)), list(Iteration.WhereSelect(range(10), isOdd, triple)))
+        self.assertEqual(list(Query[int](range(10)).SelectWhere(triple, isOdd)), list(Iteration.SelectWhere(range(10), triple, isOdd)))
+
+    def test_stopping_operators(self):
+        self.assertEqual(list(Query[int](range(10)).IncludeWhile(lambda value: value < 4)), [0, 1, 2, 3])
+        self.assertEqual(list(Query[int](range(10)).IncludeUntil(lambda value: value == 4)), [0, 1, 2, 3])
+        self.assertEqual(list(Query[int](range(10)).DoIncludeWhile(lambda value: value < 4)), [0, 1, 2, 3, 4])
+        self.assertEqual(list(Query[int](range(10)).DoIncludeUntil(lambda value: value == 4).Include(isOdd)), [1, 3])
+
+    def test_source_not_drained(self):
+        iterator = iter(range(10))
+
+        self.assertEqual(list(Query[int](iterator).Select(triple).IncludeWhile(lambda value: value < 6)), [0, 3])
+        self.assertEqual(next(iterator), 3)
+
+    def test_skipping_operators(self):
+        self.assertEqual(list(Query[int](range(10)).ExcludeWhile(lambda value: value < 4).Select(triple)), list(map(triple, dropwhile(lambda value: value < 4, range(10)))))
+        self.assertEqual(list(Query[int]([1, 5, 2, 6]).ExcludeUntil(lambda value: value > 4)), [5, 2, 6])
+
+    def test_append_and_prepend(self):
+        query: Query[int] = Query[int]([1, 2, 3]).IncludeWhile(lambda value: value < 2).Append([7, 8]).PrependValues(0).Select(lambda value: -value)
+
+        self.assertEqual(list(query), list(Iteration.Select(Iteration.PrependValues(Iteration.Append(Iteration.IncludeWhile([1, 2, 3], lambda value: value < 2), [7, 8]), 0), lambda value: -value)))
+
+        # An operator added after the appended values ends the enumeration of all the sources.
+        self.assertEqual(list(Query[int]([1, 2]).AppendValues(3, 4).PrependItem(0).IncludeWhile(lambda value: value < 3)), list(takewhile(lambda value: value < 3, [0, 1, 2, 3, 4])))
+        self.assertEqual(list(Query[int](None).AppendItem(1).AppendIterable([[2], None, [3]])), [1, 2, 3])
+
+    def test_none_items(self):
+        self.assertEqual(list(Query[int|None]([1, None, 2])), [1, None, 2])
+
+    def test_terminal_operators(self):
+        self.assertEqual(Query[int](range(5, 10)).Include(isOdd).TryGetFirst().GetValue(), 5) # type: ignore
+        self.assertFalse(Query[int](range(10)).Include(lambda value: value > 10).Any())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Tests unitaires pour l'énumération récursive (WinCopies.Collections.Enumeration.Recursive)
+"""
+
+import sys
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from WinCopies import Abstract
+from WinCopies.Collections import EnumerationOrder
+from WinCopies.Collections.Enumeration import IEnumerable, IEnumerator, Iterator
+from WinCopies.Collections.Enumeration.Recursive import IRecursiveStackedEnumerationHandler, RecursivelyEnumerable
+
+class Tree(RecursivelyEnumerable[int]):
+    def __init__(self, items: list[int], children: dict[int, list[int]], requested: list[int]|None = None):
+        super().__init__()
+
+        self.__items: list[int] = items
+        self.__children: dict[int, list[int]] = children
+        # The items whose children are requested.
+        self.Requested: list[int] = [] if requested is None else requested
+
+    def TryGetEnumerator(self) -> IEnumerator[int]|None:
+        return Iterator[int](iter(self.__items))
+
+    def _AsRecursivelyEnumerable(self, container: int) -> IEnumerable[int]:
+        self.Requested.append(container)
+
+        return Tree(self.__children.get(container, []), self.__children, self.Requested)
+
+class Handler(Abstract, IRecursiveStackedEnumerationHandler[int]):
+    def __init__(self, skippedParent: int|None = None, exitedParent: int|None = None):
+        super().__init__()
+
+        self.Events: list[tuple[str, int]] = []
+
+        self.__skippedParent: int|None = skippedParent
+        self.__exitedParent: int|None = exitedParent
+
+    def OnStartingEnumeration(self) -> bool:
+        return True
+
+    def OnEnteringEnumerationLevel(self, item: int) -> None:
+        pass
+    def OnExitingEnumerationLevel(self, cookie: int) -> None:
+        pass
+
+    def OnEnteringMainEnumerationLevel(self, item: int) -> bool|None:
+        self.Events.append(("enterMain", item))
+
+        return True
+    def OnExitingMainEnumerationLevel(self, cookie: int) -> bool|None:
+        self.Events.append(("exitMain", cookie))
+
+        return True
+
+    def OnEnteringSubenumerationLevel(self, item: int) -> bool|None:
+        self.Events.append(("enterSub", item))
+
+        return item != self.__skippedParent
+    def OnExitingSubenumerationLevel(self, cookie: int) -> bool|None:
+        self.Events.append(("exitSub", cookie))
+
+        return cookie != self.__exitedParent
+
+    def OnStoppedEnumeration(self) -> None:
+        pass
+
+def enumerate(enumerator: IEnumerator[int]) -> list[int]:
+    return list(enumerator.AsIterator())
+
+class TestRecursive(unittest.TestCase):
+    def setUp(self):
+        self.__tree: Tree = Tree([1, 6], {1: [2, 5], 2: [3, 4], 6: [7]})
+
+    def test_fifo(self):
+        """Each item is returned before its children"""
+        self.assertEqual(enumerate(self.__tree.GetRecursiveEnumerator(EnumerationOrder.FIFO)), [1, 2, 3, 4, 5, 6, 7])
+
+    def test_lifo(self):
+        """Each item is returned after its children"""
+        self.assertEqual(enumerate(self.__tree.GetRecursiveEnumerator(EnumerationOrder.LIFO)), [3, 4, 2, 5, 1, 7, 6])
+        self.assertEqual(enumerate(self.__tree.GetRecursiveStackedEnumerator(EnumerationOrder.LIFO)), [3, 4, 2, 5, 1, 7, 6])
+
+    def test_handler(self):
+        """The handler is notified of the levels, with the parent items as cookies"""
+        handler: Handler = Handler()
+
+        self.assertEqual(enumerate(Tree([1], {1: [2], 2: [3]}).GetRecursiveStackedEnumerator(EnumerationOrder.FIFO, handler)), [1, 2, 3])
+        self.assertEqual(handler.Events, [("enterMain", 1), ("enterSub", 1), ("enterSub", 2), ("exitSub", 2), ("exitSub", 1), ("exitMain", 1)])
+
+    def test_handler_skips_levels(self):
+        """The children of an item are not enumerated if the handler refuses to enter their level"""
+        for enumerationOrder, expected in ((EnumerationOrder.FIFO, [1, 2, 5, 6, 7]), (EnumerationOrder.LIFO, [2, 5, 1, 7, 6])):
+            with self.subTest(enumerationOrder = enumerationOrder):
+                self.assertEqual(enumerate(self.__tree.GetRecursiveStackedEnumerator(enumerationOrder, Handler(skippedParent = 2))), expected)
+
+    def test_handler_exits_levels(self):
+        """The next siblings of the item of a level are not enumerated if the handler returns False on exiting this level"""
+        for enumerationOrder, expected in ((EnumerationOrder.FIFO, [1, 2, 3, 4, 6, 7]), (EnumerationOrder.LIFO, [3, 4, 2, 1, 7, 6])):
+            with self.subTest(enumerationOrder = enumerationOrder):
+                self.assertEqual(enumerate(self.__tree.GetRecursiveStackedEnumerator(enumerationOrder, Handler(exitedParent = 2))), expected)
+
+    def test_max_depth(self):
+        """The items deeper than maxDepth are not enumerated and their parents are not expanded"""
+        for enumerationOrder, expected in ((EnumerationOrder.FIFO, [1, 2, 5, 6, 7]), (EnumerationOrder.LIFO, [2, 5, 1, 7, 6])):
+            with self.subTest(enumerationOrder = enumerationOrder):
+                tree: Tree = Tree([1, 6], {1: [2, 5], 2: [3, 4], 6: [7]})
+
+                self.assertEqual(enumerate(tree.GetRecursiveEnumerator(enumerationOrder, maxDepth = 1)), expected)
+                self.assertEqual(tree.Requested, [1, 6])
+                self.assertEqual(enumerate(tree.GetRecursiveStackedEnumerator(enumerationOrder, maxDepth = 0)), [1, 6])
+
+        with self.assertRaises(ValueError):
+            self.__tree.GetRecursiveEnumerator(maxDepth = -1)
+
+    def test_prune(self):
+        """A pruned item is enumerated, but its children are never requested"""
+        for enumerationOrder, expected in ((EnumerationOrder.FIFO, [1, 2, 5, 6, 7]), (EnumerationOrder.LIFO, [2, 5, 1, 7, 6])):
+            with self.subTest(enumerationOrder = enumerationOrder):
+                tree: Tree = Tree([1, 6], {1: [2, 5], 2: [3, 4], 6: [7]})
+
+                self.assertEqual(enumerate(tree.GetRecursiveStackedEnumerator(enumerationOrder, Handler(), prune = lambda item: item == 2)), expected)
+                self.assertNotIn(2, tree.Requested)
+
+    def test_levels(self):
+        """Each level is returned as a batch, and the levels after the last requested one are not read"""
+        self.assertEqual(list(self.__tree.GetLevelEnumerable()), [[1, 6], [2, 5, 7], [3, 4]])
+        self.assertEqual(list(self.__tree.GetLevelEnumerable(1)), [[1, 6], [2, 5, 7]])
+        self.assertEqual(list(self.__tree.GetLevelEnumerable(prune = lambda item: item == 1)), [[1, 6], [7]])
+
+        tree: Tree = Tree([1, 6], {1: [2, 5], 2: [3, 4], 6: [7]})
+
+        self.assertEqual(next(iter(tree.GetLevelEnumerable())), [1, 6])
+        self.assertEqual(tree.Requested, [])
+
+    def test_parallel(self):
+        """The parallel enumerations return the same items as the sequential ones, in the same order when one is requested"""
+        with ThreadPoolExecutor(4) as executor:
+            for enumerationOrder in (EnumerationOrder.FIFO, EnumerationOrder.LIFO):
+                with self.subTest(enumerationOrder = enumerationOrder):
+                    self.assertEqual(list(self.__tree.GetParallelRecursiveEnumerable(executor, enumerationOrder)), enumerate(self.__tree.GetRecursiveEnumerator(enumerationOrder)))
+
+            self.assertEqual(sorted(self.__tree.GetParallelRecursiveEnumerable(executor)), list(range(1, 8)))
+
+    def test_deep_tree(self):
+        """The depth of the tree is not limited by the recursion limit"""
+        depth: int = 5 * sys.getrecursionlimit()
+        tree: Tree = Tree([0], {i: [i + 1] for i in range(depth)})
+
+        self.assertEqual(enumerate(tree.GetRecursiveEnumerator(EnumerationOrder.FIFO)), list(range(depth + 1)))
+        self.assertEqual(enumerate(tree.GetRecursiveEnumerator(EnumerationOrder.LIFO)), list(range(depth, -1, -1)))
+
+if __name__ == '__main__':
+    unittest.main()
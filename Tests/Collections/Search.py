@@ -0,0 +1,101 @@
+"""
+Tests unitaires pour la recherche de séquences (WinCopies.Collections)
+"""
+
+import random
+import unittest
+
+from collections.abc import Sequence
+
+from WinCopies.Collections import SequenceIndex, GetIndexOfSequence, IndexOfSequence, ContainsMultipleTimes, ContainsOnlyOne, ContainsSequenceMultipleTimes, ContainsOneSequence
+from WinCopies.Collections.Abstraction.Collection import Tuple, EquatableTuple
+
+def search(l: Sequence[int], values: Sequence[int], i: int) -> int|None:
+    """Returns the index of the first occurrence of values in l from i, by comparing each slice of l."""
+    for k in range(i, len(l) - len(values) + 1):
+        if list(l[k:k + len(values)]) == list(values):
+            return k
+    
+    return None
+
+class TestGetIndexOfSequence(unittest.TestCase):
+    def test_index(self):
+        """The index of the first item of the first occurrence is returned, with the lengths of the sequences"""
+        self.assertEqual(GetIndexOfSequence([1, 2, 3, 2, 3], [2, 3]), (1, 5, 2))
+        self.assertEqual(GetIndexOfSequence([1, 2, 3, 2, 3], [2, 3], 2), (3, 5, 2))
+        self.assertEqual(GetIndexOfSequence([1, 2, 3], [3], 1), (2, 3, 1))
+        self.assertEqual(GetIndexOfSequence([1, 2, 3], [3, 4]), (None, 3, 2))
+        self.assertEqual(GetIndexOfSequence([1, 2, 3], []), (None, 3, 0))
+        self.assertIsNone(IndexOfSequence([1, 2], [1, 2, 3]))
+
+    def test_partial_matches(self):
+        """An occurrence that begins inside a partial match is found"""
+        self.assertEqual(IndexOfSequence([1, 1, 2], [1, 2]), 1)
+        self.assertEqual(IndexOfSequence([1, 2, 1, 2, 1, 2, 3], [1, 2, 1, 2, 3]), 2)
+
+    def test_overlapping(self):
+        """The occurrences can overlap"""
+        self.assertEqual(ContainsSequenceMultipleTimes([1, 1, 1], [1, 1]), (True, 0, 3, 2))
+        self.assertFalse(ContainsOneSequence("aaa", "aa"))
+
+    def test_kinds(self):
+        """The hashable items, the other items, the strings and the bytes are searched the same way"""
+        random.seed(0)
+
+        for _ in range(2000):
+            l: list[int] = [random.randrange(3) for _ in range(random.randrange(20))]
+            values: list[int] = [random.randrange(3) for _ in range(random.randint(1, 4))]
+            i: int = random.randrange(4)
+            expected: int|None = search(l, values, i)
+
+            for items, _values in ((l, values), (tuple(l), values), ([[item] for item in l], [[value] for value in values]), (''.join(map(str, l)), ''.join(map(str, values))), (bytes(l), bytes(values)), (memoryview(bytearray(l)), memoryview(bytes(values)))):
+                with self.subTest(items = items, values = _values, i = i):
+                    self.assertEqual(GetIndexOfSequence(items, _values, i)[0], expected)
+
+    def test_worst_case(self):
+        """The search stays linear when the last item of values often matches"""
+        values: list[int] = 50 * [0] + [1] + 50 * [0]
+        l: list[int] = 100000 * [0] + values
+
+        self.assertEqual(IndexOfSequence(l, values), 100000)
+
+class TestSequenceIndex(unittest.TestCase):
+    def test_queries(self):
+        """The positions of each value are returned in order, optionally in a range"""
+        index: SequenceIndex[int] = SequenceIndex[int](iter([3, 1, 3, 2, 3]))
+
+        self.assertEqual(index.GetCount(), 5)
+        self.assertEqual(index.GetIndices(3), (0, 2, 4))
+        self.assertEqual((index.GetFirstIndex(3), index.GetFirstIndex(3, 1), index.GetFirstIndex(3, 1, 2)), (0, 2, None))
+        self.assertEqual((index.GetLastIndex(3), index.GetLastIndex(3, 0, 4), index.GetLastIndex(3, 1, 2)), (4, 2, None))
+        self.assertEqual((index.GetNthIndex(3, 1), index.GetNthIndex(3, -1), index.GetNthIndex(3, 3)), (2, 4, None))
+        self.assertEqual((index.GetCountOf(3), index.GetCountOf(3, 1, 4), index.GetCountOf(3, 4, 1)), (3, 1, 0))
+        self.assertTrue(index.Contains(2))
+        self.assertFalse(index.Contains(5))
+        self.assertFalse(index.Contains([3]))
+
+    def test_attached(self):
+        """The searches on a tuple use its index once attached, with the same results"""
+        for items in (Tuple[int]([3, 1, 3, 2, 3]), EquatableTuple[int]([3, 1, 3, 2, 3])):
+            with self.subTest(items = type(items)):
+                expected: list[object] = [ContainsOnlyOne(items, 1), ContainsMultipleTimes(items, 3, 1, 3), ContainsMultipleTimes(items, 5), items.FindFirstIndex(2), items.Contains(2), items.Contains(5)]
+                # FindLastIndex counts the positions from the end, as in the reversed tuple.
+                lastIndices: list[int] = [items.FindLastIndex(value) for value in (3, 1, 2, 5)]
+
+                self.assertEqual(lastIndices, [0, 3, 1, -1])
+                self.assertIsNone(items.TryGetSequenceIndex())
+
+                index: SequenceIndex[int] = items.AttachIndex()
+
+                self.assertIs(items.AttachIndex(), index)
+                self.assertIs(items.TryGetSequenceIndex(), index)
+                self.assertEqual([ContainsOnlyOne(items, 1), ContainsMultipleTimes(items, 3, 1, 3), ContainsMultipleTimes(items, 5), items.FindFirstIndex(2), items.Contains(2), items.Contains(5)], expected)
+                self.assertEqual([items.FindLastIndex(value) for value in (3, 1, 2, 5)], lastIndices)
+                self.assertEqual(items.FindFirstIndex(3, lambda item, value: item == value - 1), 3)
+
+                items.DetachIndex()
+
+                self.assertIsNone(items.TryGetSequenceIndex())
+
+if __name__ == '__main__':
+    unittest.main()
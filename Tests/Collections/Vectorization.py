@@ -0,0 +1,97 @@
+"""
+Tests unitaires pour les recherches natives dans les tampons numériques (WinCopies.Collections.Vectorization)
+"""
+
+import random
+import unittest
+
+from array import array
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+from WinCopies.Collections import GetIndexOf, IndexOf, ContainsOnlyOne
+from WinCopies.Collections.Loop import ForEachItem, ForEachItemUntil
+from WinCopies.Collections.Vectorization import Comparison, ComparisonOperator, TryGetIndexOf, TryFindFirstIndex
+
+class TestVectorization(unittest.TestCase):
+    def test_same_indices(self):
+        """The native scans return the indices of a Python loop, for each operator, range and expected result"""
+        random.seed(0)
+
+        for _ in range(1000):
+            typecode: str = random.choice("bBhiqfd")
+            items: array = array(typecode, (random.randrange(10) for _ in range(random.randrange(15))))
+            comparison: Comparison[float] = Comparison[float](random.choice(list(ComparisonOperator)), random.randrange(10) + random.choice((0, 0.5)))
+            expected: bool = random.random() < 0.5
+            start, stop, _ = slice(random.randrange(5), random.choice((None, random.randrange(20)))).indices(len(items))
+            index: int = next((i for i in range(start, stop) if comparison(items[i]) == expected), -1)
+
+            for _items in (items, memoryview(items)):
+                with self.subTest(items = _items, comparison = (comparison.GetOperator(), comparison.GetValue()), start = start, stop = stop, expected = expected):
+                    self.assertEqual(TryFindFirstIndex(_items, comparison, start, stop, expected), index)
+
+                    if comparison.GetOperator() == ComparisonOperator.Equal and expected:
+                        self.assertEqual(TryGetIndexOf(_items, comparison.GetValue(), start, stop), index)
+
+    def test_unsupported(self):
+        """The items and predicates that cannot be scanned natively are left to the caller"""
+        self.assertIsNone(TryGetIndexOf([1, 2], 2))
+        self.assertIsNone(TryFindFirstIndex(array('i', [1, 2]), lambda item: item == 2))
+        self.assertIsNone(TryGetIndexOf(memoryview(bytes(8)).cast('B', (2, 4)), 0))
+
+    def test_callers(self):
+        """GetIndexOf and the Loop helpers give the same results with native scans"""
+        items: array = array('d', [1.5, 2, 3, 2])
+
+        self.assertEqual(GetIndexOf(items, 2, 2).GetKey(), 3)
+        self.assertIsNone(IndexOf(items, 4))
+        self.assertEqual(ContainsOnlyOne(memoryview(items), 3), ContainsOnlyOne(list(items), 3))
+
+        for predicate, expected in ((Comparison(ComparisonOperator.Greater, 2.5), (True, False)), (Comparison(ComparisonOperator.Less, 4), (True, True)), (Comparison(ComparisonOperator.Greater, 5), (False, False))):
+            with self.subTest(predicate = (predicate.GetOperator(), predicate.GetValue())):
+                self.assertEqual((ForEachItemUntil(items, predicate), ForEachItem(items, predicate)), expected)
+                self.assertEqual((ForEachItemUntil(list(items), predicate), ForEachItem(list(items), predicate)), expected)
+
+        self.assertIsNone(ForEachItemUntil(array('i'), Comparison(ComparisonOperator.Equal, 0)))
+        self.assertIsNone(ForEachItem(array('i'), Comparison(ComparisonOperator.Equal, 0)))
+
+@unittest.skipUnless(numpy, "NumPy is not installed")
+class TestNdarray(unittest.TestCase):
+    def test_same_indices(self):
+        """The scans of NumPy arrays return the indices of a Python loop, for each operator, range and expected result"""
+        random.seed(0)
+
+        for _ in range(1000):
+            dtype: str = random.choice(("bool", "int8", "uint8", "int64", "float32", "float64"))
+            items = numpy.array([random.randrange(10) for _ in range(random.randrange(15))], dtype)
+            comparison: Comparison[float] = Comparison[float](random.choice(list(ComparisonOperator)), random.randrange(-1, 10) + random.choice((0, 0.5)))
+            expected: bool = random.random() < 0.5
+            start, stop, _ = slice(random.randrange(5), random.choice((None, random.randrange(20)))).indices(len(items))
+            index: int = next((i for i in range(start, stop) if comparison(items[i].item()) == expected), -1)
+
+            with self.subTest(items = items, comparison = (comparison.GetOperator(), comparison.GetValue()), start = start, stop = stop, expected = expected):
+                self.assertIn(TryFindFirstIndex(items, comparison, start, stop, expected), (index, None))
+
+    def test_exact_values(self):
+        """The values that the type of the items cannot represent exactly are compared as Python does, or left to the caller"""
+        large: int = 2 ** 53
+
+        self.assertEqual(TryGetIndexOf(numpy.array([large, large + 1], numpy.int64), large + 1), 1)
+        self.assertEqual(GetIndexOf(numpy.array([large, large + 1], numpy.int64), large + 1).GetKey(), 1)
+        self.assertEqual(TryGetIndexOf(numpy.array([large + 1, large], numpy.int64), float(large)), 1)
+        self.assertEqual(TryGetIndexOf(numpy.array([1, 2], numpy.int64), 2.0), 1)
+        self.assertEqual(TryGetIndexOf(numpy.array([1.5, 2], numpy.float32), 1.5), 0)
+
+        self.assertIsNone(TryGetIndexOf(numpy.array([1, 2], numpy.int64), 1.5))
+        self.assertIsNone(TryGetIndexOf(numpy.array([1, 2], numpy.uint8), 256))
+        self.assertIsNone(TryGetIndexOf(numpy.array([1, 2], numpy.uint8), -1))
+        self.assertIsNone(TryGetIndexOf(numpy.array([float(large)]), large + 1))
+        self.assertIsNone(TryGetIndexOf(numpy.array([0.0]), 1 << 1100))
+        self.assertIsNone(TryGetIndexOf(numpy.array([[1, 2]]), 1))
+
+if __name__ == '__main__':
+    unittest.main()
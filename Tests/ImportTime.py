@@ -0,0 +1,56 @@
+"""
+Tests unitaires pour les modules importés par les sous-paquets de WinCopies
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+__root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def getRoot() -> str:
+    return __root
+
+def run(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, *options, "-c", code], cwd = getRoot(), capture_output = True, text = True)
+
+# The module imported for each top-level subpackage, which is its most used one, and the prefixes of the modules that importing it must not import.
+__forbiddenImports: dict[str, tuple[str, tuple[str, ...]]] = {
+    "Collections": ("WinCopies.Collections", ("WinCopies.Collections.Enumeration", "WinCopies.Collections.Parallel", "WinCopies.Collections.Vectorization", "WinCopies.Data", "WinCopies.IO", "concurrent", "inspect")),
+    "Data": ("WinCopies.Data.SQLite", ("WinCopies.IO", "WinCopies.Collections.Parallel", "concurrent", "inspect")),
+    "Drawing": ("WinCopies.Drawing", ("WinCopies.Collections", "WinCopies.Typing", "inspect")),
+    "IO": ("WinCopies.IO", ("WinCopies.Data", "WinCopies.Collections.Parallel", "WinCopies.Collections.Vectorization", "concurrent", "inspect", "sqlite3")),
+    "Math": ("WinCopies.Math", ("WinCopies.Collections", "WinCopies.Typing", "inspect")),
+    "String": ("WinCopies.String", ("WinCopies.Collections", "WinCopies.Typing", "inspect")),
+    "Typing": ("WinCopies.Typing.Reflection", ("WinCopies.Collections.Enumeration", "WinCopies.Data", "WinCopies.IO", "concurrent", "inspect"))}
+
+def getForbiddenImports() -> dict[str, tuple[str, tuple[str, ...]]]:
+    return __forbiddenImports
+
+class TestDeferredImports(unittest.TestCase):
+    def assertNotImported(self, module: str, prefixes: tuple[str, ...]):
+        # The modules are listed in a new interpreter, so that those imported by the other tests are not. They are listed once module is imported, so that a module already imported at startup fails the test instead of being ignored. site is not imported, as the .pth files of the installed packages can import inspect at startup.
+        result: subprocess.CompletedProcess[str] = run(f"import sys, {module}; print(sorted(name for name in sys.modules if name.startswith({prefixes!r})))", "-S")
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_subpackages(self):
+        """Importing a top-level subpackage does not import the modules it does not need"""
+        for (subpackage, (module, prefixes)) in getForbiddenImports().items():
+            with self.subTest(subpackage = subpackage):
+                self.assertNotImported(module, prefixes)
+
+    def test_recursive_does_not_import_parallel(self):
+        """Importing the recursive enumerators does not import Parallel, which only the parallel recursive enumerable uses"""
+        self.assertNotImported("WinCopies.Collections.Enumeration.Recursive", ("WinCopies.Collections.Parallel", "concurrent"))
+
+    def test_all_subpackages_checked(self):
+        """Each top-level subpackage has its list of forbidden imports"""
+        root: str = os.path.join(getRoot(), "WinCopies")
+
+        self.assertEqual(sorted(name for name in os.listdir(root) if not name.startswith("_") and os.path.isfile(os.path.join(root, name, "__init__.py"))), sorted(getForbiddenImports()))
+
+if __name__ == '__main__':
+    unittest.main()
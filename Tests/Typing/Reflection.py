@@ -0,0 +1,242 @@
+"""
+Tests unitaires pour les gardes d'appel et les caches de types (WinCopies.Typing.Reflection)
+"""
+
+import gc
+import os
+import subprocess
+import sys
+import unittest
+import weakref
+
+from abc import ABC
+from types import ModuleType
+
+from WinCopies.Assertion import AreGuardsEnabled
+from WinCopies.Collections.Linked.Doubly import List
+from WinCopies.Typing import Reflection
+from WinCopies.Typing.Reflection import IsDirectModuleCall, IsDirectPackageCall, EnsureDirectModuleCall, IsSubclassOf, ImplementsAll, IsOf, IsFromAll, AreInstances, GetMethods, ClearTypeCache, TryGetModuleFromFrame, TryIsModuleInPackageFromFrame, TryFindModuleFromFileName, ClearModuleCache
+
+__root: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def getRoot() -> str:
+    return __root
+
+def guarded() -> None:
+    EnsureDirectModuleCall()
+
+def isDirectModuleCall() -> bool|None:
+    return IsDirectModuleCall()
+def isDirectPackageCall() -> bool|None:
+    return IsDirectPackageCall()
+
+def runWithGuards(value: str, code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, "-c", code], cwd = getRoot(), env = dict(os.environ, WINCOPIES_GUARDS = value), capture_output = True, text = True)
+
+class TestGuards(unittest.TestCase):
+    def test_guards_enabled_by_default(self):
+        if "WINCOPIES_GUARDS" not in os.environ:
+            self.assertEqual(AreGuardsEnabled(), __debug__)
+
+    def test_is_direct_call_same_module(self):
+        self.assertTrue(isDirectModuleCall())
+        self.assertTrue(isDirectPackageCall())
+
+    def test_ensure_direct_module_call_same_module(self):
+        guarded()
+
+    def test_ensure_direct_module_call_other_module(self):
+        if AreGuardsEnabled():
+            with self.assertRaises(AssertionError):
+                List[int]()._SetFirst(None)
+
+    def test_guards_on(self):
+        result: subprocess.CompletedProcess[str] = runWithGuards("1", "from WinCopies.Collections.Linked.Doubly import List; List()._SetFirst(None)")
+
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("AssertionError", result.stderr)
+
+    def test_guards_off(self):
+        result: subprocess.CompletedProcess[str] = runWithGuards("0", "from WinCopies.Assertion import AreGuardsEnabled; from WinCopies.Collections.Linked.Doubly import List; List()._SetFirst(None); print(AreGuardsEnabled())")
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_guards_off_docstrings(self):
+        names: tuple[str, ...] = ("EnsureDirectModuleCall", "EnsureDirectPackageCall", "EnsureCallerPackage")
+        result: subprocess.CompletedProcess[str] = runWithGuards("0", f"from WinCopies.Typing import Reflection; print(repr([(getattr(Reflection, name).__doc__, getattr(Reflection, name).__name__) for name in {names!r}]))")
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), repr([(getattr(Reflection, name).__doc__, getattr(Reflection, name).__name__) for name in names]))
+
+class Interface(ABC):
+    pass
+
+class Base:
+    @classmethod
+    def Create(cls) -> "Base":
+        return cls()
+
+class Derived(Base):
+    pass
+
+class TestTypeCache(unittest.TestCase):
+    def setUp(self):
+        ClearTypeCache()
+
+    def test_subclass_checks(self):
+        for _ in range(2):
+            self.assertTrue(IsSubclassOf(Derived, Interface, Base))
+            self.assertFalse(IsSubclassOf(Derived, Interface))
+            self.assertTrue(ImplementsAll(Derived, Base, object))
+            self.assertFalse(ImplementsAll(Derived, Base, Interface))
+            self.assertTrue(IsOf(Derived(), Interface, Base))
+            self.assertFalse(IsFromAll(Derived(), Interface))
+
+    def test_register_invalidates(self):
+        class Registered:
+            pass
+
+        class Abstract(ABC):
+            pass
+
+        self.assertFalse(IsSubclassOf(Registered, Abstract))
+
+        Abstract.register(Registered)
+
+        self.assertTrue(IsSubclassOf(Registered, Abstract))
+        self.assertTrue(ImplementsAll(Registered, Abstract))
+
+    def test_are_instances(self):
+        self.assertTrue(AreInstances(Base, Base(), Derived(), Derived()))
+        self.assertFalse(AreInstances(Derived, Derived(), Base()))
+        self.assertTrue(AreInstances((int, str), 1, "a"))
+        self.assertTrue(AreInstances(int))
+
+    def test_get_methods(self):
+        for _ in range(2):
+            methods = list(GetMethods(Derived()))
+
+            self.assertEqual([method.GetKey() for method in methods], ["Create"])
+            self.assertIsInstance(methods[0].GetValue()(), Derived)
+
+    def test_classes_are_not_kept_alive(self):
+        cls: type = type("Dynamic", (Base,), {})
+        reference: weakref.ref[type] = weakref.ref(cls)
+
+        IsSubclassOf(cls, Interface, Base)
+        ImplementsAll(cls, Base)
+        AreInstances(Base, cls())
+        list(GetMethods(cls()))
+
+        del cls
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_types_are_not_kept_alive(self):
+        cls: type = type("Dynamic", (Base,), {})
+        reference: weakref.ref[type] = weakref.ref(cls)
+
+        # The class is checked against, and not checked.
+        IsSubclassOf(int, cls)
+        IsSubclassOf(Base, cls)
+        ImplementsAll(Derived, Base, cls)
+        AreInstances(cls, cls(), Base())
+
+        del cls
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+class TestModuleCache(unittest.TestCase):
+    def setUp(self):
+        self.__names: list[str] = []
+
+    def tearDown(self):
+        for name in self.__names:
+            sys.modules.pop(name, None)
+
+    def addModule(self, name: str, fileName: str) -> ModuleType:
+        module: ModuleType = ModuleType(name)
+        module.__file__ = fileName
+        sys.modules[name] = module
+
+        self.__names.append(name)
+
+        return module
+
+    def test_hit(self):
+        frame = sys._getframe()
+        result = TryGetModuleFromFrame(frame)
+
+        self.assertIs(result.TryGetValue(), sys.modules[__name__])
+        self.assertIs(TryGetModuleFromFrame(frame), result)
+        self.assertIs(TryFindModuleFromFileName(sys.modules[__name__].__file__), sys.modules[__name__])
+        self.assertIs(TryFindModuleFromFileName(sys.modules[__name__].__file__), sys.modules[__name__])
+
+    def test_replaced_module(self):
+        first: ModuleType = self.addModule("WinCopiesTestModule", "first.py")
+        code = compile("frame = sys._getframe()", "<test>", "exec")
+        values: dict[str, object] = {"__name__": "WinCopiesTestModule", "sys": sys}
+
+        exec(code, values)
+
+        self.assertIs(TryGetModuleFromFrame(values["frame"]).TryGetValue(), first)
+        self.assertIs(TryFindModuleFromFileName("first.py"), first)
+        self.assertFalse(TryIsModuleInPackageFromFrame(values["frame"], "WinCopies"))
+
+        # The module is replaced in place, which does not change the length of sys.modules.
+        second: ModuleType = ModuleType("WinCopiesTestModule")
+        second.__file__ = os.path.join(getRoot(), "WinCopies", "Second.py")
+        sys.modules["WinCopiesTestModule"] = second
+
+        self.assertIs(TryGetModuleFromFrame(values["frame"]).TryGetValue(), second)
+        self.assertIsNone(TryFindModuleFromFileName("first.py"))
+        self.assertIs(TryFindModuleFromFileName(second.__file__), second)
+        self.assertTrue(TryIsModuleInPackageFromFrame(values["frame"], "WinCopies"))
+
+    def test_miss(self):
+        self.assertIsNone(TryFindModuleFromFileName("missing.py"))
+
+        # The miss is cached until the length of sys.modules changes.
+        replaced: ModuleType = self.addModule("WinCopiesTestReplaced", "replaced.py")
+
+        self.assertIsNone(TryFindModuleFromFileName("missing.py"))
+
+        missing: ModuleType = ModuleType("WinCopiesTestReplaced")
+        missing.__file__ = "missing.py"
+        sys.modules["WinCopiesTestReplaced"] = missing
+
+        self.assertIsNone(TryFindModuleFromFileName("missing.py"))
+
+        ClearModuleCache()
+
+        self.assertIs(TryFindModuleFromFileName("missing.py"), missing)
+
+        added: ModuleType = self.addModule("WinCopiesTestAdded", "added.py")
+
+        self.assertIs(TryFindModuleFromFileName("added.py"), added)
+        self.assertIsNone(TryFindModuleFromFileName(replaced.__file__))
+
+    def test_other_globals(self):
+        first: ModuleType = self.addModule("WinCopiesTestFirst", os.path.join(getRoot(), "WinCopies", "First.py"))
+        second: ModuleType = self.addModule("WinCopiesTestSecond", "Second.py")
+        code = compile("frame = sys._getframe()", "<test>", "exec")
+        frames: list[object] = []
+
+        # The same code object is run with the globals of each module.
+        for module in (first, second, first):
+            values: dict[str, object] = {"__name__": module.__name__, "sys": sys}
+
+            exec(code, values)
+
+            frames.append(values["frame"])
+
+        for frame, module, inPackage in zip(frames, (first, second, first), (True, False, True)):
+            with self.subTest(module = module.__name__):
+                self.assertIs(TryGetModuleFromFrame(frame).TryGetValue(), module)
+                self.assertEqual(TryIsModuleInPackageFromFrame(frame, "WinCopies"), inPackage)
+
+if __name__ == '__main__':
+    unittest.main()
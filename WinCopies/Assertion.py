@@ -1,6 +1,24 @@
 from enum import Enum, Flag
+from os import environ
 from typing import Callable, Type
 
+def __GetGuardsEnabled() -> bool:
+    value: str|None = environ.get("WINCOPIES_GUARDS")
+
+    return __debug__ if value is None else value.strip().lower() not in ("0", "false", "off", "no")
+
+__guardsEnabled: bool = __GetGuardsEnabled()
+
+def AreGuardsEnabled() -> bool:
+    """Checks whether runtime call-site guards are enabled.
+
+    The value is read once, when this module is imported. Guards are enabled unless Python runs with optimizations (-O). The WINCOPIES_GUARDS environment variable overrides this: '0', 'false', 'off' and 'no' disable the guards, any other value enables them.
+
+    Returns:
+        True if guards are enabled, False otherwise.
+    """
+    return __guardsEnabled
+
 def GetAssertionError(errorMessage: str|None = "Invalid operation."):
     """Creates an AssertionError with the specified message.
 
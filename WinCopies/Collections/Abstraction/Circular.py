@@ -75,7 +75,7 @@ class CircularArrayBase[TItem, TList](CircularBase[TItem, TList], ArrayBase[TIte
         self._GetSpecializedContainer().SetAt(key, value)
 class CircularArray[T](CircularArrayBase[T, ICircularArray[T]], IGenericSpecializedConstraintImplementation[ICircularTuple[T], ICircularArray[T]]):
     @final
-    class __Reversed(ArrayBase[T, ICircularArray[T]].Reversed, ICircularArray[T], IGenericSpecializedConstraintImplementation[ITuple[T], ICircularArray[T]]):
+    class Reversed(ArrayBase[T, ICircularArray[T]].Reversed, ICircularArray[T], IGenericSpecializedConstraintImplementation[ITuple[T], ICircularArray[T]]):
         def __init__(self, items: ICircularArray[T]):
             super().__init__(items)
         
@@ -90,7 +90,7 @@ class CircularArray[T](CircularArrayBase[T, ICircularArray[T]], IGenericSpeciali
             self.__array: ICircularArray[T] = array
         
         def _GetValue(self) -> ICircularArray[T]:
-            return CircularArray[T].__Reversed(self.__array)
+            return CircularArray[T].Reversed(self.__array)
     
     def __init__(self, items: ICircularArray[T]):
         super().__init__(items)
@@ -108,7 +108,7 @@ class CircularArray[T](CircularArrayBase[T, ICircularArray[T]], IGenericSpeciali
         return self._GetContainer().SliceAt(key)
 class CircularList[T](CircularArrayBase[T, ICircularList[T]], MutableSequence[T], ICircularList[T], IGenericSpecializedConstraintImplementation[ICircularTuple[T], ICircularList[T]]):
     @final
-    class __Reversed(ReversedListBase[T, ICircularList[T]], ICircularList[T], IGenericSpecializedConstraintImplementation[ITuple[T], ICircularList[T]]):
+    class Reversed(ReversedListBase[T, ICircularList[T]], ICircularList[T], IGenericSpecializedConstraintImplementation[ITuple[T], ICircularList[T]]):
         def __init__(self, items: ICircularList[T]):
             super().__init__(items)
         
@@ -126,7 +126,7 @@ class CircularList[T](CircularArrayBase[T, ICircularList[T]], MutableSequence[T]
             self.__array: ICircularList[T] = array
         
         def _GetValue(self) -> ICircularList[T]:
-            return CircularList[T].__Reversed(self.__array)
+            return CircularList[T].Reversed(self.__array)
     
     def __init__(self, items: ICircularList[T]):
         super().__init__(items)
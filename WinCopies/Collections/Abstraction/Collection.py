@@ -4,7 +4,7 @@ from collections.abc import Iterable, Iterator, Sequence, MutableSequence as Mut
 from typing import overload, final, SupportsIndex
 
 from WinCopies import IStringable
-from WinCopies.Collections import Enumeration, Extensions, Move
+from WinCopies.Collections import Enumeration, Extensions, SequenceIndex, Move
 from WinCopies.Collections.Enumeration import ICountableEnumerable, IEnumerator, CountableEnumerable, EnumeratorBase, TryAsEnumerator
 from WinCopies.Collections.Extensions import ITuple, IEquatableTuple, IArray, IList, MutableSequence
 from WinCopies.Typing import GenericConstraint, GenericSpecializedConstraint, IGenericConstraintImplementation, IGenericSpecializedConstraintImplementation, IEquatableItem
@@ -32,7 +32,9 @@ class TupleBase[TItem, TSequence](Extensions.Sequence[TItem], Extensions.TupleBa
     
     @final
     def Contains(self, value: TItem|object) -> bool:
-        return value in self._GetInnerContainer()
+        index: SequenceIndex[TItem]|None = self.TryGetSequenceIndex()
+
+        return value in self._GetInnerContainer() if index is None else index.Contains(value)
     
     @overload
     def __getitem__(self, index: SupportsIndex) -> TItem: ...
@@ -197,8 +199,12 @@ class Dictionary[TKey: IEquatableItem, TValue](Extensions.Dictionary[TKey, TValu
             return iter(self._GetDictionary().values())
     @final
     class Enumerator(EnumeratorBase[IKeyValuePair[TKey, TValue]]):
+        __slots__ = ("__dictionary", "__iterator", "__current")
+
         @final
         class KeyValuePair(IKeyValuePair[TKey, TValue]):
+            __slots__ = ("__item",)
+
             def __init__(self, item: tuple[TKey, TValue]):
                 super().__init__()
                 
@@ -267,6 +273,9 @@ class Dictionary[TKey: IEquatableItem, TValue](Extensions.Dictionary[TKey, TValu
         
         def _ResetOverride(self) -> bool:
             return True
+        
+        def _TryGetNativeIterator(self) -> Iterator[IKeyValuePair[TKey, TValue]]|None:
+            return map(Dictionary.Enumerator.KeyValuePair, self.__dictionary.items())
     
     @final
     class __None(Singleton):
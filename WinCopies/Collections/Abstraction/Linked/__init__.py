@@ -163,10 +163,16 @@ class LinkedListBase[TItem, TList](ListBase[TItem], GenericConstraint[TList, IRe
     @final
     def TryPeek(self) -> INullable[TItem]:
         return self._GetInnerContainer().TryGetFirst()
+    @final
+    def TryPeekValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        return self._GetInnerContainer().TryGetFirstValue(default)
     
     @final
     def TryPop(self) -> INullable[TItem]:
         return self._GetInnerContainer().TryRemoveFirst()
+    @final
+    def TryPopValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        return self._GetInnerContainer().TryRemoveFirstValue(default)
     
     @final
     def Clear(self) -> None:
@@ -178,7 +184,7 @@ class QueueBase[TItems, TList](LinkedListBase[TItems, TList]):
     
     @final
     def Push(self, value: TItems) -> None:
-        self._GetInnerContainer().AddLastNode(value)
+        self._GetInnerContainer().AddLastValues(value)
     @final
     def TryPushItems(self, items: Iterable[TItems]|None) -> bool:
         return self._GetInnerContainer().AddLastItems(items)
@@ -188,7 +194,7 @@ class StackBase[TItems, TList](LinkedListBase[TItems, TList]):
     
     @final
     def Push(self, value: TItems) -> None:
-        self._GetInnerContainer().AddFirstNode(value)
+        self._GetInnerContainer().AddFirstValues(value)
     @final
     def TryPushItems(self, items: Iterable[TItems]|None) -> bool:
         return self._GetInnerContainer().AddFirstItems(items)
@@ -246,7 +252,7 @@ class EnumerableQueue[T](QueueBase[T, IDoublyLinkedList[T]], _ReadOnlyEnumerable
     
     @final
     def AsIterable(self) -> Iterable[T]:
-        return Enumerable[T](self._GetContainer()).AsIterable()
+        return Enumerable[T].Create(self._GetContainer()).AsIterable()
 class EnumerableStack[T](StackBase[T, IDoublyLinkedList[T]], _ReadOnlyEnumerableList[T], IGenericConstraintImplementation[IDoublyLinkedList[T]]):
     def __init__(self, l: IDoublyLinkedList[T]|None = None):
         super().__init__(_GetList(l))
@@ -257,7 +263,7 @@ class EnumerableStack[T](StackBase[T, IDoublyLinkedList[T]], _ReadOnlyEnumerable
     
     @final
     def AsIterable(self) -> Iterable[T]:
-        return Enumerable[T](self._GetContainer()).AsIterable()
+        return Enumerable[T].Create(self._GetContainer()).AsIterable()
 
 class CountableEnumerableQueue[T](QueueBase[T, ICountableDoublyLinkedList[T]], _ReadOnlyCountableEnumerableList[T], IGenericConstraintImplementation[ICountableDoublyLinkedList[T]]):
     def __init__(self, l: ICountableDoublyLinkedList[T]|None = None):
@@ -269,7 +275,7 @@ class CountableEnumerableQueue[T](QueueBase[T, ICountableDoublyLinkedList[T]], _
     
     @final
     def AsIterable(self) -> Iterable[T]:
-        return Enumerable[T](self._GetContainer()).AsIterable()
+        return Enumerable[T].Create(self._GetContainer()).AsIterable()
     
     @final
     def GetCount(self) -> int:
@@ -284,7 +290,7 @@ class CountableEnumerableStack[T](StackBase[T, ICountableDoublyLinkedList[T]], _
     
     @final
     def AsIterable(self) -> Iterable[T]:
-        return Enumerable[T](self._GetContainer()).AsIterable()
+        return Enumerable[T].Create(self._GetContainer()).AsIterable()
     
     @final
     def GetCount(self) -> int:
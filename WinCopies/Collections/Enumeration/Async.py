@@ -0,0 +1,473 @@
+from abc import abstractmethod
+from asyncio import CancelledError, Future, gather, get_running_loop, shield
+from collections.abc import AsyncIterable as SystemAsyncIterable, AsyncIterator as SystemAsyncIterator, AsyncGenerator
+from concurrent.futures import Executor
+from typing import final
+
+from WinCopies import IInterface
+from WinCopies.Collections.Enumeration import IEnumerable, IEnumerator, MoveNextBatch
+from WinCopies.Typing.Delegate import Function
+
+class IAsyncEnumeratorBase(IInterface):
+    __slots__ = ()
+    
+    def __init__(self):
+        super().__init__()
+    
+    @abstractmethod
+    def IsStarted(self) -> bool:
+        pass
+    @abstractmethod
+    async def MoveNextAsync(self) -> bool:
+        pass
+    @abstractmethod
+    async def StopAsync(self) -> None:
+        pass
+    @abstractmethod
+    async def TryResetAsync(self) -> bool|None:
+        pass
+    @abstractmethod
+    def IsResetSupported(self) -> bool:
+        pass
+    @abstractmethod
+    def HasProcessedItems(self) -> bool:
+        pass
+class IAsyncEnumerator[T](IAsyncEnumeratorBase):
+    __slots__ = ()
+    
+    def __init__(self):
+        super().__init__()
+    
+    @abstractmethod
+    def GetCurrent(self) -> T|None:
+        pass
+    
+    @abstractmethod
+    def AsAsyncIterator(self) -> SystemAsyncIterator[T]:
+        pass
+
+class AsyncIteratorBase[T](SystemAsyncIterator[T], IAsyncEnumerator[T]):
+    __slots__ = ()
+    
+    def __init__(self):
+        super().__init__()
+    
+    @final
+    async def __anext__(self) -> T:
+        if await self.MoveNextAsync():
+            current: T|None = self.GetCurrent()
+            
+            if current is not None:
+                return current
+        
+        raise StopAsyncIteration
+    
+    @final
+    def AsAsyncIterator(self) -> SystemAsyncIterator[T]:
+        return self
+    
+    @final
+    def __aiter__(self) -> SystemAsyncIterator[T]:
+        return self
+
+class IAsyncEnumerable[T](IInterface):
+    def __init__(self):
+        super().__init__()
+    
+    @abstractmethod
+    def TryGetAsyncEnumerator(self) -> IAsyncEnumerator[T]|None:
+        pass
+    @final
+    def GetAsyncEnumerator(self) -> IAsyncEnumerator[T]:
+        return GetAsyncEnumerator(self.TryGetAsyncEnumerator())
+    
+    @abstractmethod
+    def AsAsyncIterable(self) -> SystemAsyncIterable[T]:
+        pass
+
+@final
+class __EmptyAsyncEnumerator[T](AsyncIteratorBase[T]):
+    def __init__(self):
+        super().__init__()
+    
+    def IsStarted(self) -> bool:
+        return False
+    def GetCurrent(self) -> T|None:
+        return None
+    async def MoveNextAsync(self) -> bool:
+        return False
+    async def StopAsync(self) -> None:
+        pass
+    async def TryResetAsync(self) -> bool|None:
+        return None
+    def IsResetSupported(self) -> bool:
+        return False
+    def HasProcessedItems(self) -> bool:
+        return False
+
+__emptyAsyncEnumerator = __EmptyAsyncEnumerator[None]()
+
+def GetEmptyAsyncEnumerator[T]() -> IAsyncEnumerator[T]: # type: ignore
+    return __emptyAsyncEnumerator # type: ignore
+
+def GetAsyncEnumerator[T](enumerator: IAsyncEnumerator[T]|None) -> IAsyncEnumerator[T]:
+    return GetEmptyAsyncEnumerator() if enumerator is None else enumerator
+
+class AsyncEnumerable[T](SystemAsyncIterable[T], IAsyncEnumerable[T]):
+    def __init__(self):
+        super().__init__()
+    
+    def AsAsyncIterable(self) -> SystemAsyncIterable[T]:
+        return self
+    
+    @final
+    def __aiter__(self) -> SystemAsyncIterator[T]:
+        return self.GetAsyncEnumerator().AsAsyncIterator()
+
+class AsyncEnumeratorBase[T](AsyncIteratorBase[T]):
+    __slots__ = ("__state", "__isStarted", "__hasProcessedItems")
+    
+    # The states of the enumeration, as for EnumeratorBase.
+    __NotStarted: int = 0
+    __Running: int = 1
+    __Ended: int = 2
+    
+    def __init__(self):
+        super().__init__()
+        
+        self.__state: int = self.__NotStarted
+        self.__isStarted: bool = False
+        self.__hasProcessedItems: bool = False
+    
+    @final
+    async def __StartAsync(self) -> bool:
+        if self._OnStarting():
+            self.__isStarted = True
+            
+            if await self._MoveNextOverrideAsync():
+                self.__state = self.__Running
+                
+                self.__hasProcessedItems = True
+                
+                return True
+        
+        self.__Complete()
+        
+        return False
+    
+    @final
+    def __Complete(self) -> None:
+        self.__state = self.__Ended
+        
+        self.__OnCompleted()
+    
+    @final
+    def __OnTerminated(self, completed: bool) -> None:
+        self.__isStarted = False
+        
+        self._OnTerminated(completed)
+        self._OnEnded()
+    
+    @final
+    def __OnCompleted(self) -> None:
+        self.__OnTerminated(True)
+        self._OnCompleted()
+    
+    @final
+    def IsStarted(self) -> bool:
+        return self.__isStarted
+    
+    @abstractmethod
+    async def _MoveNextOverrideAsync(self) -> bool:
+        pass
+    @abstractmethod
+    async def _ResetOverrideAsync(self) -> bool:
+        pass
+    def _OnStarting(self) -> bool:
+        return True
+    def _OnCompleted(self) -> None:
+        pass
+    @abstractmethod
+    async def _OnStoppedAsync(self) -> None:
+        pass
+    def _OnTerminated(self, completed: bool) -> None:
+        pass
+    def _OnEnded(self) -> None:
+        pass
+    
+    @final
+    async def MoveNextAsync(self) -> bool:
+        state: int = self.__state
+        
+        if state == self.__Running:
+            if await self._MoveNextOverrideAsync():
+                return True
+            
+            self.__Complete()
+            
+            return False
+        
+        return await self.__StartAsync() if state == self.__NotStarted else False
+    
+    @final
+    async def StopAsync(self) -> None:
+        self.__OnTerminated(False)
+        
+        await self._OnStoppedAsync()
+    
+    @final
+    async def TryResetAsync(self) -> bool|None:
+        if self.IsResetSupported():
+            if self.IsStarted():
+                await self.StopAsync()
+            
+            if await self._ResetOverrideAsync():
+                self.__state = self.__NotStarted
+                self.__hasProcessedItems = False
+                
+                return True
+            
+            self.__state = self.__Ended
+            
+            return False
+        
+        self.__state = self.__Ended
+        
+        return None
+    
+    @final
+    def HasProcessedItems(self) -> bool:
+        return self.__hasProcessedItems
+
+class AsyncEnumerator[T](AsyncEnumeratorBase[T]):
+    __slots__ = ("__current",)
+    
+    def __init__(self):
+        super().__init__()
+        
+        self.__current: T|None = None
+    
+    def _OnEnded(self) -> None:
+        self.__current = None
+        
+        super()._OnEnded()
+    
+    @final
+    def GetCurrent(self) -> T|None:
+        return self.__current
+    
+    @final
+    def _SetCurrent(self, current: T|None) -> None:
+        self.__current = current
+
+class AsyncIterator[T](AsyncEnumerator[T]):
+    __slots__ = ("__iterator",)
+    
+    def __init__(self, iterator: SystemAsyncIterator[T]):
+        super().__init__()
+        
+        self.__iterator: SystemAsyncIterator[T] = iterator
+    
+    @final
+    def _GetIterator(self) -> SystemAsyncIterator[T]:
+        return self.__iterator
+    
+    @final
+    def IsResetSupported(self) -> bool:
+        return False
+    
+    async def _MoveNextOverrideAsync(self) -> bool:
+        try:
+            self._SetCurrent(await self.__iterator.__anext__())
+            
+            return True
+        except StopAsyncIteration:
+            self._SetCurrent(None)
+            
+            return False
+    
+    async def _OnStoppedAsync(self) -> None:
+        # An async generator cannot be resumed once stopped, so it is closed for its finally blocks to run in the current event loop.
+        if isinstance(self.__iterator, AsyncGenerator):
+            await self.__iterator.aclose()
+    
+    async def _ResetOverrideAsync(self) -> bool:
+        return False
+    
+    @staticmethod
+    def Create(iterator: SystemAsyncIterator[T]) -> IAsyncEnumerator[T]:
+        return iterator if isinstance(iterator, IAsyncEnumerator) else AsyncIterator(iterator)
+    @staticmethod
+    def TryCreate(iterator: SystemAsyncIterator[T]|None) -> IAsyncEnumerator[T]|None:
+        return None if iterator is None else AsyncIterator[T].Create(iterator)
+
+class AsyncIterable[T](AsyncEnumerable[T]):
+    def __init__(self, iterable: SystemAsyncIterable[T]):
+        super().__init__()
+        
+        self.__iterable: SystemAsyncIterable[T] = iterable
+    
+    @final
+    def _GetIterable(self) -> SystemAsyncIterable[T]:
+        return self.__iterable
+    
+    @final
+    def TryGetAsyncEnumerator(self) -> IAsyncEnumerator[T]|None:
+        return AsyncIterator[T].Create(self.__iterable.__aiter__())
+    
+    @staticmethod
+    def Create(iterable: SystemAsyncIterable[T]) -> IAsyncEnumerable[T]:
+        return iterable if isinstance(iterable, IAsyncEnumerable) else AsyncIterable(iterable)
+    @staticmethod
+    def TryCreate(iterable: SystemAsyncIterable[T]|None) -> IAsyncEnumerable[T]|None:
+        return None if iterable is None else AsyncIterable[T].Create(iterable)
+
+class AsyncIteratorProvider[T](AsyncEnumerable[T]):
+    def __init__(self, iteratorProvider: Function[SystemAsyncIterator[T]|None]|None):
+        super().__init__()
+        
+        self.__iteratorProvider: Function[SystemAsyncIterator[T]|None]|None = iteratorProvider
+    
+    @final
+    def TryGetAsyncEnumerator(self) -> IAsyncEnumerator[T]|None:
+        return None if self.__iteratorProvider is None else AsyncIterator[T].TryCreate(self.__iteratorProvider())
+class AsyncEnumeratorProvider[T](AsyncEnumerable[T]):
+    def __init__(self, enumeratorProvider: Function[IAsyncEnumerator[T]|None]|None):
+        super().__init__()
+        
+        self.__enumeratorProvider: Function[IAsyncEnumerator[T]|None]|None = enumeratorProvider
+    
+    @final
+    def TryGetAsyncEnumerator(self) -> IAsyncEnumerator[T]|None:
+        return None if self.__enumeratorProvider is None else self.__enumeratorProvider()
+
+class ThreadedAsyncEnumerator[T](AsyncEnumerator[T]):
+    def __init__(self, enumerator: IEnumerator[T], executor: Executor|None = None, batchSize: int = 256):
+        if batchSize <= 0:
+            raise ValueError("batchSize must be greater than zero.")
+        
+        super().__init__()
+        
+        # The enumerator is only used by one thread at a time, but not always the same one unless a single-thread executor is given; objects bound to their thread, such as SQLite connections opened with check_same_thread, need one.
+        self.__enumerator: IEnumerator[T] = enumerator
+        self.__executor: Executor|None = executor
+        self.__batchSize: int = batchSize
+        self.__items: list[T] = []
+        self.__index: int = 0
+        self.__isCompleted: bool = False
+        self.__batch: Future[list[T]]|None = None
+    
+    @final
+    def _GetEnumerator(self) -> IEnumerator[T]:
+        return self.__enumerator
+    
+    @final
+    async def __RunAsync[TResult](self, func: Function[TResult]) -> TResult:
+        return await get_running_loop().run_in_executor(self.__executor, func)
+    
+    @final
+    def __ReadBatch(self) -> list[T]:
+        items: list[T] = []
+        
+        MoveNextBatch(self.__enumerator, items, self.__batchSize)
+        
+        return items
+    
+    @final
+    async def __ReadBatchAsync(self) -> list[T]:
+        batch: Future[list[T]]|None = self.__batch
+        
+        if batch is None:
+            self.__batch = batch = get_running_loop().run_in_executor(self.__executor, self.__ReadBatch)
+        
+        try:
+            # A cancelled call does not cancel the batch, which the executor keeps reading: it is kept for the next call so that its items are not lost.
+            items: list[T] = await shield(batch)
+        except CancelledError:
+            if batch.cancelled():
+                self.__batch = None
+            
+            raise
+        except BaseException:
+            self.__batch = None
+            
+            raise
+        
+        self.__batch = None
+        
+        return items
+    
+    @final
+    async def __DiscardBatchAsync(self) -> None:
+        batch: Future[list[T]]|None = self.__batch
+        
+        if batch is not None:
+            self.__batch = None
+            
+            # The enumerator must not be used by two threads at once, so the batch still read by a cancelled call is waited for before the enumerator is used again.
+            await gather(batch, return_exceptions = True)
+    
+    @final
+    def __Clear(self) -> None:
+        self.__items = []
+        self.__index = 0
+    
+    @final
+    def IsResetSupported(self) -> bool:
+        return self.__enumerator.IsResetSupported()
+    
+    async def _MoveNextOverrideAsync(self) -> bool:
+        if self.__index == len(self.__items):
+            if self.__isCompleted:
+                return False
+            
+            # Items are read per batch so that the event loop is not resumed for each of them.
+            items: list[T] = await self.__ReadBatchAsync()
+            
+            self.__isCompleted = len(items) < self.__batchSize
+            self.__items = items
+            self.__index = 0
+            
+            if len(items) == 0:
+                return False
+        
+        self._SetCurrent(self.__items[self.__index])
+        
+        self.__index += 1
+        
+        return True
+    
+    def _OnEnded(self) -> None:
+        self.__Clear()
+        
+        super()._OnEnded()
+    
+    async def _OnStoppedAsync(self) -> None:
+        await self.__DiscardBatchAsync()
+        await self.__RunAsync(self.__enumerator.Stop)
+    
+    async def _ResetOverrideAsync(self) -> bool:
+        await self.__DiscardBatchAsync()
+        
+        self.__Clear()
+        
+        self.__isCompleted = False
+        
+        return await self.__RunAsync(self.__enumerator.TryReset) is True
+class ThreadedAsyncEnumerable[T](AsyncEnumerable[T]):
+    def __init__(self, enumerable: IEnumerable[T], executor: Executor|None = None, batchSize: int = 256):
+        super().__init__()
+        
+        self.__enumerable: IEnumerable[T] = enumerable
+        self.__executor: Executor|None = executor
+        self.__batchSize: int = batchSize
+    
+    @final
+    def _GetEnumerable(self) -> IEnumerable[T]:
+        return self.__enumerable
+    
+    @final
+    def TryGetAsyncEnumerator(self) -> IAsyncEnumerator[T]|None:
+        enumerator: IEnumerator[T]|None = self.__enumerable.TryGetEnumerator()
+        
+        return None if enumerator is None else ThreadedAsyncEnumerator[T](enumerator, self.__executor, self.__batchSize)
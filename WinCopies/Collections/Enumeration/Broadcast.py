@@ -0,0 +1,166 @@
+from collections import deque
+from collections.abc import Iterable as SystemIterable
+from itertools import islice
+from threading import Condition
+from typing import final
+
+from WinCopies.Collections.Enumeration import IEnumerator
+from WinCopies.Collections.Enumeration.Shared import SharedSource, ChunkEnumerator
+from WinCopies.Typing import IDisposableInfo, GetDisposedError
+
+class Broadcaster[T](IDisposableInfo):
+    # Hands out count enumerators over a single enumeration of source, each one returning all the items of source. The enumerators can be used from different threads; source is only read by one of them at a time.
+    # The items are buffered from the first one that an enumerator has not read yet. If capacity is not None, the enumerator that reads source waits, once capacity items are buffered, until the slowest enumerator reads the first buffered item: the enumerators must then be used from different threads, or in turn. Otherwise, the buffer is unbounded.
+    # An enumerator that is stopped, or that is garbage collected while it is iterated natively, no longer holds the buffer; it cannot be used again.
+
+    # The maximum number of items copied at once by an enumerator, so that the lock is not taken for each item.
+    _ChunkSize: int = 256
+
+    @final
+    class __Enumerator(ChunkEnumerator[T]):
+        def __init__(self, broadcaster: Broadcaster[T], index: int):
+            super().__init__(Broadcaster._ChunkSize)
+
+            self.__broadcaster: Broadcaster[T] = broadcaster
+            self.__index: int = index
+
+        def IsResetSupported(self) -> bool:
+            return False
+
+        def _Read(self, position: int, items: list[T], count: int) -> None:
+            # The broadcaster keeps the position of each enumerator.
+            self.__broadcaster._Read(self.__index, items, count)
+
+        def _OnIterationEnded(self) -> None:
+            self.__broadcaster._Detach(self.__index)
+
+        def _ResetOverride(self) -> bool:
+            return False
+
+    def __init__(self, source: SystemIterable[T], count: int, capacity: int|None = 1024):
+        if count <= 0:
+            raise ValueError("count must be greater than zero.")
+
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity must be greater than zero.")
+
+        super().__init__()
+
+        self.__condition: Condition = Condition()
+        # source is read without the lock, so that the other enumerators can read the buffered items and be detached in the meantime.
+        self.__source: SharedSource[T] = SharedSource[T](source, self.__condition)
+        self.__capacity: int|None = capacity
+        # The buffer is a window on the items of source, from the index of its first item; it grows at its right when source is read and shrinks at its left when the slowest enumerator moves.
+        self.__buffer: deque[T] = deque()
+        self.__start: int = 0
+        # The index of the next item of each enumerator, or None once it is detached.
+        self.__positions: list[int|None] = [0] * count
+        self.__enumerators: tuple[IEnumerator[T], ...] = tuple(Broadcaster[T].__Enumerator(self, i) for i in range(count))
+        self.__isDisposed: bool = False
+
+    def __Trim(self) -> None:
+        start: int = min((position for position in self.__positions if position is not None), default = self.__start + len(self.__buffer))
+
+        if start > self.__start:
+            for _ in range(start - self.__start):
+                self.__buffer.popleft()
+
+            self.__start = start
+
+            self.__condition.notify_all()
+
+    @final
+    def _Detach(self, index: int) -> None:
+        with self.__condition:
+            if self.__positions[index] is not None:
+                self.__positions[index] = None
+
+                self.__Trim()
+
+    @final
+    def _Read(self, index: int, items: list[T], count: int) -> None:
+        # Adds the next items of the enumerator at index to items, reading at most count new items from source if this enumerator is the first one to need them. items is left empty when there are no more items.
+        with self.__condition:
+            while True:
+                if self.__isDisposed:
+                    raise GetDisposedError()
+
+                position: int|None = self.__positions[index]
+
+                if position is None:
+                    return
+
+                offset: int = position - self.__start
+
+                if offset < len(self.__buffer):
+                    length: int = len(items)
+
+                    items.extend(islice(self.__buffer, offset, offset + Broadcaster._ChunkSize))
+
+                    self.__positions[index] = position + len(items) - length
+
+                    if offset == 0:
+                        self.__Trim()
+
+                    return
+
+                # A completed source returns no items, or raises its error again once the buffered items are read.
+                if self.__capacity is not None and not self.__source.IsCompleted():
+                    if len(self.__buffer) >= self.__capacity:
+                        self.__condition.wait()
+
+                        continue
+
+                    count = min(count, self.__capacity - len(self.__buffer))
+
+                read: list[T]|None = self.__source.TryRead(count)
+
+                if read is None:
+                    continue
+
+                if self.__isDisposed:
+                    raise GetDisposedError()
+
+                # Only the buffered items were trimmed meanwhile, so read follows them.
+                self.__buffer.extend(read)
+
+                if self.__positions[index] is not None:
+                    self.__positions[index] = position + len(read)
+
+                    items.extend(read)
+
+                # The items are not kept if no other enumerator needs them.
+                self.__Trim()
+
+                return
+
+    @final
+    def GetCount(self) -> int:
+        return len(self.__enumerators)
+
+    @final
+    def GetEnumerator(self, index: int) -> IEnumerator[T]:
+        return self.__enumerators[index]
+    @final
+    def GetEnumerators(self) -> tuple[IEnumerator[T], ...]:
+        return self.__enumerators
+
+    @final
+    def GetBufferedCount(self) -> int:
+        with self.__condition:
+            return len(self.__buffer)
+
+    @final
+    def IsDisposed(self) -> bool:
+        return self.__isDisposed
+
+    def Dispose(self) -> None:
+        with self.__condition:
+            self.__isDisposed = True
+
+            self.__buffer.clear()
+
+            self.__source.Close()
+
+            # The enumerators that wait for the buffer to be read raise an error.
+            self.__condition.notify_all()
@@ -0,0 +1,178 @@
+import pickle
+
+from bisect import bisect_right
+from collections.abc import Iterable as SystemIterable
+from tempfile import TemporaryFile
+from threading import Condition
+from typing import final, BinaryIO
+
+from WinCopies.Collections.Enumeration import IEnumerator, Enumerable
+from WinCopies.Collections.Enumeration.Shared import SharedSource, ChunkEnumerator
+from WinCopies.Typing import IDisposableInfo, GetDisposedError
+
+class CachingEnumerable[T](Enumerable[T], IDisposableInfo):
+    # Enumerates its source only once, recording its items, so that the next enumerations, and the resets of the enumerators, are served from the record. Several enumerators can be used at once, from any thread, each at its own position.
+    # The first threshold items are kept in memory; the next ones are appended to a temporary file, as a pickle stream, which must then be able to pickle them. There is no limit if threshold is None.
+
+    # The number of items pickled at once, which is also the maximum number of items copied at once by an enumerator, so that the lock is not taken for each item.
+    _ChunkSize: int = 256
+
+    @final
+    class __Enumerator(ChunkEnumerator[T]):
+        def __init__(self, enumerable: CachingEnumerable[T]):
+            super().__init__(CachingEnumerable._ChunkSize)
+
+            self.__enumerable: CachingEnumerable[T] = enumerable
+
+        def IsResetSupported(self) -> bool:
+            return True
+
+        def _Read(self, position: int, items: list[T], count: int) -> None:
+            self.__enumerable._Read(position, items, count)
+
+    def __init__(self, source: SystemIterable[T], threshold: int|None = None):
+        if threshold is not None and threshold < 0:
+            raise ValueError("threshold must be greater than or equal to zero.")
+
+        super().__init__()
+
+        self.__condition: Condition = Condition()
+        # source is read without the lock, so that the other enumerators can replay the recorded items in the meantime.
+        self.__source: SharedSource[T] = SharedSource[T](source, self.__condition)
+        self.__threshold: int|None = threshold
+        self.__items: list[T] = []
+        # The items after the file, until there are enough of them to be written.
+        self.__pending: list[T] = []
+        self.__file: BinaryIO|None = None
+        # The index of the first item of each chunk of the file, from the first item of the file, and the position of the chunk.
+        self.__chunkIndices: list[int] = []
+        self.__chunkOffsets: list[int] = []
+        self.__fileCount: int = 0
+        self.__isDisposed: bool = False
+
+    def __Flush(self) -> None:
+        if self.__file is None:
+            self.__file = TemporaryFile()
+
+        # The enumerators move the position of the file when they read it.
+        offset: int = self.__file.seek(0, 2)
+
+        pickle.dump(self.__pending, self.__file, pickle.HIGHEST_PROTOCOL)
+
+        self.__chunkIndices.append(self.__fileCount)
+        self.__chunkOffsets.append(offset)
+
+        self.__fileCount += len(self.__pending)
+        self.__pending = []
+
+    def __Record(self, items: list[T]) -> None:
+        if self.__threshold is None:
+            self.__items.extend(items)
+
+            return
+
+        count: int = self.__threshold - len(self.__items)
+
+        if count > 0:
+            self.__items.extend(items[:count])
+
+            items = items[count:]
+
+        for item in items:
+            self.__pending.append(item)
+
+            # The pending items are kept if they cannot be written, so they are written with the next ones.
+            if len(self.__pending) >= CachingEnumerable._ChunkSize:
+                self.__Flush()
+
+    @final
+    def __TryReadRecorded(self, index: int, items: list[T]) -> bool:
+        recorded: int = len(self.__items)
+
+        if index < recorded:
+            items.extend(self.__items[index:index + CachingEnumerable._ChunkSize])
+
+            return True
+
+        index -= recorded
+
+        if index < self.__fileCount:
+            chunk: int = bisect_right(self.__chunkIndices, index) - 1
+
+            self.__file.seek(self.__chunkOffsets[chunk]) # type: ignore
+
+            items.extend(pickle.load(self.__file)[index - self.__chunkIndices[chunk]:]) # type: ignore
+
+            return True
+
+        index -= self.__fileCount
+
+        if index < len(self.__pending):
+            items.extend(self.__pending[index:])
+
+            return True
+
+        return False
+
+    @final
+    def _Read(self, index: int, items: list[T], count: int) -> None:
+        # Adds the recorded items from index to items, reading at most count new items from the source if all the items are already read. items is left empty when there are no more items.
+        with self.__condition:
+            while True:
+                if self.__isDisposed:
+                    raise GetDisposedError()
+
+                if self.__TryReadRecorded(index, items):
+                    return
+
+                read: list[T]|None = self.__source.TryRead(count)
+
+                if read is None:
+                    continue
+
+                if self.__isDisposed:
+                    raise GetDisposedError()
+
+                self.__Record(read)
+
+                items.extend(read)
+
+                return
+
+    @final
+    def IsCompleted(self) -> bool:
+        return self.__source.IsCompleted()
+
+    @final
+    def GetRecordedCount(self) -> int:
+        return len(self.__items) + self.__fileCount + len(self.__pending)
+    @final
+    def IsSpilled(self) -> bool:
+        return self.__file is not None
+
+    def TryGetEnumerator(self) -> IEnumerator[T]|None:
+        if self.__isDisposed:
+            raise GetDisposedError()
+
+        return CachingEnumerable[T].__Enumerator(self)
+
+    @final
+    def IsDisposed(self) -> bool:
+        return self.__isDisposed
+
+    def Dispose(self) -> None:
+        with self.__condition:
+            self.__isDisposed = True
+
+            self.__items.clear()
+            self.__pending.clear()
+            self.__chunkIndices.clear()
+            self.__chunkOffsets.clear()
+
+            self.__source.Close()
+
+            if self.__file is not None:
+                # A temporary file is deleted once closed.
+                self.__file.close()
+
+                self.__file = None
@@ -6,13 +6,16 @@ Created on Fri Jan 17 02:12:00 2025
 """
 
 from abc import abstractmethod
+from collections import deque
+from collections.abc import Iterable as SystemIterable, Iterator as SystemIterator, Sequence
+from itertools import chain
 from typing import final
 
 
 
 from WinCopies import IInterface
 
-from WinCopies.Collections.Enumeration import IEnumerable, IEnumerator, Enumerable, EnumeratorBase, AbstractionEnumerator, GetNullEnumerable
+from WinCopies.Collections.Enumeration import IEnumerable, IEnumerator, Enumerable, IterableBase, EnumeratorBase, AbstractionEnumerator, GetNullEnumerable
 from WinCopies.Collections.Linked.Doubly import IList, List, IDoublyLinkedNode
 
 from WinCopies.Typing.Delegate import Converter, Function
@@ -239,4 +242,111 @@ class IterableBuilder[T](Enumerable[T]):
     
     @final
     def TryGetEnumerator(self) -> IEnumerator[T]|None:
-        return self.__iterable.TryGetEnumerator()
\ No newline at end of file
+        return self.__iterable.TryGetEnumerator()
+
+class ConcatenationBuilder[T](IterableBase[T]):
+    # Concatenates iterables in constant time, whatever the number of iterables, by keeping them in a flat list of segments, instead of nesting a generator for each of them: the items are returned by a single loop over the segments. When a ConcatenationBuilder is added to another one, its segments are copied instead of being nested.
+    # The segments added after an enumeration started are not returned by this enumeration.
+
+    def __init__(self, items: SystemIterable[T]|None = None):
+        super().__init__()
+
+        # The segments before the first one given to the constructor are stored in reverse order, so that prepending is done in constant time too.
+        self.__first: list[SystemIterable[T]] = []
+        self.__last: list[SystemIterable[T]] = []
+        # The segments that are built by this builder for the items added one by one, as long as they can still be updated.
+        self.__firstItems: deque[T]|None = None
+        self.__lastItems: list[T]|None = None
+
+        self.Append(items)
+
+    def __Freeze(self) -> None:
+        # The segments built by this builder are shared with an enumeration or with another builder from now on; the next items are added to new segments.
+        self.__firstItems = None
+        self.__lastItems = None
+
+    def __GetSegments(self) -> list[SystemIterable[T]]:
+        self.__Freeze()
+
+        segments: list[SystemIterable[T]] = self.__first[::-1]
+
+        segments.extend(self.__last)
+
+        return segments
+
+    @final
+    def GetSegmentCount(self) -> int:
+        return len(self.__first) + len(self.__last)
+
+    @final
+    def Append(self, values: SystemIterable[T]|None) -> None:
+        if values is None:
+            return
+
+        self.__lastItems = None
+
+        if isinstance(values, ConcatenationBuilder):
+            self.__last.extend(values.__GetSegments())
+
+        else:
+            self.__last.append(values)
+    @final
+    def AppendItem(self, value: T) -> None:
+        if self.__lastItems is None:
+            self.__lastItems = []
+
+            self.__last.append(self.__lastItems)
+
+        self.__lastItems.append(value)
+    @final
+    def AppendValues(self, *values: T) -> None:
+        self.Append(values)
+    @final
+    def AppendIterable(self, values: SystemIterable[SystemIterable[T]|None]|None) -> None:
+        if values is not None:
+            for iterable in values:
+                self.Append(iterable)
+
+    @final
+    def Prepend(self, values: SystemIterable[T]|None) -> None:
+        if values is None:
+            return
+
+        self.__firstItems = None
+
+        if isinstance(values, ConcatenationBuilder):
+            segments: list[SystemIterable[T]] = values.__GetSegments()
+
+            segments.reverse()
+
+            self.__first.extend(segments)
+
+        else:
+            self.__first.append(values)
+    @final
+    def PrependItem(self, value: T) -> None:
+        if self.__firstItems is None:
+            self.__firstItems = deque()
+
+            self.__first.append(self.__firstItems)
+
+        self.__firstItems.appendleft(value)
+    @final
+    def PrependValues(self, *values: T) -> None:
+        self.Prepend(values)
+    @final
+    def PrependIterable(self, values: SystemIterable[SystemIterable[T]|None]|None) -> None:
+        if values is not None:
+            for iterable in reversed(values if isinstance(values, Sequence) else list(values)):
+                self.Prepend(iterable)
+
+    @final
+    def Clear(self) -> None:
+        self.__Freeze()
+
+        self.__first = []
+        self.__last = []
+
+    @final
+    def _TryGetIterator(self) -> SystemIterator[T]|None:
+        return chain.from_iterable(self.__GetSegments())
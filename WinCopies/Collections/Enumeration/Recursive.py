@@ -1,43 +1,47 @@
 from abc import abstractmethod
 from collections.abc import Iterable
-from typing import final
+from typing import final, TYPE_CHECKING
 
 
 
 from WinCopies import IInterface, Abstract, NullableBoolean, ToNullableBoolean
 
-from WinCopies.Collections import EnumerationOrder
-from WinCopies.Collections.Enumeration import IEnumerable, IEnumerator, Enumerable, EnumeratorProvider, AbstractEnumerator, GetEnumerator
-from WinCopies.Collections.Linked.Singly import Stack
+from WinCopies.Collections import EnumerationOrder, Generator
+from WinCopies.Collections.Enumeration import IEnumerable, IEnumerator, Enumerable, EnumeratorProvider, IteratorProvider, AbstractEnumerator, GetEnumerator
 
-from WinCopies.Typing import InvalidOperationError, INullable, IDisposable
-from WinCopies.Typing.Delegate import Converter, Function, Method, IFunction, ValueFunctionUpdater
+from WinCopies.Typing import IDisposable
+from WinCopies.Typing.Delegate import Converter, Function, Method, Predicate, IFunction, ValueFunctionUpdater
 from WinCopies.Typing.Pairing import DualResult
 
+# Parallel, and concurrent.futures with it, is imported by GetParallelRecursiveEnumerable, so that importing this module, as the data layer does, does not import them.
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 class IRecursivelyEnumerable[T](IEnumerable[T]):
     def __init__(self):
         super().__init__()
 
+    # maxDepth is the depth of the deepest items to enumerate, the items of the main level being at depth 0. The items for which prune returns True are enumerated, but not their children. In both cases, the children are not even requested, so that the subtrees that are not enumerated are never read.
     @abstractmethod
-    def TryGetRecursiveEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[T]|None = None) -> IEnumerator[T]|None:
+    def TryGetRecursiveEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerator[T]|None:
         pass
     @final
-    def GetRecursiveEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[T]|None = None) -> IEnumerator[T]:
-        return GetEnumerator(self.TryGetRecursiveEnumerator(enumerationOrder, handler))
+    def GetRecursiveEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerator[T]:
+        return GetEnumerator(self.TryGetRecursiveEnumerator(enumerationOrder, handler, maxDepth, prune))
 
     @abstractmethod
-    def TryGetRecursiveStackedEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None) -> IEnumerator[T]|None:
+    def TryGetRecursiveStackedEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerator[T]|None:
         pass
     @final
-    def GetRecursiveStackedEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None) -> IEnumerator[T]:
-        return GetEnumerator(self.TryGetRecursiveStackedEnumerator(enumerationOrder, handler))
+    def GetRecursiveStackedEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerator[T]:
+        return GetEnumerator(self.TryGetRecursiveStackedEnumerator(enumerationOrder, handler, maxDepth, prune))
 
     @final
-    def GetRecursiveEnumerable(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[T]|None = None) -> IEnumerable[T]:
-        return EnumeratorProvider[T](lambda: self.TryGetRecursiveEnumerator(enumerationOrder, handler))
+    def GetRecursiveEnumerable(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerable[T]:
+        return EnumeratorProvider[T](lambda: self.TryGetRecursiveEnumerator(enumerationOrder, handler, maxDepth, prune))
     @final
-    def GetRecursiveStackedEnumerable(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None) -> IEnumerable[T]:
-        return EnumeratorProvider[T](lambda: self.TryGetRecursiveStackedEnumerator(enumerationOrder, handler))
+    def GetRecursiveStackedEnumerable(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerable[T]:
+        return EnumeratorProvider[T](lambda: self.TryGetRecursiveStackedEnumerator(enumerationOrder, handler, maxDepth, prune))
     
     @abstractmethod
     def AsRecursivelyEnumerable(self) -> IEnumerable[T]:
@@ -289,22 +293,11 @@ class IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems](IDisp
     def GetStackItem(self, item: TEnumerationItems, enumerator: IEnumerator[TEnumerationItems]) -> TStackItems:
         pass
     @abstractmethod
-    def GetStackItemAsEnumerator(self, item: TStackItems) -> IEnumerator[TEnumerationItems]:
-        pass
-    @abstractmethod
     def GetStackItemAsCookie(self, item: TStackItems) -> TCookie:
         pass
     
     @abstractmethod
-    def Push(self, item: TStackItems) -> None:
-        pass
-
-    @abstractmethod
-    def TryPeek(self) -> INullable[TStackItems]:
-        pass
-    
-    @abstractmethod
-    def TryPop(self) -> INullable[TStackItems]:
+    def CanEnterSublevel(self, item: TEnumerationItems, depth: int) -> bool:
         pass
     
     @abstractmethod
@@ -360,158 +353,141 @@ class _RecursiveEnumerationDelegate[TEnumerationItems, TCookie, TStackItems](Abs
     def __init__(self, cookieProvider: Function[IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]]):
         super().__init__()
 
-        self.__moveNext: Function[bool]|None = None
-        self.__currentEnumerator: IEnumerator[TEnumerationItems]|None = None
         self.__cookieProvider: Function[IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]] = cookieProvider
+
+        # The levels entered below the current main level, from the outermost one: the enumerators of their items and their stack items. Lists are used rather than a linked stack so that a level is entered and exited without any allocation but its enumerator, and without any recursion, whatever the depth of the tree.
+        self.__enumerators: list[IEnumerator[TEnumerationItems]] = []
+        self.__stackItems: list[TStackItems] = []
+
+        self.__currentEnumerator: IEnumerator[TEnumerationItems]|None = None
+        self.__first: TStackItems|None = None
     
     @final
     def _GetCookie(self) -> IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]:
         return self.__cookieProvider()
     
-    def _OnEnteringLevel(self, currentItem: TEnumerationItems, enumerator: IEnumerator[TEnumerationItems]) -> None:
-        self._GetCookie().Push(self._GetCookie().GetStackItem(currentItem, enumerator))
-    def _OnExitingLevel(self, enumerator: IEnumerator[TEnumerationItems]) -> None:
-        pass
+    @final
+    def _GetEnumerators(self) -> list[IEnumerator[TEnumerationItems]]:
+        return self.__enumerators
+    
+    @final
+    def _GetCurrentEnumerator(self) -> IEnumerator[TEnumerationItems]|None:
+        return self.__currentEnumerator
+    @final
+    def _SetCurrentEnumerator(self, enumerator: IEnumerator[TEnumerationItems]) -> None:
+        self.__currentEnumerator = enumerator
     
     @final
-    def __ProcessEnumerator(self, currentItem: TEnumerationItems, enumerator: IEnumerator[TEnumerationItems]) -> NullableBoolean:
+    def _GetFirst(self) -> TStackItems|None:
+        return self.__first
+    
+    @final
+    def _TryEnterLevel(self, cookie: IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]) -> NullableBoolean:
+        # Enters the level of the children of the current item, positioned on its first child accepted by the cookie.
+        enumerator: IEnumerator[TEnumerationItems]|None = self.__currentEnumerator
+
+        if enumerator is None:
+            return NullableBoolean.BoolFalse
+        
+        item: TEnumerationItems|None = enumerator.GetCurrent()
+
+        if item is None or not cookie.CanEnterSublevel(item, len(self.__enumerators)):
+            return NullableBoolean.BoolFalse
+        
+        enumerator = cookie.GetEnumerationItems(item).GetEnumerator()
+
         while enumerator.MoveNext():
-            result: bool|None = self._GetCookie().OnEnteringSublevel(currentItem)
-            
+            result: bool|None = cookie.OnEnteringSublevel(item)
+
             if result is None:
                 return NullableBoolean.Null
             
-            if result is True:
-                self._OnEnteringLevel(currentItem, enumerator)
-                
+            if result:
+                self.__enumerators.append(enumerator)
+                self.__stackItems.append(cookie.GetStackItem(item, enumerator))
+
+                self.__currentEnumerator = enumerator
+
                 return NullableBoolean.BoolTrue
         
         return NullableBoolean.BoolFalse
     
     @final
-    def _TryEnterLevel(self) -> NullableBoolean:
-        def getEnumerator() -> DualResult[TEnumerationItems, IEnumerator[TEnumerationItems]]|None:
-            enumerator: IEnumerator[TEnumerationItems]|None = self._GetCurrentEnumerator()
+    def _ExitLevel(self, cookie: IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]) -> bool|None:
+        # Exits the innermost level. The enumerator of its parent level becomes the current one.
+        self.__enumerators.pop()
 
-            if enumerator is None:
-                return None
-            
-            item: TEnumerationItems|None = enumerator.GetCurrent()
+        result: bool|None = cookie.OnExitingSublevel(cookie.GetStackItemAsCookie(self.__stackItems.pop()))
 
-            return None if item is None else DualResult[TEnumerationItems, IEnumerator[TEnumerationItems]](item, self._GetCookie().GetEnumerationItems(item).GetEnumerator())
-        
-        result: DualResult[TEnumerationItems, IEnumerator[TEnumerationItems]]|None = getEnumerator()
+        self.__currentEnumerator = self.__enumerators[-1] if len(self.__enumerators) > 0 else cookie.GetEnumerator()
 
-        return NullableBoolean.BoolFalse if result is None else self.__ProcessEnumerator(result.GetKey(), result.GetValue())
-            
-    def _Loop(self, result: INullable[TStackItems]) -> bool|None:
-        def moveNext(enumerator: IEnumerator[TEnumerationItems]) -> bool:
-            return enumerator.MoveNext()
-        
-        def tryPop() -> INullable[TStackItems]:
-            return self._GetCookie().TryPop()
-        
-        def loop() -> bool|None:
-            nonlocal result
-            nonlocal loopResult
-            nonlocal enumerator
+        return result
+    
+    @final
+    def _TryEnterMainLevel(self, cookie: IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]) -> bool:
+        # Moves to the next item of the main level accepted by the cookie.
+        while cookie.MoveNext():
+            enumerator: IEnumerator[TEnumerationItems] = cookie.GetEnumerator()
+            current: TEnumerationItems|None = enumerator.GetCurrent()
+
+            self.__currentEnumerator = enumerator
 
-            if (loopResult := self._GetCookie().OnExitingSublevel(self._GetCookie().GetStackItemAsCookie(result.GetValue()))) is None:
+            if current is None:
                 return False
-            
-            while (result := tryPop()).HasValue():
-                if loopResult is True and moveNext(enumerator := self._GetCookie().GetStackItemAsEnumerator(result.GetValue())):
-                    self._OnExitingLevel(enumerator)
 
-                    return True
+            match ToNullableBoolean(cookie.OnEnteringMainLevel(current)):
+                case NullableBoolean.BoolTrue:
+                    self.__first = cookie.GetStackItem(current, enumerator)
 
-                if (loopResult := self._GetCookie().OnExitingSublevel(self._GetCookie().GetStackItemAsCookie(result.GetValue()))) is None:
+                    return True
+                
+                case NullableBoolean.Null:
                     return False
-            
-            return None
-        
-        loopResult: bool|None = self._GetCookie().OnExitingSublevel(self._GetCookie().GetStackItemAsCookie(result.GetValue()))
-        
-        if loopResult is None:
-            return False
-        
-        enumerator: IEnumerator[TEnumerationItems]|None = None
-        
-        if loopResult is False:
-            if (result := tryPop()).HasValue():
-                return loop()
-        
-        if (result := tryPop()).HasValue():
-            if moveNext(enumerator := self._GetCookie().GetStackItemAsEnumerator(result.GetValue())):
-                self._OnExitingLevel(enumerator)
-
-                return True
-            
-            return loop()
+                
+                case _:
+                    continue
         
-        return None
-    
-    @abstractmethod
-    def _MoveNext(self) -> bool:
-        pass
-
-    @final
-    def _UpdateMoveNext(self, func: Function[bool]) -> None:
-        self.__moveNext = func
+        return False
     
     @final
-    def _GetCurrentEnumerator(self) -> IEnumerator[TEnumerationItems]|None:
-        return self.__currentEnumerator
-    @final
-    def _SetCurrentEnumerator(self, enumerator: IEnumerator[TEnumerationItems]) -> None:
-        self.__currentEnumerator = enumerator
+    def _ExitMainLevel(self, cookie: IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]) -> None:
+        first: TStackItems|None = self.__first
+
+        if first is not None:
+            self.__first = None
+
+            cookie.OnExitingMainLevel(cookie.GetStackItemAsCookie(first))
     
     def Initialize(self) -> None:
-        self._GetCookie().Initialize()
+        self.__enumerators.clear()
+        self.__stackItems.clear()
 
-        self.__moveNext = self._MoveNext
+        self.__currentEnumerator = None
+        self.__first = None
     
     @final
     def GetCurrent(self) -> TEnumerationItems|None:
         return None if self.__currentEnumerator is None else self.__currentEnumerator.GetCurrent()
     
-    @final
-    def MoveNext(self) -> bool:
-        return False if self.__moveNext is None else self.__moveNext()
-    
     def Dispose(self) -> None:
         self._GetCookie().Dispose()
 
-        self.__currentEnumerator = None
-        self.__moveNext = None
+        self.Initialize()
 
 @final
 class _FIFO[TEnumerationItems, TCookie, TStackItems](_RecursiveEnumerationDelegate[TEnumerationItems, TCookie, TStackItems]):
     def __init__(self, cookieProvider: Function[IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]]):
         super().__init__(cookieProvider)
-        
-        self.__first: TStackItems|None = None
     
     def GetOrder(self) -> EnumerationOrder:
         return EnumerationOrder.FIFO
     
-    def _OnEnteringLevel(self, currentItem: TEnumerationItems, enumerator: IEnumerator[TEnumerationItems]) -> None:
-        super()._OnEnteringLevel(currentItem, enumerator)
-
-        self._SetCurrentEnumerator(enumerator)
-    def _OnExitingLevel(self, enumerator: IEnumerator[TEnumerationItems]) -> None:
-        super()._OnExitingLevel(enumerator)
-
-        self._SetCurrentEnumerator(enumerator)
-    
-    def _MoveNext(self) -> bool:
-        def setCurrentEnumerator(value: IEnumerator[TEnumerationItems]) -> IEnumerator[TEnumerationItems]:
-            self._SetCurrentEnumerator(value)
+    def MoveNext(self) -> bool:
+        # An item is returned before its children: the children of the current item are entered first, then its next siblings are enumerated, then the levels that are completed are exited.
+        cookie: IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems] = self._GetCookie()
 
-            return value
-        
-        def moveNext() -> bool:
-            match self._TryEnterLevel():
+        if self._GetFirst() is not None:
+            match self._TryEnterLevel(cookie):
                 case NullableBoolean.BoolTrue:
                     return True
                 case NullableBoolean.Null:
@@ -519,156 +495,72 @@ class _FIFO[TEnumerationItems, TCookie, TStackItems](_RecursiveEnumerationDelega
                 case _:
                     pass
             
-            result: INullable[TStackItems] = self._GetCookie().TryPeek()
+            enumerators: list[IEnumerator[TEnumerationItems]] = self._GetEnumerators()
 
-            if result.HasValue():
-                if self._GetCookie().GetStackItemAsEnumerator(result.GetValue()).MoveNext():
+            if len(enumerators) > 0:
+                if enumerators[-1].MoveNext():
                     return True
                 
-                loopResult: bool|None = self._Loop(result)
-
-                if loopResult is not None:
-                    return loopResult
-        
-            first: TStackItems|None = self.__first
-
-            if first is not None:
-                self._GetCookie().OnExitingMainLevel(self._GetCookie().GetStackItemAsCookie(first))
-
-            self._UpdateMoveNext(self._MoveNext)
-
-            return self._MoveNext()
-        
-        current: TEnumerationItems|None = None
-        currentEnumerator: IEnumerator[TEnumerationItems]|None = None
-
-        while self._GetCookie().MoveNext() and (current := (currentEnumerator := setCurrentEnumerator(self._GetCookie().GetEnumerator())).GetCurrent()) is not None:
-            match ToNullableBoolean(self._GetCookie().OnEnteringMainLevel(current)):
-                case NullableBoolean.BoolTrue:
-                    self.__first = self._GetCookie().GetStackItem(current, currentEnumerator)
-                    
-                    self._UpdateMoveNext(moveNext)
-
-                    return True
+                # When the cookie returns False on exiting a level, the next siblings of the item of this level are not enumerated.
+                while (result := self._ExitLevel(cookie)) is not None and len(enumerators) > 0:
+                    if result and enumerators[-1].MoveNext():
+                        return True
                 
-                case NullableBoolean.Null:
+                if result is None:
                     return False
-                
-                case _:
-                    continue
+            
+            self._ExitMainLevel(cookie)
         
-        return False
-    
-    def Dispose(self) -> None:
-        super().Dispose()
-
-        self.__first = None
+        return self._TryEnterMainLevel(cookie)
 @final
-class _LIFO[T](_RecursiveEnumerationDelegate[T, T, DualResult[T, IEnumerator[T]]]):
-    def __init__(self, cookieProvider: Function[IRecursiveEnumerationCookie[T, T, DualResult[T, IEnumerator[T]]]]):
+class _LIFO[TEnumerationItems, TCookie, TStackItems](_RecursiveEnumerationDelegate[TEnumerationItems, TCookie, TStackItems]):
+    def __init__(self, cookieProvider: Function[IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]]):
         super().__init__(cookieProvider)
-        
-        self.__first: DualResult[T, IEnumerator[T]]|None = None
+
+        self.__moveNext: bool = True
     
     def GetOrder(self) -> EnumerationOrder:
         return EnumerationOrder.LIFO
     
-    def _MoveNext(self) -> bool:
-        def tryEnterLevel() -> NullableBoolean:
-            return self._TryEnterLevel()
-        
-        def getEnumerator(value: INullable[DualResult[T, IEnumerator[T]]]) -> IEnumerator[T]:
-            return value.GetValue().GetValue()
-        
-        def setCurrentEnumerator(value: IEnumerator[T]) -> IEnumerator[T]:
-            self._SetCurrentEnumerator(value)
-
-            return value
-        
-        def moveNext() -> bool:
-            def _tryEnterLevel() -> bool|None:
-                _result: NullableBoolean = tryEnterLevel()
-
-                match _result:
-                    case NullableBoolean.BoolTrue:
-                        while _result == NullableBoolean.BoolTrue:
-                            _result = tryEnterLevel()
-                        
-                        if _result == NullableBoolean.Null:
-                            return False
-                        
-                        self._SetCurrentEnumerator(getEnumerator(self._GetCookie().TryPeek()))
-                    case NullableBoolean.Null:
-                        return False
-                    case _:
-                        return None
-
-                return True
-            
-            result: INullable[DualResult[T, IEnumerator[T]]] = self._GetCookie().TryPeek()
-
-            if result.HasValue():
-                loopResult: bool|None = None
-
-                if getEnumerator(result).MoveNext():
-                    if (loopResult := _tryEnterLevel()) is not None:
-                        return loopResult
-                
-                if (loopResult := self._Loop(result)) is False:
+    def __EnterLevels(self, cookie: IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems]) -> bool:
+        # Enters the levels of the first accepted descendants of the current item, so that the deepest one becomes the current item.
+        while True:
+            match self._TryEnterLevel(cookie):
+                case NullableBoolean.BoolTrue:
+                    continue
+                case NullableBoolean.Null:
                     return False
-                
-                if loopResult is True and (loopResult := _tryEnterLevel()) is not None:
-                    return loopResult
-
-            first: DualResult[T, IEnumerator[T]]|None = self.__first
-
-            if first is not None:
-                self._GetCookie().OnExitingMainLevel(self._GetCookie().GetStackItemAsCookie(first))
-
-            self._UpdateMoveNext(self._MoveNext)
+                case _:
+                    return True
+    
+    def MoveNext(self) -> bool:
+        # An item is returned after its children: the next sibling of the current item is enumerated from its deepest descendant, and the item of a level is returned once this level is exited.
+        cookie: IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems] = self._GetCookie()
 
-            return self._MoveNext()
-        
-        current: T|None = None
-        currentEnumerator: IEnumerator[T]|None = None
+        if self._GetFirst() is not None:
+            enumerators: list[IEnumerator[TEnumerationItems]] = self._GetEnumerators()
 
-        while self._GetCookie().MoveNext() and (current := (currentEnumerator := setCurrentEnumerator(self._GetCookie().GetEnumerator())).GetCurrent()) is not None:
-            match ToNullableBoolean(self._GetCookie().OnEnteringMainLevel(current)):
-                case NullableBoolean.BoolTrue:
-                    self.__first = self._GetCookie().GetStackItem(current, currentEnumerator)
-
-                    result: NullableBoolean = tryEnterLevel()
-
-                    match result:
-                        case NullableBoolean.BoolTrue:
-                            while result == NullableBoolean.BoolTrue:
-                                result = tryEnterLevel()
-                            
-                            if result == NullableBoolean.Null:
-                                return False
-                            
-                            self._SetCurrentEnumerator(getEnumerator(self._GetCookie().TryPeek()))
-                        
-                            self._UpdateMoveNext(moveNext)
-                        case NullableBoolean.Null:
-                            return False
-                        case _:
-                            pass
+            if len(enumerators) > 0:
+                if self.__moveNext and enumerators[-1].MoveNext():
+                    self._SetCurrentEnumerator(enumerators[-1])
 
-                    return True
+                    return self.__EnterLevels(cookie)
                 
-                case NullableBoolean.Null:
+                # When the cookie returns False on exiting a level, the item of this level is returned, but not its next siblings.
+                result: bool|None = self._ExitLevel(cookie)
+
+                if result is None:
                     return False
                 
-                case _:
-                    continue
+                self.__moveNext = result
+
+                return True
+            
+            self._ExitMainLevel(cookie)
         
-        return False
-    
-    def Dispose(self) -> None:
-        super().Dispose()
+        self.__moveNext = True
 
-        self.__first = None
+        return self._TryEnterMainLevel(cookie) and self.__EnterLevels(cookie)
 
 class _RecursiveEnumeratorBase[T](IEnumerator[T]):
     def __init__(self):
@@ -717,10 +609,6 @@ class RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems](AbstractE
 
             self.__enumerator: RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems] = enumerator
             self.__delegate: RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems]._IDelegate = delegate
-            self.__enumerators: Stack[TStackItems]|None = None
-        
-        def Initialize(self) -> None:
-            self.__enumerators = Stack[TStackItems]()
 
         def GetEnumerator(self) -> IEnumerator[TEnumerationItems]:
             return self.__delegate.GetEnumerator()
@@ -733,31 +621,12 @@ class RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems](AbstractE
         
         def GetStackItem(self, item: TEnumerationItems, enumerator: IEnumerator[TEnumerationItems]) -> TStackItems:
             return self.__enumerator._GetStackItem(item, enumerator)
-        def GetStackItemAsEnumerator(self, item: TStackItems) -> IEnumerator[TEnumerationItems]:
-            return self.__enumerator._GetStackItemAsEnumerator(item)
         def GetStackItemAsCookie(self, item: TStackItems) -> TCookie:
             return self.__enumerator._GetStackItemAsCookie(item)
         
-        def Push(self, item: TStackItems) -> None:
-            if self.__enumerators is None:
-                raise InvalidOperationError()
-            
-            self.__enumerators.Push(item)
-
-        def TryPeek(self) -> INullable[TStackItems]:
-            if self.__enumerators is None:
-                raise InvalidOperationError()
-            
-            return self.__enumerators.TryPeek()
-
-        def TryPop(self) -> INullable[TStackItems]:
-            if self.__enumerators is None:
-                raise InvalidOperationError()
-            
-            self.__enumerators.TryPop()
-
-            return self.__enumerators.TryPeek()
-    
+        def CanEnterSublevel(self, item: TEnumerationItems, depth: int) -> bool:
+            return self.__enumerator._CanEnterSublevel(item, depth)
+        
         def OnEnteringSublevel(self, item: TEnumerationItems) -> bool|None:
             if self.__enumerator._OnEnteringSublevel(item):
                 self.__enumerator._OnEnteringLevel(item)
@@ -789,13 +658,17 @@ class RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems](AbstractE
             return False
         
         def Dispose(self) -> None:
-            if self.__enumerators is not None:
-                self.__enumerators.Clear()
-                self.__enumerators = None
+            pass
     
-    def __init__(self, enumerator: IEnumerator[TEnumerationItems], delegate: IRecursiveEnumerationDelegate[TEnumerationItems]|None, handler: IRecursiveEnumerationHandlerBase[TEnumerationItems, TCookie]|None):
+    def __init__(self, enumerator: IEnumerator[TEnumerationItems], delegate: IRecursiveEnumerationDelegate[TEnumerationItems]|None, handler: IRecursiveEnumerationHandlerBase[TEnumerationItems, TCookie]|None, maxDepth: int|None = None, prune: Predicate[TEnumerationItems]|None = None):
+        if maxDepth is not None and maxDepth < 0:
+            raise ValueError("maxDepth must be greater than or equal to zero.")
+        
         super().__init__(enumerator)
         
+        self.__maxDepth: int|None = maxDepth
+        self.__prune: Predicate[TEnumerationItems]|None = prune
+        
         self.__cookie: IRecursiveEnumerationCookie[TEnumerationItems, TCookie, TStackItems] = RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems].__Cookie(self, RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems].__Delegate(self._GetEnumerator, self._GetEnumerationItems, super()._MoveNextOverride))
         self.__moveNext: IRecursiveEnumerationDelegate[TEnumerationItems] = _NullRecursiveEnumerationDelegate[TEnumerationItems]() if delegate is None else delegate
         self.__handler: IRecursiveEnumerationHandlerBase[TEnumerationItems, TCookie] = _NullRecursiveEnumerationHandler[TEnumerationItems, TCookie]() if handler is None else handler
@@ -808,9 +681,6 @@ class RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems](AbstractE
     def _GetStackItem(self, item: TEnumerationItems, enumerator: IEnumerator[TEnumerationItems]) -> TStackItems:
         pass
     @abstractmethod
-    def _GetStackItemAsEnumerator(self, item: TStackItems) -> IEnumerator[TEnumerationItems]:
-        pass
-    @abstractmethod
     def _GetStackItemAsCookie(self, item: TStackItems) -> TCookie:
         pass
 
@@ -822,6 +692,10 @@ class RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems](AbstractE
         
         return False
     
+    def _CanEnterSublevel(self, item: TEnumerationItems, depth: int) -> bool:
+        # Called before the children of item are requested; depth is the depth of item.
+        return (self.__maxDepth is None or depth < self.__maxDepth) and (self.__prune is None or not self.__prune(item))
+    
     def _OnEnteringLevel(self, item: TEnumerationItems) -> None:
         self.__handler.OnEnteringEnumerationLevel(item)
     def _OnExitingLevel(self, cookie: TCookie) -> None:
@@ -852,20 +726,17 @@ class RecursiveEnumeratorBase[TEnumerationItems, TCookie, TStackItems](AbstractE
     def _OnStopped(self) -> None:
         self.__handler.OnStoppedEnumeration()
 class RecursiveEnumerator[T](RecursiveEnumeratorBase[T, None, IEnumerator[T]]):
-    def __init__(self, enumerator: IEnumerator[T], handler: IRecursiveEnumerationHandler[T]|None = None):
-        super().__init__(enumerator, _FIFO[T, None, IEnumerator[T]](self._GetCookie), handler)
+    def __init__(self, enumerator: IEnumerator[T], handler: IRecursiveEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None):
+        super().__init__(enumerator, _FIFO[T, None, IEnumerator[T]](self._GetCookie), handler, maxDepth, prune)
     
     @final
     def _GetStackItem(self, item: T, enumerator: IEnumerator[T]) -> IEnumerator[T]:
         return enumerator
     @final
-    def _GetStackItemAsEnumerator(self, item: IEnumerator[T]) -> IEnumerator[T]:
-        return item
-    @final
     def _GetStackItemAsCookie(self, item: IEnumerator[T]) -> None:
         return None
 class StackedRecursiveEnumerator[T](RecursiveEnumeratorBase[T, T, DualResult[T, IEnumerator[T]]]):
-    def __init__(self, enumerator: IEnumerator[T], enumerationOrder: EnumerationOrder, handler: IRecursiveStackedEnumerationHandler[T]|None = None):
+    def __init__(self, enumerator: IEnumerator[T], enumerationOrder: EnumerationOrder, handler: IRecursiveStackedEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None):
         def getDelegate(enumerationOrder: EnumerationOrder, cookieProvider: Function[IRecursiveEnumerationCookie[T, T, DualResult[T, IEnumerator[T]]]]) -> IRecursiveEnumerationDelegate[T]|None:
             match enumerationOrder:
                 case EnumerationOrder.Null:
@@ -873,26 +744,38 @@ class StackedRecursiveEnumerator[T](RecursiveEnumeratorBase[T, T, DualResult[T,
                 case EnumerationOrder.FIFO:
                     return _FIFO[T, T, DualResult[T, IEnumerator[T]]](cookieProvider)
                 case EnumerationOrder.LIFO:
-                    return _LIFO[T](cookieProvider)
+                    return _LIFO[T, T, DualResult[T, IEnumerator[T]]](cookieProvider)
                 case _:
                     raise ValueError(enumerationOrder)
         
-        super().__init__(enumerator, getDelegate(enumerationOrder, self._GetCookie), handler)
-    
-    @final
-    def _CreateStack(self) -> Stack[DualResult[T, IEnumerator[T]]]:
-        return Stack[DualResult[T, IEnumerator[T]]]()
+        super().__init__(enumerator, getDelegate(enumerationOrder, self._GetCookie), handler, maxDepth, prune)
     
     @final
     def _GetStackItem(self, item: T, enumerator: IEnumerator[T]) -> DualResult[T, IEnumerator[T]]:
         return DualResult[T, IEnumerator[T]](item, enumerator)
     @final
-    def _GetStackItemAsEnumerator(self, item: DualResult[T, IEnumerator[T]]) -> IEnumerator[T]:
-        return item.GetValue()
-    @final
     def _GetStackItemAsCookie(self, item: DualResult[T, IEnumerator[T]]) -> T:
         return item.GetKey()
 
+def _EnumerateLevels[T](items: Iterable[T], getChildren: Converter[T, Iterable[T]], maxDepth: int|None, prune: Predicate[T]|None) -> Generator[list[T]]:
+    level: list[T] = list(items)
+    depth: int = 0
+
+    while len(level) > 0:
+        yield level
+
+        if maxDepth is not None and depth >= maxDepth:
+            return
+        
+        children: list[T] = []
+
+        for item in level:
+            if prune is None or not prune(item):
+                children.extend(getChildren(item))
+        
+        level = children
+        depth += 1
+
 class RecursivelyEnumerable[T](Enumerable[T], IRecursivelyEnumerable[T]):
     class __IEnumerator(_RecursiveEnumeratorBase[T]):
         def __init__(self):
@@ -907,8 +790,8 @@ class RecursivelyEnumerable[T](Enumerable[T], IRecursivelyEnumerable[T]):
             return self._GetEnumerable()._AsRecursivelyEnumerable(enumerationItems)
 
     class Enumerator(RecursiveEnumerator[T], __IEnumerator[T]):
-        def __init__(self, enumerable: RecursivelyEnumerable[T], enumerator: IEnumerator[T], handler: IRecursiveEnumerationHandler[T]|None = None):
-            super().__init__(enumerator, handler)
+        def __init__(self, enumerable: RecursivelyEnumerable[T], enumerator: IEnumerator[T], handler: IRecursiveEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None):
+            super().__init__(enumerator, handler, maxDepth, prune)
 
             self.__enumerable: RecursivelyEnumerable[T] = enumerable
         
@@ -916,8 +799,8 @@ class RecursivelyEnumerable[T](Enumerable[T], IRecursivelyEnumerable[T]):
         def _GetEnumerable(self) -> RecursivelyEnumerable[T]:
             return self.__enumerable
     class StackedEnumerator(StackedRecursiveEnumerator[T], __IEnumerator[T]):
-        def __init__(self, enumerable: RecursivelyEnumerable[T], enumerator: IEnumerator[T], enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None):
-            super().__init__(enumerator, enumerationOrder, handler)
+        def __init__(self, enumerable: RecursivelyEnumerable[T], enumerator: IEnumerator[T], enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None):
+            super().__init__(enumerator, enumerationOrder, handler, maxDepth, prune)
 
             self.__enumerable: RecursivelyEnumerable[T] = enumerable
         
@@ -951,12 +834,27 @@ class RecursivelyEnumerable[T](Enumerable[T], IRecursivelyEnumerable[T]):
     def AsRecursivelyEnumerable(self) -> IEnumerable[T]:
         return self.__recursive.GetValue()
     
-    def _TryGetRecursiveEnumerator(self, enumerator: IEnumerator[T], handler: IRecursiveEnumerationHandler[T]|None) -> IEnumerator[T]|None:
-        return RecursivelyEnumerable[T].Enumerator(self, enumerator, handler)
-    def _TryGetRecursiveStackedEnumerator(self, enumerator: IEnumerator[T], enumerationOrder: EnumerationOrder, handler: IRecursiveStackedEnumerationHandler[T]|None) -> IEnumerator[T]|None:
-        return None if enumerationOrder == EnumerationOrder.Null else RecursivelyEnumerable[T].StackedEnumerator(self, enumerator, enumerationOrder, handler)
+    @final
+    def GetLevelEnumerable(self, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerable[list[T]]:
+        # Breadth first: each level is returned as a single list, the items of the main level first. The next level is only read once the current one is returned, so that stopping after the first levels does not read the others.
+        if maxDepth is not None and maxDepth < 0:
+            raise ValueError("maxDepth must be greater than or equal to zero.")
+        
+        return IteratorProvider[list[T]](lambda: _EnumerateLevels(self.AsIterable(), lambda item: self._AsRecursivelyEnumerable(item).AsIterable(), maxDepth, prune))
+    
+    @final
+    def GetParallelRecursiveEnumerable(self, executor: Executor, enumerationOrder: EnumerationOrder = EnumerationOrder.Null, maxWorkers: int|None = None) -> IEnumerable[T]:
+        # The sublevels are listed by maxWorkers threads of executor, which share their pending items through work stealing. No handler is supported: an item is expanded before its parent is enumerated. See Parallel.EnumerateRecursively.
+        from WinCopies.Collections import Parallel
+        
+        return IteratorProvider[T](lambda: Parallel.EnumerateRecursively(self.AsIterable(), lambda item: self._AsRecursivelyEnumerable(item).AsIterable(), executor, enumerationOrder, maxWorkers))
+    
+    def _TryGetRecursiveEnumerator(self, enumerator: IEnumerator[T], handler: IRecursiveEnumerationHandler[T]|None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerator[T]|None:
+        return RecursivelyEnumerable[T].Enumerator(self, enumerator, handler, maxDepth, prune)
+    def _TryGetRecursiveStackedEnumerator(self, enumerator: IEnumerator[T], enumerationOrder: EnumerationOrder, handler: IRecursiveStackedEnumerationHandler[T]|None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerator[T]|None:
+        return None if enumerationOrder == EnumerationOrder.Null else RecursivelyEnumerable[T].StackedEnumerator(self, enumerator, enumerationOrder, handler, maxDepth, prune)
 
-    def TryGetRecursiveEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[T]|None = None) -> IEnumerator[T]|None:
+    def TryGetRecursiveEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerator[T]|None:
         if enumerationOrder == EnumerationOrder.Null:
             return None
         
@@ -967,15 +865,15 @@ class RecursivelyEnumerable[T](Enumerable[T], IRecursivelyEnumerable[T]):
         
         match enumerationOrder:
             case EnumerationOrder.FIFO:
-                return self._TryGetRecursiveEnumerator(enumerator, handler)
+                return self._TryGetRecursiveEnumerator(enumerator, handler, maxDepth, prune)
             case EnumerationOrder.LIFO:
-                return self._TryGetRecursiveStackedEnumerator(enumerator, EnumerationOrder.LIFO, None if handler is None else handler.AsStackHandler())
+                return self._TryGetRecursiveStackedEnumerator(enumerator, EnumerationOrder.LIFO, None if handler is None else handler.AsStackHandler(), maxDepth, prune)
             case _:
                 raise ValueError(enumerationOrder)
-    def TryGetRecursiveStackedEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None) -> IEnumerator[T]|None:
+    def TryGetRecursiveStackedEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[T]|None = None, maxDepth: int|None = None, prune: Predicate[T]|None = None) -> IEnumerator[T]|None:
         if enumerationOrder == EnumerationOrder.Null:
             return None
         
         enumerator: IEnumerator[T]|None = self.TryGetEnumerator()
 
-        return None if enumerator is None else self._TryGetRecursiveStackedEnumerator(enumerator, enumerationOrder, handler)
\ No newline at end of file
+        return None if enumerator is None else self._TryGetRecursiveStackedEnumerator(enumerator, enumerationOrder, handler, maxDepth, prune)
\ No newline at end of file
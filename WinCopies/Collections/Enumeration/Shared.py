@@ -0,0 +1,167 @@
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Iterable as SystemIterable, Iterator as SystemIterator
+from itertools import islice
+from threading import Condition
+from typing import final
+
+from WinCopies.Collections import Generator
+from WinCopies.Collections.Enumeration import Enumerator
+
+@final
+class SharedSource[T]:
+    # Reads a source on behalf of several readers that share condition, one reader at a time and without holding condition, so that the other readers can use the items already read in the meantime.
+    # An error raised by source is raised again to every reader that reads it afterwards.
+
+    def __init__(self, source: SystemIterable[T], condition: Condition):
+        self.__condition: Condition = condition
+        self.__source: SystemIterable[T]|None = source
+        self.__iterator: SystemIterator[T]|None = None
+        self.__error: BaseException|None = None
+        # Whether a reader is reading source, which it does without holding condition.
+        self.__isReading: bool = False
+        self.__isClosed: bool = False
+
+    def IsCompleted(self) -> bool:
+        return self.__source is None and self.__iterator is None
+
+    def TryRead(self, count: int) -> list[T]|None:
+        # Reads at most count items from source; must be called with condition held. Returns None, after waiting for it, if another reader is reading source: the caller then checks again the items already read before calling this method again. Less than count items are returned once source is completed, or closed.
+        if self.__error is not None:
+            raise self.__error
+
+        # Only one reader reads source at a time; the others wait for its items.
+        if self.__isReading:
+            self.__condition.wait()
+
+            return None
+
+        source: SystemIterable[T]|None = self.__source
+        iterator: SystemIterator[T]|None = self.__iterator
+
+        if source is None and iterator is None:
+            return []
+
+        self.__isReading = True
+
+        read: list[T] = []
+
+        self.__condition.release()
+
+        try:
+            try:
+                if iterator is None:
+                    iterator = iter(source) # type: ignore
+
+                # The items read before an error are kept in read.
+                read.extend(islice(iterator, count))
+
+            finally:
+                self.__condition.acquire()
+
+                self.__isReading = False
+
+                # The readers waiting for this read can use its items, or read source in turn.
+                self.__condition.notify_all()
+
+        except BaseException as e:
+            self.__error = e
+            self.__source = None
+            self.__iterator = None
+
+            # The error is raised after the items read before it.
+            if len(read) > 0:
+                return read
+
+            raise
+
+        # A closed source is not reopened by a read that started before it was closed.
+        if not self.__isClosed:
+            self.__source = None
+            self.__iterator = None if len(read) < count else iterator
+
+        return read
+
+    def Close(self) -> None:
+        # Must be called with condition held.
+        self.__isClosed = True
+
+        self.__source = None
+        self.__iterator = None
+
+class ChunkEnumerator[T](Enumerator[T]):
+    # Reads its items by chunks of a shared collection, so that the lock of this collection is not taken for each item: one item at a time when it is moved, and chunkSize items at a time when it is iterated natively, which is much faster than moving it for each item.
+
+    def __init__(self, chunkSize: int):
+        super().__init__()
+
+        self.__chunkSize: int = chunkSize
+        # The number of items read by the enumeration.
+        self.__position: int = 0
+        self.__items: deque[T] = deque()
+
+    @abstractmethod
+    def _Read(self, position: int, items: list[T], count: int) -> None:
+        # Adds at most count items to items, from the item at position, the number of items already read by the enumeration. items is left empty when there are no more items.
+        pass
+
+    def _OnIterationEnded(self) -> None:
+        # Called when the enumeration ends, whether the enumerator is moved or iterated natively.
+        pass
+
+    def _MoveNextOverride(self) -> bool:
+        if len(self.__items) == 0:
+            read: list[T] = []
+
+            # Only the items that are needed are read from the source.
+            self._Read(self.__position, read, 1)
+
+            if len(read) == 0:
+                return False
+
+            self.__position += len(read)
+            self.__items.extend(read)
+
+        self._SetCurrent(self.__items.popleft())
+
+        return True
+
+    def __Iterate(self) -> Generator[T]:
+        position: int = 0
+        read: list[T] = []
+
+        try:
+            while True:
+                self._Read(position, read, self.__chunkSize)
+
+                if len(read) == 0:
+                    return
+
+                position += len(read)
+
+                yield from read
+
+                read.clear()
+
+        finally:
+            self._OnIterationEnded()
+
+    def _TryGetNativeIterator(self) -> SystemIterator[T]|None:
+        return self.__Iterate()
+
+    def _ResetOverride(self) -> bool:
+        self.__position = 0
+
+        self.__items.clear()
+
+        return True
+
+    def _OnEnded(self) -> None:
+        self.__items.clear()
+
+        self._OnIterationEnded()
+
+        super()._OnEnded()
+
+    def _OnStopped(self) -> None:
+        pass
@@ -7,15 +7,21 @@ Created on Sun Feb 6 20:37:51 2022
 
 from abc import abstractmethod
 from collections.abc import Iterable as SystemIterable, Iterator as SystemIterator, Sized
+from functools import partial
+from itertools import compress, count as Count, islice, repeat, takewhile
+from operator import is_, is_not
 from typing import final
 
-from WinCopies import Delegates, IInterface
-from WinCopies.Collections import ICountable, Countable as CountableBase
+from WinCopies import IInterface
+from WinCopies.Collections import Generator, ICountable, Countable as CountableBase
 from WinCopies.Collections.Abstraction import Countable
 from WinCopies.Typing import GenericConstraint, IGenericConstraintImplementation, IEquatableItem
-from WinCopies.Typing.Delegate import Converter, Method, Function, IFunction, ValueFunctionUpdater
+from WinCopies.Typing.Delegate import Action, Converter, Method, Function, Predicate, IFunction, ValueFunctionUpdater
+from WinCopies.Typing.Reflection import GetTypeCacheValue
 
 class IEnumeratorBase(IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -38,6 +44,8 @@ class IEnumeratorBase(IInterface):
     def HasProcessedItems(self) -> bool:
         pass
 class IEnumerator[T](IEnumeratorBase):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -49,7 +57,79 @@ class IEnumerator[T](IEnumeratorBase):
     def AsIterator(self) -> SystemIterator[T]:
         pass
 
+class IBatchEnumerator[T](IEnumerator[T]):
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__()
+    
+    @abstractmethod
+    def MoveNextBatch(self, items: list[T], count: int) -> int:
+        """Moves the enumerator forward by up to count items at once and appends these items to items.
+
+        Args:
+            items: The list to which the items are appended.
+            count: The maximum number of items to read.
+
+        Returns:
+            The number of items appended. Less than count means that the enumeration is completed.
+        """
+        pass
+
+def __IsImplementedBy(cls: type, provider: str, names: tuple[str, ...]) -> bool:
+    mro: tuple[type, ...] = cls.__mro__
+    index: int = 0
+
+    while provider not in mro[index].__dict__:
+        index += 1
+    
+    # The provider of a class stands for the given members as implemented by this class and its bases: it cannot be used if a subclass overrides one of them.
+    for name in names:
+        for i in range(index):
+            if name in mro[i].__dict__:
+                return False
+    
+    return True
+
+def _IsImplementedBy(cls: type, provider: str, *names: str) -> bool:
+    # The names only depend on the provider, so the provider is enough to key the result of a class.
+    return GetTypeCacheValue(cls, (_IsImplementedBy, provider), lambda: __IsImplementedBy(cls, provider, names))
+
+def _MoveNextBatch[T](enumerator: "EnumeratorBase[T]|__AbstractionEnumeratorBase[object, T, IEnumeratorBase]", items: list[T], count: int) -> int:
+    added: int = 0
+
+    while added < count and enumerator._MoveNextOverride():
+        items.append(enumerator.GetCurrent()) # type: ignore
+
+        added += 1
+    
+    return added
+def _MoveNextBatchFrom[T](enumerator: "EnumeratorBase[T]|__AbstractionEnumeratorBase[object, T, IEnumeratorBase]", items: list[T], count: int, isStarted: bool, onCompleted: Action) -> int:
+    added: int = 0
+
+    if not isStarted:
+        # The first item is read by MoveNext, so that the enumerator is started as usual.
+        if not enumerator.MoveNext():
+            return 0
+        
+        items.append(enumerator.GetCurrent()) # type: ignore
+
+        added = 1
+
+        if count == 1:
+            return 1
+    
+    # A batch provider that does not account for how a subclass reads items is replaced by the default one.
+    read: int = enumerator._MoveNextBatchOverride(items, count - added) if _IsImplementedBy(type(enumerator), "_MoveNextBatchOverride", "_MoveNextOverride", "GetCurrent") else _MoveNextBatch(enumerator, items, count - added)
+
+    if read < count - added:
+        onCompleted()
+    
+    return added + read
+
 class IteratorBase[T](SystemIterator[T], IEnumerator[T]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -168,7 +248,7 @@ class Enumerable[T](SystemIterable[T], IEnumerable[T]):
         return self
     
     def _TryGetIterator(self) -> SystemIterator[T]|None:
-        return self.GetEnumerator().AsIterator()
+        return GetNativeIterator(self.GetEnumerator())
     
     @final
     def __iter__(self) -> SystemIterator[T]:
@@ -200,43 +280,43 @@ class CountableEnumerable[T](Enumerable[T], ICountableEnumerable[T]):
     def AsSized(self) -> Sized:
         return self.__countable.GetValue()
 
-class EnumeratorBase[T](IteratorBase[T], IEnumerator[T]):
+class EnumeratorBase[T](IteratorBase[T], IBatchEnumerator[T]):
+    __slots__ = ("__state", "__isStarted", "__hasProcessedItems")
+
+    # The states of the enumeration. Stopping an enumerator does not change its state.
+    __NotStarted: int = 0
+    __Running: int = 1
+    __Ended: int = 2
+
     def __init__(self):
         super().__init__()
 
-        self.__moveNextFunc: Function[bool] = self.__MoveNext
+        self.__state: int = self.__NotStarted
         self.__isStarted: bool = False
         self.__hasProcessedItems: bool = False
     
     @final
-    def __MoveNext(self) -> bool:
-        def setCompletedMoveNext() -> None:
-            self.__moveNextFunc = Delegates.BoolFalse
-            
-            self.__OnCompleted()
-        
-        def moveNext() -> bool:
-            if self._MoveNextOverride():
-                return True
-
-            setCompletedMoveNext()
-
-            return False
-        
+    def __Start(self) -> bool:
         if self._OnStarting():
             self.__isStarted = True
             
             if self._MoveNextOverride():
-                self.__moveNextFunc = moveNext
+                self.__state = self.__Running
                 
                 self.__hasProcessedItems = True
                 
                 return True
         
-        setCompletedMoveNext()
+        self.__Complete()
 
         return False
     
+    @final
+    def __Complete(self) -> None:
+        self.__state = self.__Ended
+        
+        self.__OnCompleted()
+    
     @final
     def __OnTerminated(self, completed: bool) -> None:
         self.__isStarted = False
@@ -253,6 +333,21 @@ class EnumeratorBase[T](IteratorBase[T], IEnumerator[T]):
     def IsStarted(self):
         return self.__isStarted
     
+    def _TryGetNativeIterator(self) -> SystemIterator[T]|None:
+        return None
+    @final
+    def TryAsNativeIterator(self) -> SystemIterator[T]|None:
+        # Only an enumerator that has not moved yet can be replaced by a native iterator.
+        return self._TryGetNativeIterator() if self.__state == self.__NotStarted and _IsImplementedBy(type(self), "_TryGetNativeIterator", "_OnStarting", "_MoveNextOverride", "GetCurrent", "_OnCompleted", "_OnTerminated", "_OnEnded") else None
+    
+    def _MoveNextBatchOverride(self, items: list[T], count: int) -> int:
+        return _MoveNextBatch(self, items, count)
+    @final
+    def MoveNextBatch(self, items: list[T], count: int) -> int:
+        state: int = self.__state
+
+        return 0 if count <= 0 or state == self.__Ended else _MoveNextBatchFrom(self, items, count, state == self.__Running, self.__Complete)
+    
     @abstractmethod
     def _MoveNextOverride(self) -> bool:
         pass
@@ -273,7 +368,17 @@ class EnumeratorBase[T](IteratorBase[T], IEnumerator[T]):
 
     @final
     def MoveNext(self) -> bool:
-        return self.__moveNextFunc()
+        state: int = self.__state
+
+        if state == self.__Running:
+            if self._MoveNextOverride():
+                return True
+            
+            self.__Complete()
+
+            return False
+        
+        return self.__Start() if state == self.__NotStarted else False
     
     @final
     def Stop(self) -> None:
@@ -282,24 +387,21 @@ class EnumeratorBase[T](IteratorBase[T], IEnumerator[T]):
     
     @final
     def TryReset(self) -> bool|None:
-        def onReset() -> None:
-            self.__moveNextFunc = Delegates.BoolFalse
-        
         if self.IsResetSupported():
             if self.IsStarted():
                 self.Stop()
             
             if self._ResetOverride():
-                self.__moveNextFunc = self.__MoveNext
+                self.__state = self.__NotStarted
                 self.__hasProcessedItems = False
                 
                 return True
             
-            onReset()
+            self.__state = self.__Ended
             
             return False
         
-        onReset()
+        self.__state = self.__Ended
         
         return None
     
@@ -308,6 +410,8 @@ class EnumeratorBase[T](IteratorBase[T], IEnumerator[T]):
         return self.__hasProcessedItems
 
 class Enumerator[T](EnumeratorBase[T]):
+    __slots__ = ("__current",)
+
     def __init__(self):
         super().__init__()
 
@@ -327,6 +431,8 @@ class Enumerator[T](EnumeratorBase[T]):
         self.__current = current
 
 class Iterator[T](Enumerator[T]):
+    __slots__ = ("__iterator",)
+
     def __init__(self, iterator: SystemIterator[T]):
         super().__init__()
 
@@ -356,6 +462,18 @@ class Iterator[T](Enumerator[T]):
     def _ResetOverride(self) -> bool:
         return False
     
+    def _TryGetNativeIterator(self) -> SystemIterator[T]|None:
+        return self.__iterator
+    
+    def _MoveNextBatchOverride(self, items: list[T], count: int) -> int:
+        length: int = len(items)
+
+        items.extend(islice(self.__iterator, count))
+
+        self._SetCurrent(items[-1] if len(items) > length else None)
+
+        return len(items) - length
+    
     @staticmethod
     def Create(iterator: SystemIterator[T]) -> IEnumerator[T]:
         return iterator if isinstance(iterator, IEnumerator) else Iterator(iterator)
@@ -363,6 +481,42 @@ class Iterator[T](Enumerator[T]):
     def TryCreate(iterator: SystemIterator[T]|None) -> IEnumerator[T]|None:
         return None if iterator is None else Iterator[T].Create(iterator)
 
+# Runs in C, so that no Python function is called per item.
+__isNotNone: Predicate[object] = partial(is_not, None)
+
+def GetNativeIterator[T](enumerator: IEnumerator[T]) -> SystemIterator[T]:
+    iterator: SystemIterator[T]|None = enumerator.TryAsNativeIterator() if isinstance(enumerator, EnumeratorBase) else None
+
+    # The enumerator is bypassed, so it must not be used afterwards. Like IteratorBase, the iterator stops at the first None item.
+    return enumerator.AsIterator() if iterator is None else takewhile(__isNotNone, iterator)
+
+def MoveNextBatch[T](enumerator: IEnumerator[T], items: list[T], count: int) -> int:
+    if isinstance(enumerator, IBatchEnumerator):
+        return enumerator.MoveNextBatch(items, count) # type: ignore
+    
+    added: int = 0
+
+    while added < count and enumerator.MoveNext():
+        items.append(enumerator.GetCurrent()) # type: ignore
+
+        added += 1
+    
+    return added
+def EnumerateBatches[T](enumerator: IEnumerator[T], size: int) -> Generator[list[T]]:
+    if size <= 0:
+        raise ValueError("size must be greater than zero.")
+    
+    items: list[T] = []
+
+    # A batch shorter than size is the last one.
+    while MoveNextBatch(enumerator, items, size) == size:
+        yield items
+
+        items = []
+    
+    if len(items) > 0:
+        yield items
+
 def TryAsIterable[T](enumerable: IEnumerable[T]|None) -> SystemIterable[T]|None:
     return None if enumerable is None else enumerable.AsIterable()
 
@@ -474,11 +628,18 @@ class AbstractEnumerator[T](Selector[T, T]):
     def GetCurrent(self) -> T|None:
         return self._GetEnumerator().GetCurrent()
 
-class __AbstractionEnumeratorBase[TIn, TOut, TEnumerator: IEnumeratorBase](IteratorBase[TOut], IEnumerator[TOut], GenericConstraint[TEnumerator, IEnumerator[TIn]]):
+class __AbstractionEnumeratorBase[TIn, TOut, TEnumerator: IEnumeratorBase](IteratorBase[TOut], IBatchEnumerator[TOut], GenericConstraint[TEnumerator, IEnumerator[TIn]]):
+    __slots__ = ("__state",)
+
+    # The states of the enumeration, as for EnumeratorBase.
+    __NotStarted: int = 0
+    __Running: int = 1
+    __Ended: int = 2
+
     def __init__(self):
         super().__init__()
 
-        self.__moveNextFunc: Function[bool] = self.__MoveNext
+        self.__state: int = self.__NotStarted
     
     @abstractmethod
     def _GetEnumerator(self) -> TEnumerator:
@@ -494,26 +655,6 @@ class __AbstractionEnumeratorBase[TIn, TOut, TEnumerator: IEnumeratorBase](Itera
     def _ResetOverride(self) -> bool:
         pass
     
-    @final
-    def __MoveNext(self) -> bool:
-        if self._OnStarting():
-            def moveNext() -> bool:
-                if self._MoveNextOverride():
-                    return True
-                
-                self.__moveNextFunc = Delegates.BoolFalse
-
-                return False
-            
-            if moveNext():
-                self.__moveNextFunc = moveNext
-
-                return True
-        
-        self.__OnCompleted()
-        
-        return False
-    
     @final
     def __OnTerminated(self, completed: bool) -> None:
         self._OnTerminated(completed)
@@ -541,7 +682,41 @@ class __AbstractionEnumeratorBase[TIn, TOut, TEnumerator: IEnumeratorBase](Itera
         return self._GetEnumerator().IsStarted()
     @final
     def MoveNext(self) -> bool:
-        return self.__moveNextFunc()
+        state: int = self.__state
+
+        if state == self.__Running:
+            if self._MoveNextOverride():
+                return True
+            
+            # Unlike EnumeratorBase, the completion callbacks are only called when the enumeration ends at its start.
+            self.__state = self.__Ended
+
+            return False
+        
+        if state == self.__NotStarted:
+            if self._OnStarting():
+                if self._MoveNextOverride():
+                    self.__state = self.__Running
+
+                    return True
+                
+                self.__state = self.__Ended
+            
+            self.__OnCompleted()
+        
+        return False
+    
+    def _MoveNextBatchOverride(self, items: list[TOut], count: int) -> int:
+        return _MoveNextBatch(self, items, count)
+    @final
+    def __End(self) -> None:
+        # Like the running MoveNext, the completion callbacks are not called here.
+        self.__state = self.__Ended
+    @final
+    def MoveNextBatch(self, items: list[TOut], count: int) -> int:
+        state: int = self.__state
+
+        return 0 if count <= 0 or state == self.__Ended else _MoveNextBatchFrom(self, items, count, state == self.__Running, self.__End)
     @final
     def Stop(self) -> None:
         self._GetEnumerator().Stop()
@@ -556,11 +731,11 @@ class __AbstractionEnumeratorBase[TIn, TOut, TEnumerator: IEnumeratorBase](Itera
         result: bool|None = self._GetEnumerator().TryReset()
 
         if result is True and self._ResetOverride():
-            self.__moveNextFunc = self.__MoveNext
+            self.__state = self.__NotStarted
 
             return True
         
-        self.__moveNextFunc = Delegates.BoolFalse
+        self.__state = self.__Ended
         
         return result
     @final
@@ -571,6 +746,8 @@ class __AbstractionEnumeratorBase[TIn, TOut, TEnumerator: IEnumeratorBase](Itera
         return self._GetEnumerator().HasProcessedItems()
 
 class AbstractionEnumeratorBase[TIn, TOut, TEnumerator: IEnumeratorBase](__AbstractionEnumeratorBase[TIn, TOut, TEnumerator]):
+    __slots__ = ("__enumerator",)
+
     def __init__(self, enumerator: TEnumerator):
         super().__init__()
 
@@ -580,6 +757,8 @@ class AbstractionEnumeratorBase[TIn, TOut, TEnumerator: IEnumeratorBase](__Abstr
     def _GetEnumerator(self) -> TEnumerator:
         return self.__enumerator
 class AbstractionEnumerator[TIn, TOut](AbstractionEnumeratorBase[TIn, TOut, IEnumerator[TIn]], IGenericConstraintImplementation[IEnumerator[TIn]]):
+    __slots__ = ()
+
     def __init__(self, enumerator: IEnumerator[TIn]):
         super().__init__(enumerator)
 
@@ -620,6 +799,8 @@ class DelegateEnumerator[T](EnumeratorBase[T]):
         self.__moveNext = None
 
 class ConverterEnumerator[TIn, TOut](AbstractionEnumerator[TIn, TOut]):
+    __slots__ = ("__selector", "__current")
+
     def __init__(self, enumerator: IEnumerator[TIn], selector: Converter[TIn, TOut]):
         super().__init__(enumerator)
 
@@ -641,6 +822,25 @@ class ConverterEnumerator[TIn, TOut](AbstractionEnumerator[TIn, TOut]):
         
         return False
     
+    def _MoveNextBatchOverride(self, items: list[TOut], count: int) -> int:
+        values: list[TIn] = []
+
+        MoveNextBatch(self._GetEnumerator(), values, count)
+
+        # As for _MoveNextOverride, the enumeration ends at the first None item, which is found by identity as items can define an equality with None.
+        end: int|None = next(compress(Count(), map(is_, values, repeat(None))), None)
+
+        if end is not None:
+            del values[end:]
+        
+        length: int = len(items)
+
+        items.extend(map(self.__selector, values))
+
+        self.__current = items[-1] if len(items) > length else None
+
+        return len(items) - length
+    
     def _OnEnded(self) -> None:
         self.__current = None
         
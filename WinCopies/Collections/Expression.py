@@ -8,7 +8,7 @@ from WinCopies.Collections.Enumeration import IEnumerable, IEnumerator, Enumerat
 from WinCopies.Collections.Enumeration.Recursive import IRecursivelyEnumerable, IRecursiveEnumerationHandler, IRecursiveStackedEnumerationHandler, RecursiveEnumerator, StackedRecursiveEnumerator
 from WinCopies.Delegates import BoolFalse
 from WinCopies.Typing import INullable, GetNullable, GetNullValue
-from WinCopies.Typing.Delegate import Converter, Function, Method, IFunction, ValueFunctionUpdater
+from WinCopies.Typing.Delegate import Converter, Function, Method, Predicate, IFunction, ValueFunctionUpdater
 from WinCopies.Typing.Pairing import IKeyValuePair, DualResult
 
 class ICompositeExpressionNodeBase[TValue, TConnector](IInterface):
@@ -427,8 +427,8 @@ class CompositeExpressionValueEnumerator[TValue, TConnector](AbstractionEnumerat
         return True
 
 class CompositeExpressionRecursiveEnumerator[TValue, TConnector](RecursiveEnumerator[ICompositeExpression[TValue, TConnector]]):
-    def __init__(self, enumerator: IEnumerator[ICompositeExpression[TValue, TConnector]], handler: IRecursiveEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None):
-        super().__init__(enumerator, handler)
+    def __init__(self, enumerator: IEnumerator[ICompositeExpression[TValue, TConnector]], handler: IRecursiveEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None, maxDepth: int|None = None, prune: Predicate[ICompositeExpression[TValue, TConnector]]|None = None):
+        super().__init__(enumerator, handler, maxDepth, prune)
     
     @final
     def _GetEnumerationItems(self, enumerationItems: ICompositeExpression[TValue, TConnector]) -> IEnumerable[ICompositeExpression[TValue, TConnector]]:
@@ -436,8 +436,8 @@ class CompositeExpressionRecursiveEnumerator[TValue, TConnector](RecursiveEnumer
 
         return GetEmptyEnumerable() if items is None else items
 class CompositeExpressionStackedRecursiveEnumerator[TValue, TConnector](StackedRecursiveEnumerator[ICompositeExpression[TValue, TConnector]]):
-    def __init__(self, enumerator: IEnumerator[ICompositeExpression[TValue, TConnector]], enumerationOrder: EnumerationOrder, handler: IRecursiveStackedEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None):
-        super().__init__(enumerator, enumerationOrder, handler)
+    def __init__(self, enumerator: IEnumerator[ICompositeExpression[TValue, TConnector]], enumerationOrder: EnumerationOrder, handler: IRecursiveStackedEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None, maxDepth: int|None = None, prune: Predicate[ICompositeExpression[TValue, TConnector]]|None = None):
+        super().__init__(enumerator, enumerationOrder, handler, maxDepth, prune)
     
     @final
     def _GetEnumerationItems(self, enumerationItems: ICompositeExpression[TValue, TConnector]) -> IEnumerable[ICompositeExpression[TValue, TConnector]]:
@@ -489,20 +489,20 @@ class _CompositeExpressionRootBase[TValue, TConnector](_AbstractCompositeExpress
         return CompositeExpressionEnumerator[TValue, TConnector](self)
     
     @final
-    def TryGetRecursiveEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None) -> IEnumerator[ICompositeExpression[TValue, TConnector]]|None:
+    def TryGetRecursiveEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None, maxDepth: int|None = None, prune: Predicate[ICompositeExpression[TValue, TConnector]]|None = None) -> IEnumerator[ICompositeExpression[TValue, TConnector]]|None:
         if enumerationOrder == EnumerationOrder.Null:
             return None
         
         match enumerationOrder:
             case EnumerationOrder.FIFO:
-                return CompositeExpressionRecursiveEnumerator[TValue, TConnector](self.TryGetEnumerator(), handler)
+                return CompositeExpressionRecursiveEnumerator[TValue, TConnector](self.TryGetEnumerator(), handler, maxDepth, prune)
             case EnumerationOrder.LIFO:
-                return self.TryGetRecursiveStackedEnumerator(EnumerationOrder.LIFO, None if handler is None else handler.AsStackHandler())
+                return self.TryGetRecursiveStackedEnumerator(EnumerationOrder.LIFO, None if handler is None else handler.AsStackHandler(), maxDepth, prune)
             case _:
                 raise ValueError(enumerationOrder)
     @final
-    def TryGetRecursiveStackedEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None) -> IEnumerator[ICompositeExpression[TValue, TConnector]]|None:
-        return None if enumerationOrder == EnumerationOrder.Null else CompositeExpressionStackedRecursiveEnumerator(self.TryGetEnumerator(), enumerationOrder, handler)
+    def TryGetRecursiveStackedEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None, maxDepth: int|None = None, prune: Predicate[ICompositeExpression[TValue, TConnector]]|None = None) -> IEnumerator[ICompositeExpression[TValue, TConnector]]|None:
+        return None if enumerationOrder == EnumerationOrder.Null else CompositeExpressionStackedRecursiveEnumerator(self.TryGetEnumerator(), enumerationOrder, handler, maxDepth, prune)
     
     @final
     def TryGetRecursiveValueEnumerator(self, enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveEnumerationHandler[ICompositeExpression[TValue, TConnector]]|None = None) -> IEnumerator[IKeyValuePair[TValue, INullable[TConnector]]]|None:
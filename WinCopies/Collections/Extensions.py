@@ -5,7 +5,7 @@ from collections.abc import Sized, Container, Iterable, Iterator, Collection as
 from typing import overload, final, SupportsIndex
 
 from WinCopies import Collections, Abstract, IStringable
-from WinCopies.Collections import Enumeration, ICountableCollection, IReadOnlyCountableList, ICountableList as ICountableListBase, IGetter, ISetter, IndexOf
+from WinCopies.Collections import Enumeration, ICountableCollection, IReadOnlyCountableList, ICountableList as ICountableListBase, IGetter, ISetter, ISequenceIndexProvider, SequenceIndex, IndexOf
 from WinCopies.Collections.Abstraction.Enumeration import Enumerator
 from WinCopies.Collections.Enumeration import ICountableEnumerable, IEquatableEnumerable, IEnumerator, CountableEnumerable, GetIterator, TryAsIterator
 from WinCopies.Typing import INullable, IEquatableItem, IGenericConstraint, GenericConstraint, GenericSpecializedConstraint, IGenericConstraintImplementation, IGenericSpecializedConstraintImplementation
@@ -248,7 +248,7 @@ class _Reversed[TItem, TCollection](Sequence[TItem], ITuple[TItem], GenericConst
     
     @final
     def GetCount(self) -> int:
-        return self.GetCount()
+        return self._GetInnerContainer().GetCount()
     
     @final
     def TryGetAt[TDefault](self, key: int, defaultValue: TDefault) -> DualValueBool[TItem|TDefault]:
@@ -284,7 +284,7 @@ class _Reversed[TItem, TCollection](Sequence[TItem], ITuple[TItem], GenericConst
 
 class _ReadOnlyTuple[T](Abstract, ITuple[T], IStringable):
     @final
-    class __Reversed(_Reversed[T, ITuple[T]], IGenericConstraintImplementation[ITuple[T]]):
+    class Reversed(_Reversed[T, ITuple[T]], IGenericConstraintImplementation[ITuple[T]]):
         def __init__(self, items: ITuple[T]):
             super().__init__(items)
         
@@ -304,7 +304,7 @@ class _ReadOnlyTuple[T](Abstract, ITuple[T], IStringable):
             self.__array: ITuple[T] = array
         
         def _GetValue(self) -> ITuple[T]:
-            return _ReadOnlyTuple[T].__Reversed(self.__array)
+            return _ReadOnlyTuple[T].Reversed(self.__array)
     
     def __init__(self, items: IArray[T]):
         def update(func: IFunction[ITuple[T]]) -> None:
@@ -413,8 +413,10 @@ class KeyableBase[TKey, TValue](GetterBase[TKey, TValue], SetterBase[TKey, TValu
     def __init__(self):
         super().__init__()
 
-class TupleBase[T](Collections.Tuple[T], GetterBase[int, T], ITuple[T]):
+class TupleBase[T](Collections.Tuple[T], GetterBase[int, T], ITuple[T], ISequenceIndexProvider[T]):
     class EnumeratorBase[TItem, TList](Enumeration.EnumeratorBase[TItem], GenericConstraint[TList, ITuple[TItem]]):
+        __slots__ = ("__list", "__i")
+
         def __init__(self, items: TList):
             super().__init__()
 
@@ -443,32 +445,72 @@ class TupleBase[T](Collections.Tuple[T], GetterBase[int, T], ITuple[T]):
 
             return True
     class Enumerator(EnumeratorBase[T, ITuple[T]], IGenericConstraintImplementation[ITuple[T]]):
+        __slots__ = ()
+
         def __init__(self, items: ITuple[T]):
             super().__init__(items)
     
     def __init__(self):
         super().__init__()
     
+    @final
+    def __GetIndex(self, index: int|None) -> int:
+        return -1 if index is None else index
+    
     @final
     def __FindIndex(self, sequence: SequenceBase[T], item: T, predicate: EqualityComparison[T]|None) -> int:
-        result: int|None = IndexOf(sequence, item, predicate)
-
-        return -1 if result is None else result
+        return self.__GetIndex(IndexOf(sequence, item, predicate))
     
     @final
     def FindFirstIndex(self, item: T, predicate: EqualityComparison[T]|None = None) -> int:
-        return self.__FindIndex(self.AsSequence(), item, predicate)
+        index: SequenceIndex[T]|None = self.TryGetSequenceIndex() if predicate is None else None
+
+        return self.__FindIndex(self.AsSequence(), item, predicate) if index is None else self.__GetIndex(index.GetFirstIndex(item))
     @final
     def FindLastIndex(self, item: T, predicate: EqualityComparison[T]|None = None) -> int:
-        return self.__FindIndex(self.AsReversed().AsSequence(), item, predicate)
+        """Returns the position of the last occurrence of item, counted from the end, as in the reversed tuple: 0 is the last item. Returns -1 if item is not found."""
+        index: SequenceIndex[T]|None = self.TryGetSequenceIndex() if predicate is None else None
+
+        if index is None:
+            return self.__FindIndex(self.AsReversed().AsSequence(), item, predicate)
+        
+        # The index counts the positions from the start, while this method counts them from the end, as in the reversed tuple.
+        last: int|None = index.GetLastIndex(item)
+
+        return -1 if last is None else index.GetCount() - 1 - last
+    
+    # Not final so that the immutable tuples can be indexed.
+    def TryGetSequenceIndex(self) -> SequenceIndex[T]|None:
+        return None
     
     # Not final to allow customization for the enumerator.
     def TryGetEnumerator(self) -> IEnumerator[T]:
         return TupleBase[T].Enumerator(self)
 
-class Tuple[T](TupleBase[T]):
+class _IndexableTuple[T](TupleBase[T]):
+    def __init__(self):
+        super().__init__()
+
+        self.__index: SequenceIndex[T]|None = None
+    
+    @final
+    def AttachIndex(self) -> SequenceIndex[T]:
+        # The items of a tuple do not change, so its index is built once, on the first call, and then used by the searches on it until it is detached.
+        if self.__index is None:
+            self.__index = SequenceIndex[T](self.AsSequence())
+        
+        return self.__index
+    @final
+    def DetachIndex(self) -> None:
+        self.__index = None
+    
+    @final
+    def TryGetSequenceIndex(self) -> SequenceIndex[T]|None:
+        return self.__index
+
+class Tuple[T](_IndexableTuple[T]):
     @final
-    class __Reversed(_Reversed[T, ITuple[T]], IGenericConstraintImplementation[ITuple[T]]):
+    class Reversed(_Reversed[T, ITuple[T]], IGenericConstraintImplementation[ITuple[T]]):
         def __init__(self, items: ITuple[T]):
             super().__init__(items)
         
@@ -488,7 +530,7 @@ class Tuple[T](TupleBase[T]):
             self.__array: Tuple[T] = array
         
         def _GetValue(self) -> ITuple[T]:
-            return Tuple[T].__Reversed(self.__array)
+            return Tuple[T].Reversed(self.__array)
     
     def __init__(self):
         def update(func: IFunction[ITuple[T]]) -> None:
@@ -501,9 +543,9 @@ class Tuple[T](TupleBase[T]):
     @final
     def AsReversed(self) -> ITuple[T]:
         return self.__reversed.GetValue()
-class EquatableTuple[T: IEquatableItem](TupleBase[T], IEquatableTuple[T]):
+class EquatableTuple[T: IEquatableItem](_IndexableTuple[T], IEquatableTuple[T]):
     @final
-    class __Reversed(_Reversed[T, IEquatableTuple[T]], IEquatableTuple[T], IGenericConstraintImplementation[IEquatableTuple[T]]):
+    class Reversed(_Reversed[T, IEquatableTuple[T]], IEquatableTuple[T], IGenericConstraintImplementation[IEquatableTuple[T]]):
         def __init__(self, items: IEquatableTuple[T]):
             super().__init__(items)
         
@@ -529,7 +571,7 @@ class EquatableTuple[T: IEquatableItem](TupleBase[T], IEquatableTuple[T]):
             self.__array: EquatableTuple[T] = array
         
         def _GetValue(self) -> IEquatableTuple[T]:
-            return EquatableTuple[T].__Reversed(self.__array)
+            return EquatableTuple[T].Reversed(self.__array)
     
     def __init__(self):
         def update(func: IFunction[IEquatableTuple[T]]) -> None:
@@ -622,7 +664,7 @@ class ArrayBase[TItem, TCollection](TupleBase[TItem], KeyableBase[int, TItem], I
 
 class Array[T](Collections.Array[T], ArrayBase[T, IArray[T]]):
     @final
-    class __Reversed(ArrayBase[T, IArray[T]].Reversed, IGenericSpecializedConstraintImplementation[ITuple[T], IArray[T]]):
+    class Reversed(ArrayBase[T, IArray[T]].Reversed, IGenericSpecializedConstraintImplementation[ITuple[T], IArray[T]]):
         def __init__(self, items: IArray[T]):
             super().__init__(items)
     
@@ -634,7 +676,7 @@ class Array[T](Collections.Array[T], ArrayBase[T, IArray[T]]):
             self.__array: Array[T] = array
         
         def _GetValue(self) -> IArray[T]:
-            return Array[T].__Reversed(self.__array)
+            return Array[T].Reversed(self.__array)
     
     def __init__(self):
         super().__init__()
@@ -704,7 +746,7 @@ class ReversedListBase[TItem, TList](ArrayBase[TItem, TList].Reversed, MutableSe
 
 class List[T](Collections.List[T], ArrayBase[T, IList[T]], IList[T]):
     @final
-    class __Reversed(ReversedListBase[T, IList[T]], IGenericSpecializedConstraintImplementation[ITuple[T], IList[T]]):
+    class Reversed(ReversedListBase[T, IList[T]], IGenericSpecializedConstraintImplementation[ITuple[T], IList[T]]):
         def __init__(self, items: IList[T]):
             super().__init__(items)
         
@@ -719,7 +761,7 @@ class List[T](Collections.List[T], ArrayBase[T, IList[T]], IList[T]):
             self.__array: List[T] = array
         
         def _GetValue(self) -> IList[T]:
-            return List[T].__Reversed(self.__array)
+            return List[T].Reversed(self.__array)
     
     def __init__(self):
         super().__init__()
@@ -1,4 +1,5 @@
 from collections.abc import Iterable, Iterator
+from itertools import islice
 
 from WinCopies import NullableBoolean
 from WinCopies.Collections import Enumeration, Generator, IterationResult
@@ -32,8 +33,7 @@ def Concatenate[T](collection: Iterable[Iterable[T]|None]|None) -> Generator[T]:
         Items from all iterables in the collection.
     """
     for iterable in TryEnumerate(collection):
-        for item in TryEnumerate(iterable):
-            yield item
+        yield from TryEnumerate(iterable)
 
 def Append[T](items: Iterable[T]|None, values: Iterable[T]|None) -> Generator[T]:
     """Appends values to the end of items.
@@ -45,11 +45,8 @@ def Append[T](items: Iterable[T]|None, values: Iterable[T]|None) -> Generator[T]
     Yields:
         All items followed by all values.
     """
-    for item in TryEnumerate(items):
-        yield item
-
-    for value in TryEnumerate(values):
-        yield value
+    yield from TryEnumerate(items)
+    yield from TryEnumerate(values)
 def AppendItem[T](items: Iterable[T]|None, value: T) -> Generator[T]:
     """Appends a single item to the end of items.
 
@@ -60,8 +57,7 @@ def AppendItem[T](items: Iterable[T]|None, value: T) -> Generator[T]:
     Yields:
         All items followed by the value.
     """
-    for item in TryEnumerate(items):
-        yield item
+    yield from TryEnumerate(items)
 
     yield value
 def AppendValues[T](items: Iterable[T]|None, *values: T) -> Generator[T]:
@@ -99,8 +95,7 @@ def PrependItem[T](items: Iterable[T]|None, value: T) -> Generator[T]:
     """
     yield value
 
-    for item in TryEnumerate(items):
-        yield item
+    yield from TryEnumerate(items)
 def PrependValues[T](items: Iterable[T]|None, *values: T) -> Generator[T]:
     """Prepends variadic values to the beginning of items.
 
@@ -328,6 +323,46 @@ def SelectWhere[TIn, TOut](items: Iterable[TIn]|None, converter: Converter[TIn,
         if predicate(result := converter(item)):
             yield result
 
+def Batch[T](items: Iterable[T]|None, size: int) -> Generator[list[T]]:
+    """Groups items into lists of a given size, so that they can be processed per chunk.
+
+    Args:
+        items: The items to group. Batched enumerators are read through MoveNextBatch; as such, their None items are not considered as the end of the enumeration.
+        size: The maximum number of items per list.
+
+    Yields:
+        Lists of size items, except for the last one, which can be shorter.
+
+    Raises:
+        ValueError: size is less than or equal to zero.
+    """
+    if size <= 0:
+        raise ValueError("size must be greater than zero.")
+    
+    if isinstance(items, Enumeration.IBatchEnumerator):
+        yield from Enumeration.EnumerateBatches(items, size)
+
+        return
+    
+    iterator: Iterator[T] = iter(TryEnumerate(items))
+    batch: list[T]
+
+    while len(batch := list(islice(iterator, size))) > 0:
+        yield batch
+def SelectBatch[TIn, TOut](items: Iterable[TIn]|None, converter: Converter[TIn, TOut], size: int) -> Generator[list[TOut]]:
+    """Transforms items per chunk of a given size.
+
+    Args:
+        items: The items to transform.
+        converter: The function to transform each item.
+        size: The maximum number of items per chunk.
+
+    Yields:
+        Lists of transformed items, as returned by Batch.
+    """
+    for batch in Batch(items, size):
+        yield list(map(converter, batch))
+
 def Include[T](items: Iterable[T]|None, predicate: Predicate[T]) -> Generator[T]:
     """Includes only items that match a given predicate.
 
@@ -461,6 +496,17 @@ def TryGetFirst[T](items: Iterable[T]|None) -> INullable[T]|None:
         return GetNullable(item)
 
     return GetNullValue()
+def TryGetFirstValue[T, TDefault](items: Iterable[T]|None, default: TDefault) -> T|TDefault:
+    """Tries to get the first item from an iterable, without allocating an INullable.
+
+    Args:
+        items: The items to process.
+        default: The value to return if items is None or empty.
+
+    Returns:
+        The first item if found, or default otherwise.
+    """
+    return default if items is None else next(iter(items), default)
 
 def Any[T](items: Iterable[T]|None) -> bool|None:
     """Checks if an iterable contains any items.
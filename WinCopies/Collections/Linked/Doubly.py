@@ -16,6 +16,8 @@ from WinCopies.Typing.Delegate import Method, Function, Converter, IFunction, Va
 from WinCopies.Typing.Reflection import EnsureDirectModuleCall
 
 class INode[T](ILinkedNode[T]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -38,6 +40,8 @@ class INode[T](ILinkedNode[T]):
     def Remove(self) -> T:
         pass
 class IDoublyLinkedNode[T](INode[T]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -45,6 +49,8 @@ class IDoublyLinkedNode[T](INode[T]):
     def GetList(self) -> IList[T]|None:
         pass
 class IDoublyLinkedNodeBase[TItem, TNode](INode[TItem]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -52,6 +58,10 @@ class IDoublyLinkedNodeBase[TItem, TNode](INode[TItem]):
     def _AsNode(self) -> TNode:
         pass
     
+    @abstractmethod
+    def _Reset(self, value: TItem, previousNode: TNode|None, nextNode: TNode|None) -> None:
+        pass
+    
     @final
     def SetPreviousNode(self, value: TItem) -> TNode:
         return self.SetPrevious(value)._AsNode()
@@ -60,6 +70,8 @@ class IDoublyLinkedNodeBase[TItem, TNode](INode[TItem]):
         return self.SetNext(value)._AsNode()
 
 class NodeBase[TItem, TNode: 'NodeBase'](LinkedNode[TNode, TItem], IDoublyLinkedNodeBase[TItem, TNode]):
+    __slots__ = ("__previous",)
+
     def __init__(self, value: TItem, previousNode: TNode|None, nextNode: TNode|None):
         super().__init__(value, nextNode)
 
@@ -71,6 +83,13 @@ class NodeBase[TItem, TNode: 'NodeBase'](LinkedNode[TNode, TItem], IDoublyLinked
     @final
     def _SetPrevious(self, previous: TNode|None) -> None:
         self.__previous = previous
+    
+    @final
+    def _Reset(self, value: TItem, previousNode: TNode|None, nextNode: TNode|None) -> None:
+        self.SetValue(value)
+        self._SetNext(nextNode)
+
+        self.__previous = previousNode
 
 class IReadOnlyList[T](IReadOnlyCollection):
     def __init__(self):
@@ -87,10 +106,9 @@ class IReadOnlyList[T](IReadOnlyCollection):
     def __TryGetValue[TDefault](self, default: TDefault, item: INullable[T]) -> T|TDefault:
         return item.GetValue() if item.HasValue() else default
     
-    @final
+    # The following methods do not allocate an INullable when overridden by the lists that can read their nodes directly.
     def TryGetFirstValue[TDefault](self, default: TDefault) -> T|TDefault:
         return self.__TryGetValue(default, self.TryGetFirst())
-    @final
     def TryGetLastValue[TDefault](self, default: TDefault) -> T|TDefault:
         return self.__TryGetValue(default, self.TryGetLast())
     
@@ -109,6 +127,8 @@ class __IAbstractList[TItem, TNode](IInterface):
     def _GetNodeAsInterface(self, node: TNode) -> IDoublyLinkedNodeBase[TItem, TNode]:
         pass
 class IAbstractNode[TNode, TNodeInterface](IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -135,10 +155,9 @@ class IReadWriteList[T](IReadOnlyList[T]):
     def GetLastNode(self) -> INode[T]|None:
         pass
     
-    @final
+    # The following methods are overridden by the lists that can read their nodes without handing them out.
     def TryGetFirst(self) -> INullable[T]:
         return self.__TryGet(self.GetFirstNode())
-    @final
     def TryGetLast(self) -> INullable[T]:
         return self.__TryGet(self.GetLastNode())
     
@@ -150,10 +169,7 @@ class IReadWriteList[T](IReadOnlyList[T]):
         pass
 
     @final
-    def __AddItems(self, items: Iterable[T]|None, first: Converter[T, INode[T]]) -> bool:
-        if items is None:
-            return False
-        
+    def __AddItems(self, items: Iterable[T], first: Converter[T, INode[T]]) -> None:
         node: INode[T] = None # type: ignore
         adder: Converter[T, INode[T]]|None = None
 
@@ -171,18 +187,32 @@ class IReadWriteList[T](IReadOnlyList[T]):
 
         for item in items:
             node = adder(item)
-        
-        return True
+    
+    # The following methods add the items one at a time; they are overridden by the lists that can link the nodes of all the items before adding them at once.
+    def _AddFirstItems(self, items: Iterable[T]) -> None:
+        self.__AddItems(items, self.AddFirstNode)
+    def _AddLastItems(self, items: Iterable[T]) -> None:
+        self.__AddItems(items, self.AddLastNode)
 
     @final
     def AddFirstItems(self, items: Iterable[T]|None) -> bool:
-        return self.__AddItems(items, self.AddFirstNode)
+        if items is None:
+            return False
+        
+        self._AddFirstItems(items)
+
+        return True
     @final
     def AddFirstValues(self, *values: T) -> bool:
         return self.AddFirstItems(values)
     @final
     def AddLastItems(self, items: Iterable[T]|None) -> bool:
-        return self.__AddItems(items, self.AddLastNode)
+        if items is None:
+            return False
+        
+        self._AddLastItems(items)
+
+        return True
     @final
     def AddLastValues(self, *values: T) -> bool:
         return self.AddLastItems(values)
@@ -194,6 +224,12 @@ class IReadWriteList[T](IReadOnlyList[T]):
     def TryRemoveLast(self) -> INullable[T]:
         pass
     
+    # The following methods do not allocate an INullable; they are overridden by the lists that can remove a node directly.
+    def TryRemoveFirstValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return self.TryRemoveFirst().TryGetValueOrDefault(default)
+    def TryRemoveLastValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return self.TryRemoveLast().TryGetValueOrDefault(default)
+    
     @abstractmethod
     def Clear(self) -> None:
         pass
@@ -281,6 +317,8 @@ class IList[T](IEnumerableList[T, IDoublyLinkedNode[T]]):
         super().__init__()
 
 class _INodeBase[TItem, TNode, TNodeInterface, TList](IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -296,6 +334,8 @@ class _INodeBase[TItem, TNode, TNodeInterface, TList](IInterface):
         pass
 
 class DoublyLinkedNodeBase[TItem, TNode: "DoublyLinkedNodeBase", TList, TListInterface](NodeBase[TItem, TNode], IGenericConstraint[TList, IReadWriteList[TItem]]):
+    __slots__ = ("__list",)
+
     def __init__(self, value: TItem, l: TListInterface|None, previousNode: TNode|None, nextNode: TNode|None):
         EnsureDirectModuleCall()
 
@@ -315,6 +355,16 @@ class DoublyLinkedNodeBase[TItem, TNode: "DoublyLinkedNodeBase", TList, TListInt
     def _GetInnerList(self) -> TListInterface|None:
         return self.__list
     
+    @final
+    def _CreateSibling(self, value: TItem, previousNode: TNode|None, nextNode: TNode|None) -> SelfType:
+        # Creates a node of the list of this one without calling the initializers, which do not set anything else than the fields set here, nor checking the caller, for the lists that link many nodes at once after creating a first one.
+        node: SelfType = object.__new__(type(self))
+
+        node.__list = self.__list
+        node._Reset(value, previousNode, nextNode)
+
+        return node
+    
     @abstractmethod
     def _GetListAsClass(self, l: TListInterface) -> TList:
         pass
@@ -516,9 +566,22 @@ class _ReadOnlyListBase[TItem, TList](IReadOnlyList[TItem], GenericConstraint[TL
     @final
     def TryGetLast(self) -> INullable[TItem]:
         return self._GetInnerContainer().TryGetLast()
+    
+    @final
+    def TryGetFirstValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        return self._GetInnerContainer().TryGetFirstValue(default)
+    @final
+    def TryGetLastValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        return self._GetInnerContainer().TryGetLastValue(default)
 
 class EnumerableList[TItem, TNode, TNodeInterface, TList](Enumerable[TItem], IEnumerableList[TItem, TNodeInterface], __IAbstractList[TItem, TNode], IAbstractNode[TNode, TNodeInterface]):
+    # The maximum number of removed nodes that a list keeps to hold its next items, so that a list whose items are added and removed in turn, such as a queue, does not allocate a node for each item. No node is kept if zero.
+    # Only the nodes that the list never handed out are kept: once a caller gets a node, from AddFirst, AddLast, GetFirst or GetLast, or an enumerator is created, the removed nodes are no longer kept until the list is empty, as a node that it holds can lead to the other ones.
+    _NodePoolCapacity: int = 1024
+
     class NodeBase(_INodeBase[TItem, TNode, TNodeInterface, TList]):
+        __slots__ = ()
+
         def __init__(self):
             super().__init__()
         
@@ -590,6 +653,10 @@ class EnumerableList[TItem, TNode, TNodeInterface, TList](Enumerable[TItem], IEn
         
         self.__first: TNode|None = None
         self.__last: TNode|None = None
+        # The removed nodes that can be reused, which no longer reference any item nor any other node.
+        self.__nodes: list[TNode] = []
+        # Whether nodes of this list may be referenced by a caller or an enumerator.
+        self.__isShared: bool = False
 
         self.__nodeEnumerable: IFunction[IEnumerable[TNodeInterface]] = EnumerableList[TItem, TNode, TNodeInterface, TList].__EnumerableUpdater(self, updateNodeEnumerable)
         self.__readOnly: IFunction[IReadOnlyList[TItem]] = EnumerableList[TItem, TNode, TNodeInterface, TList].__ReadOnlyUpdater(self, updateReadOnly)
@@ -619,7 +686,39 @@ class EnumerableList[TItem, TNode, TNodeInterface, TList](Enumerable[TItem], IEn
     
     @final
     def __TryGetNodeAsClass(self, node: TNode|None) -> TNodeInterface|None:
-        return None if node is None else self._GetNodeAsClass(node)
+        if node is None:
+            return None
+        
+        self.__isShared = True
+
+        return self._GetNodeAsClass(node)
+    
+    @final
+    def _TryReuseNode(self, value: TItem, previousNode: TNode|None, nextNode: TNode|None) -> TNode|None:
+        if len(self.__nodes) == 0:
+            return None
+        
+        node: TNode = self.__nodes.pop()
+
+        self._GetNodeAsInterface(node)._Reset(value, previousNode, nextNode)
+
+        return node
+    
+    @final
+    def __RemoveNode(self, node: TNode) -> TItem:
+        value: TItem = self._GetNodeAsInterface(node).Remove()
+
+        if self.__isShared:
+            # The removed nodes no longer reference any other node: the nodes that were handed out cannot lead to the next ones.
+            if self.__first is None:
+                self.__isShared = False
+        
+        elif len(self.__nodes) < self._NodePoolCapacity:
+            self._GetNodeAsInterface(node)._Reset(None, None, None) # type: ignore
+
+            self.__nodes.append(node)
+
+        return value
     
     def _AsReadOnly(self) -> IReadOnlyList[TItem]:
         return EnumerableList[TItem, TNode, TNodeInterface, TList]._ReadOnlyList(self)
@@ -648,15 +747,91 @@ class EnumerableList[TItem, TNode, TNodeInterface, TList](Enumerable[TItem], IEn
         
         return node
     
+    # Called once the nodes of several items are added at once.
+    def _OnNodesAdded(self, count: int) -> None:
+        pass
+    
+    @final
+    def __LinkNodes(self, items: Iterable[TItem]) -> tuple[TNode, TNode, int]|None:
+        # Links the nodes of items to each other, without adding them to this list, and returns the first and last ones with their count, or None if there is no item.
+        iterator: Iterator[TItem] = iter(items)
+
+        for value in iterator:
+            first: TNode = self._GetNode(value)
+
+            break
+        
+        else:
+            return None
+        
+        last: TNode = first
+        count: int = 1
+
+        for value in iterator:
+            node: TNode|None = self._TryReuseNode(value, last, None)
+
+            if node is None:
+                node = last._CreateSibling(value, last, None) # type: ignore
+            
+            last._SetNext(node) # type: ignore
+
+            last = node
+            count += 1
+        
+        return (first, last, count)
+    
+    @final
+    def _AddFirstItems(self, items: Iterable[TItem]) -> None:
+        nodes: tuple[TNode, TNode, int]|None = self.__LinkNodes(items)
+
+        if nodes is None:
+            return
+        
+        first, last, count = nodes
+
+        if self.__first is None:
+            self.__last = last
+        
+        else:
+            last._SetNext(self.__first) # type: ignore
+            self.__first._SetPrevious(last) # type: ignore
+        
+        self.__first = first
+
+        self._OnNodesAdded(count)
+    @final
+    def _AddLastItems(self, items: Iterable[TItem]) -> None:
+        nodes: tuple[TNode, TNode, int]|None = self.__LinkNodes(items)
+
+        if nodes is None:
+            return
+        
+        first, last, count = nodes
+
+        if self.__last is None:
+            self.__first = first
+        
+        else:
+            self.__last._SetNext(first) # type: ignore
+            first._SetPrevious(self.__last) # type: ignore
+        
+        self.__last = last
+
+        self._OnNodesAdded(count)
+    
     @final
     def AddFirst(self, value: TItem) -> TNodeInterface:
         node: TNode|None = self._GetFirst()
         
+        self.__isShared = True
+
         return self._GetNodeAsClass(self._AddNode(value) if node is None else self._GetNodeAsInterface(node).SetPreviousNode(value))
     @final
     def AddLast(self, value: TItem) -> TNodeInterface:
         node: TNode|None = self._GetLast()
         
+        self.__isShared = True
+
         return self._GetNodeAsClass(self._AddNode(value) if node is None else self._GetNodeAsInterface(node).SetNextNode(value))
     
     @final
@@ -666,23 +841,46 @@ class EnumerableList[TItem, TNode, TNodeInterface, TList](Enumerable[TItem], IEn
     def GetLast(self) -> TNodeInterface|None:
         return self.__TryGetNodeAsClass(self._GetLast())
     
+    @final
+    def TryGetFirst(self) -> INullable[TItem]:
+        return GetNullValue() if self.__first is None else GetNullable(self._GetNodeAsInterface(self.__first).GetValue())
+    @final
+    def TryGetLast(self) -> INullable[TItem]:
+        return GetNullValue() if self.__last is None else GetNullable(self._GetNodeAsInterface(self.__last).GetValue())
+    
+    @final
+    def TryGetFirstValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        return default if self.__first is None else self._GetNodeAsInterface(self.__first).GetValue()
+    @final
+    def TryGetLastValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        return default if self.__last is None else self._GetNodeAsInterface(self.__last).GetValue()
+    
     @final
     def TryRemoveFirst(self) -> INullable[TItem]:
         node: TNode|None = self._GetFirst()
 
-        return GetNullValue() if node is None else GetNullable(self._GetNodeAsInterface(node).Remove())
+        return GetNullValue() if node is None else GetNullable(self.__RemoveNode(node))
     @final
     def TryRemoveLast(self) -> INullable[TItem]:
         node: TNode|None = self._GetLast()
 
-        return GetNullValue() if node is None else GetNullable(self._GetNodeAsInterface(node).Remove())
+        return GetNullValue() if node is None else GetNullable(self.__RemoveNode(node))
     
     @final
-    def Clear(self) -> None:
-        node: INullable[TItem] = self.TryRemoveFirst()
+    def TryRemoveFirstValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        node: TNode|None = self._GetFirst()
 
-        while node.HasValue():
-            node = self.TryRemoveFirst()
+        return default if node is None else self.__RemoveNode(node)
+    @final
+    def TryRemoveLastValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        node: TNode|None = self._GetLast()
+
+        return default if node is None else self.__RemoveNode(node)
+    
+    @final
+    def Clear(self) -> None:
+        while not self.IsEmpty():
+            self.TryRemoveFirstValue(None)
     
     @abstractmethod
     def _GetNodeEnumerator(self, node: TNodeInterface) -> IEnumerator[TNodeInterface]:
@@ -692,7 +890,12 @@ class EnumerableList[TItem, TNode, TNodeInterface, TList](Enumerable[TItem], IEn
     def TryGetEnumerator(self) -> IEnumerator[TItem]|None:
         first: TNode|None = self._GetFirst()
 
-        return None if self.IsEmpty() or first is None else GetValueEnumeratorFromNode(self._GetNodeAsInterface(first)) # self.GetFirst() should not be None if self.IsEmpty().
+        if self.IsEmpty() or first is None: # self.GetFirst() should not be None if self.IsEmpty().
+            return None
+        
+        self.__isShared = True
+
+        return GetValueEnumeratorFromNode(self._GetNodeAsInterface(first))
     
     @final
     def TryGetNodeEnumerator(self) -> IEnumerator[TNodeInterface]|None:
@@ -720,6 +923,8 @@ class ListBase[TItem, TNode](EnumerableList[TItem, TNode, IDoublyLinkedNode[TIte
         return DoublyLinkedNodeEnumerator[TItem](node)
 
 class _DoublyLinkedNode[TItem, TNode: "_DoublyLinkedNode", TNodeInterface, TList, TListInterface](DoublyLinkedNodeBase[TItem, TNode, TList, TListInterface], _INodeBase[TItem, TNode, TNodeInterface, TListInterface], IAbstractNode[TNode, TNodeInterface]):
+    __slots__ = ()
+
     def __init__(self, value: TItem, l: TListInterface|None, previousNode: TNode|None, nextNode: TNode|None):
         super().__init__(value, l, previousNode, nextNode)
     
@@ -745,6 +950,8 @@ class _DoublyLinkedNode[TItem, TNode: "_DoublyLinkedNode", TNodeInterface, TList
         self._SetLast(l, None)
 
 class DoublyLinkedNode[TItem, TNode: "DoublyLinkedNode", TNodeInterface, TList, TListInterface](_DoublyLinkedNode[TItem, TNode, TNodeInterface, TList, TListInterface]):
+    __slots__ = ()
+
     def __init__(self, value: TItem, l: TListInterface|None, previousNode: TNode|None, nextNode: TNode|None):
         super().__init__(value, l, previousNode, nextNode)
     
@@ -762,6 +969,8 @@ class DoublyLinkedNode[TItem, TNode: "DoublyLinkedNode", TNodeInterface, TList,
 
 @final
 class _Node[T](DoublyLinkedNode[T, "_Node", IDoublyLinkedNode[T], IList[T], ListBase[T, "_Node"]], EnumerableList[T, "_Node", IDoublyLinkedNode[T], ListBase[T, "_Node"]].NodeBase, IDoublyLinkedNode[T], IGenericConstraintImplementation[IList[T]]):
+    __slots__ = ()
+
     def __init__(self, value: T, l: ListBase[T, _Node[T]]|None, previousNode: SelfType|None, nextNode: SelfType|None):
         super().__init__(value, l, previousNode, nextNode)
     
@@ -782,7 +991,10 @@ class _Node[T](DoublyLinkedNode[T, "_Node", IDoublyLinkedNode[T], IList[T], List
     
     @final
     def _GetNode(self, value: T, previous: SelfType|None, next: SelfType|None) -> _Node[T]:
-        return _Node[T](value, self._GetInnerList(), previous, next)
+        l: ListBase[T, _Node[T]]|None = self._GetInnerList()
+        node: _Node[T]|None = None if l is None else l._TryReuseNode(value, previous, next)
+
+        return _Node[T](value, l, previous, next) if node is None else node
     
     @final
     def GetList(self) -> IList[T]|None:
@@ -801,9 +1013,13 @@ class List[T](ListBase[T, _Node[T]]):
     
     @final
     def _GetNode(self, value: T) -> _Node[T]:
-        return _Node[T](value, self, None, None)
+        node: _Node[T]|None = self._TryReuseNode(value, None, None)
+
+        return _Node[T](value, self, None, None) if node is None else node
 
 class ICountableLinkedListNode[T](INode[T]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -848,6 +1064,8 @@ class CountableListBase[TItem, TNode](EnumerableList[TItem, TNode, ICountableLin
 
 @final
 class _CountableListNode[T](_DoublyLinkedNode[T, "_CountableListNode", ICountableLinkedListNode[T], ICountableList[T], CountableListProvider[T]], EnumerableList[T, "_CountableListNode", ICountableLinkedListNode[T], CountableListProvider[T]].NodeBase, ICountableLinkedListNode[T], IGenericConstraintImplementation[ICountableList[T]]):
+    __slots__ = ()
+
     def __init__(self, value: T, l: CountableListProvider[T]|None, previousNode: SelfType|None, nextNode: SelfType|None):
         super().__init__(value, l, previousNode, nextNode)
     
@@ -868,7 +1086,10 @@ class _CountableListNode[T](_DoublyLinkedNode[T, "_CountableListNode", ICountabl
     
     @final
     def _GetNode(self, value: T, previous: SelfType|None, next: SelfType|None) -> _CountableListNode[T]:
-        return _CountableListNode[T](value, self._GetInnerList(), previous, next)
+        l: CountableListProvider[T]|None = self._GetInnerList()
+        node: _CountableListNode[T]|None = None if l is None else l.GetInnerItems()._TryReuseNode(value, previous, next)
+
+        return _CountableListNode[T](value, l, previous, next) if node is None else node
     
     @final
     def GetList(self) -> ICountableList[T]|None:
@@ -924,7 +1145,9 @@ class _CountableInnerList[T](CountableListBase[T, _CountableListNode[T]]):
         return node
     
     def _GetNode(self, value: T) -> _CountableListNode[T]:
-        return _CountableListNode[T](value, self.__items, None, None)
+        node: _CountableListNode[T]|None = self._TryReuseNode(value, None, None)
+
+        return _CountableListNode[T](value, self.__items, None, None) if node is None else node
     
     @final
     def _AddNode(self, value: T) -> _CountableListNode[T]:
@@ -934,6 +1157,10 @@ class _CountableInnerList[T](CountableListBase[T, _CountableListNode[T]]):
 
         return node
     
+    @final
+    def _OnNodesAdded(self, count: int) -> None:
+        self.__count += count
+    
     def AsSized(self) -> Sized:
         return self.__items.AsSized()
     
@@ -1003,6 +1230,20 @@ class CountableList[T](CountableEnumerable[T], ICountableList[T], IGenericConstr
     def GetLast(self) -> ICountableLinkedListNode[T]|None:
         return self._GetItems().GetLast()
     
+    @final
+    def TryGetFirst(self) -> INullable[T]:
+        return self._GetItems().TryGetFirst()
+    @final
+    def TryGetLast(self) -> INullable[T]:
+        return self._GetItems().TryGetLast()
+    
+    @final
+    def TryGetFirstValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return self._GetItems().TryGetFirstValue(default)
+    @final
+    def TryGetLastValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return self._GetItems().TryGetLastValue(default)
+    
     @final
     def AddFirst(self, value: T) -> ICountableLinkedListNode[T]:
         return self._GetItems().AddFirst(value)
@@ -1010,6 +1251,13 @@ class CountableList[T](CountableEnumerable[T], ICountableList[T], IGenericConstr
     def AddLast(self, value: T) -> ICountableLinkedListNode[T]:
         return self._GetItems().AddLast(value)
     
+    @final
+    def _AddFirstItems(self, items: Iterable[T]) -> None:
+        self._GetItems().AddFirstItems(items)
+    @final
+    def _AddLastItems(self, items: Iterable[T]) -> None:
+        self._GetItems().AddLastItems(items)
+    
     @final
     def TryRemoveFirst(self) -> INullable[T]:
         return self._GetItems().TryRemoveFirst()
@@ -1017,6 +1265,13 @@ class CountableList[T](CountableEnumerable[T], ICountableList[T], IGenericConstr
     def TryRemoveLast(self) -> INullable[T]:
         return self._GetItems().TryRemoveLast()
     
+    @final
+    def TryRemoveFirstValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return self._GetItems().TryRemoveFirstValue(default)
+    @final
+    def TryRemoveLastValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return self._GetItems().TryRemoveLastValue(default)
+    
     @final
     def TryGetEnumerator(self) -> IEnumerator[T]|None:
         return self._GetItems().TryGetEnumerator()
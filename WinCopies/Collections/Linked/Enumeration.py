@@ -1,20 +1,22 @@
 from abc import abstractmethod
+from collections.abc import Iterator as SystemIterator
 from typing import final
 
 from WinCopies.Collections import Generator
-from WinCopies.Collections.Enumeration import IEnumerator, Enumerator, Iterator
+from WinCopies.Collections.Enumeration import IEnumerator, Enumerator, Iterator, GetNativeIterator
 from WinCopies.Collections.Iteration import Select
 from WinCopies.Collections.Linked.Node import ILinkedNode
 
 from WinCopies.Typing import IGenericConstraint, IGenericConstraintImplementation
-from WinCopies.Typing.Delegate import Function
 
 class NodeEnumeratorBase[TItems, TNode](Enumerator[TNode], IGenericConstraint[TNode, ILinkedNode[TItems]]):
+    __slots__ = ("__first", "__isFirst")
+
     def __init__(self, node: TNode):
         super().__init__()
 
         self.__first: TNode = node
-        self.__moveNextFunc: Function[bool]|None = None
+        self.__isFirst: bool = False
     
     @final
     def IsResetSupported(self) -> bool:
@@ -24,37 +26,48 @@ class NodeEnumeratorBase[TItems, TNode](Enumerator[TNode], IGenericConstraint[TN
     def _GetNextNode(self, node: TNode) -> TNode|None:
         pass
     
-    def __MoveNext(self) -> bool:
-        self._SetCurrent(self.__first)
+    def _OnStarting(self):
+        if super()._OnStarting():
+            self.__isFirst = True
 
-        def moveNext() -> bool:
-            node: TNode|None = self.GetCurrent()
+            return True
+        
+        return False
+    
+    def _MoveNextOverride(self) -> bool:
+        if self.__isFirst:
+            self.__isFirst = False
 
-            if node is None or (node := self._GetNextNode(node)) is None:
-                return False
-            
-            self._SetCurrent(node)
+            self._SetCurrent(self.__first)
 
             return True
+        
+        node: TNode|None = self.GetCurrent()
 
-        self.__moveNextFunc = moveNext
+        if node is None or (node := self._GetNextNode(node)) is None:
+            return False
+        
+        self._SetCurrent(node)
 
         return True
     
-    def _OnStarting(self):
-        if super()._OnStarting():
-            self.__moveNextFunc = self.__MoveNext
+    def _MoveNextBatchOverride(self, items: list[TNode], count: int) -> int:
+        node: TNode|None = self.GetCurrent()
+        added: int = 0
 
-            return True
+        while added < count and node is not None and (node := self._GetNextNode(node)) is not None:
+            items.append(node)
+
+            added += 1
         
-        return False
-    
-    def _MoveNextOverride(self) -> bool:
-        return self.__moveNextFunc() # type: ignore
+        if added > 0:
+            self._SetCurrent(items[-1])
+        
+        return added
     
     @final
     def __OnEnded(self) -> None:
-        self.__moveNextFunc = None
+        self.__isFirst = False
     
     def _OnEnded(self) -> None:
         self.__OnEnded()
@@ -68,8 +81,21 @@ class NodeEnumeratorBase[TItems, TNode](Enumerator[TNode], IGenericConstraint[TN
         self.__OnEnded()
 
         return True
+    
+    def _TryGetNativeIterator(self) -> SystemIterator[TNode]|None:
+        def iterate() -> Generator[TNode]:
+            node: TNode|None = self.__first
+
+            while node is not None:
+                yield node
+
+                node = self._GetNextNode(node)
+        
+        return iterate()
 
 class NodeEnumerator[T](NodeEnumeratorBase[T, ILinkedNode[T]], IGenericConstraintImplementation[ILinkedNode[T]]):
+    __slots__ = ()
+
     def __init__(self, node: ILinkedNode[T]):
         super().__init__(node)
     
@@ -78,7 +104,7 @@ class NodeEnumerator[T](NodeEnumeratorBase[T, ILinkedNode[T]], IGenericConstrain
         return node.GetNext()
 
 def GetValueIterator[T](nodeEnumerator: NodeEnumerator[T]) -> Generator[T]:
-    return Select(nodeEnumerator, lambda node: node.GetValue())
+    return Select(GetNativeIterator(nodeEnumerator), lambda node: node.GetValue())
 def GetValueIteratorFromNode[T](node: ILinkedNode[T]) -> Generator[T]:
     return GetValueIterator(NodeEnumerator[T](node))
 
@@ -4,6 +4,8 @@ from typing import final, Self
 from WinCopies import IInterface, Abstract
 
 class ILinkedNode[T](IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -19,6 +21,8 @@ class ILinkedNode[T](IInterface):
         pass
 
 class LinkedNodeBase[T](Abstract, IInterface):
+    __slots__ = ("__value",)
+
     def __init__(self, value: T):
         super().__init__()
         
@@ -32,6 +36,8 @@ class LinkedNodeBase[T](Abstract, IInterface):
         self.__value = value
 
 class LinkedNode[TNode: 'LinkedNode', TItems](LinkedNodeBase[TItems], ILinkedNode[TItems]):
+    __slots__ = ("__next",)
+
     def __init__(self, value: TItems, nextNode: TNode|None):
         super().__init__(value)
 
@@ -17,6 +17,8 @@ from WinCopies.Typing.Delegate import Method, IFunction, ValueFunctionUpdater
 from WinCopies.Typing.Reflection import EnsureDirectModuleCall
 
 class SinglyLinkedNode[T](LinkedNode['SinglyLinkedNode', T]):
+    __slots__ = ()
+
     def __init__(self, value: T, nextNode: Self|None):
         super().__init__(value, nextNode)
 
@@ -31,6 +33,10 @@ class IReadOnlyList[T](IReadOnlyCollection):
     @abstractmethod
     def TryPeek(self) -> INullable[T]:
         pass
+    
+    # Does not allocate an INullable when overridden by the lists that can read their first node directly.
+    def TryPeekValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return self.TryPeek().TryGetValueOrDefault(default)
 class IList[T](IReadOnlyList[T]):
     @final
     class __Updater(ValueFunctionUpdater[Generator[T]]):
@@ -70,6 +76,17 @@ class IList[T](IReadOnlyList[T]):
     def PushItems(self, items: Iterable[T]) -> None:
         pass
     
+    # Pushes the items one at a time and returns their count; overridden by the lists that can link the nodes of all the items before pushing them at once.
+    def Extend(self, items: Iterable[T]) -> int:
+        count: int = 0
+
+        for item in items:
+            self.Push(item)
+
+            count += 1
+        
+        return count
+    
     @final
     def PushValues(self, *values: T) -> None:
         self.PushItems(values)
@@ -78,6 +95,10 @@ class IList[T](IReadOnlyList[T]):
     def TryPop(self) -> INullable[T]:
         pass
     
+    # Does not allocate an INullable when overridden by the lists that can remove their first node directly.
+    def TryPopValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return self.TryPop().TryGetValueOrDefault(default)
+    
     @abstractmethod
     def Clear(self) -> None:
         pass
@@ -176,6 +197,9 @@ class ReadOnlyList[TItem, TList](Abstract, IReadOnlyList[TItem], GenericConstrai
     @final
     def TryPeek(self) -> INullable[TItem]:
         return self._GetInnerContainer().TryPeek()
+    @final
+    def TryPeekValue[TDefault](self, default: TDefault) -> TItem|TDefault:
+        return self._GetInnerContainer().TryPeekValue(default)
 
 class ListBase[T](Abstract, IList[T]):
     def __init__(self):
@@ -214,45 +238,45 @@ class ListBase[T](Abstract, IList[T]):
     
     @final
     def PushItems(self, items: Iterable[T]) -> None:
-        for value in items:
-            self.Push(value)
+        self.Extend(items)
     @final
     def TryPushItems(self, items: Iterable[T]|None) -> bool:
         if items is None:
             return False
         
-        self.PushItems(items)
+        self.Extend(items)
 
         return True
     
     @final
     def TryPeek(self) -> INullable[T]:
-        return GetNullValue() if self.IsEmpty() else (GetNullValue() if self.__first is None else GetNullable(self.__first.GetValue())) # self.__first should never be None if self.IsEmpty().
+        return GetNullValue() if self.__first is None else GetNullable(self.__first.GetValue())
+    @final
+    def TryPeekValue[TDefault](self, default: TDefault) -> T|TDefault:
+        return default if self.__first is None else self.__first.GetValue()
     
     @final
     def TryPop(self) -> INullable[T]:
-        result: INullable[T] = self.TryPeek()
-
-        if result.HasValue():
-            first: SinglyLinkedNode[T]|None = self.__first
+        return GetNullValue() if self.__first is None else GetNullable(self.TryPopValue(None))
+    @final
+    def TryPopValue[TDefault](self, default: TDefault) -> T|TDefault:
+        first: SinglyLinkedNode[T]|None = self.__first
 
-            if first is None: # Should never be None here.
-                return result
+        if first is None:
+            return default
 
-            self.__first = first.GetNext()
+        self.__first = first.GetNext()
 
-            first._SetNext(None) # type: ignore # Needed in case of a running enumeration.
+        first._SetNext(None) # type: ignore # Needed in case of a running enumeration.
 
-            self._OnRemoved()
+        self._OnRemoved()
 
-        return result
+        return first.GetValue()
     
     @final
     def Clear(self) -> None:
-        result: INullable[T] = self.TryPop()
-
-        while result.HasValue(): # Needed in case of a running enumeration.
-            result = self.TryPop()
+        while self.__first is not None: # Needed in case of a running enumeration.
+            self.TryPopValue(None)
 
         self.__first = None
 
@@ -361,6 +385,46 @@ class QueueBase[T](ListBase[T]):
     def _Push(self, value: T, first: SinglyLinkedNode[T]):
         self.__updater(first, SinglyLinkedNode[T](value, None))
     
+    @final
+    def Extend(self, items: Iterable[T]) -> int:
+        iterator: Iterator[T] = iter(items)
+
+        # The nodes are created from their class rather than from a subscripted alias, which would try to record its type arguments on each of them.
+        for value in iterator:
+            first: SinglyLinkedNode[T] = SinglyLinkedNode(value, None)
+
+            break
+        
+        else:
+            return 0
+        
+        last: SinglyLinkedNode[T] = first
+        count: int = 1
+
+        # The nodes are linked to each other before being added, so that the list is updated only once.
+        for value in iterator:
+            node: SinglyLinkedNode[T] = SinglyLinkedNode(value, None)
+
+            last._SetNext(node) # type: ignore
+
+            last = node
+            count += 1
+        
+        if self.IsEmpty():
+            self._SetFirst(first)
+
+            if first is last:
+                return count
+            
+            first = first.GetNext() # type: ignore
+        
+        # The updater links the first node of the chain as it would link a pushed node; only the last node is then updated.
+        self.__updater(self._GetFirst(), first) # type: ignore
+
+        self.__last = last
+
+        return count
+    
     @final
     def _OnRemoved(self) -> None:
         if self.IsEmpty():
@@ -380,6 +444,22 @@ class StackBase[T](ListBase[T]):
     def _Push(self, value: T, first: SinglyLinkedNode[T]) -> None:
         self._SetFirst(SinglyLinkedNode[T](value, first))
     
+    @final
+    def Extend(self, items: Iterable[T]) -> int:
+        first: SinglyLinkedNode[T]|None = self._GetFirst()
+        count: int = 0
+
+        # Each item is linked to the previous one, so that the last item is the first one to be popped, as if they were pushed one at a time. The nodes are created from their class, as by QueueBase.Extend.
+        for value in items:
+            first = SinglyLinkedNode(value, first)
+
+            count += 1
+        
+        if first is not None:
+            self._SetFirst(first)
+        
+        return count
+    
     @final
     def _OnRemoved(self) -> None:
         pass
@@ -454,21 +534,19 @@ class CountableBase[TItems, TList](CollectionBase[TItems, TList], Collections.Co
         self.__Increment()
     
     @final
-    def __PushItems(self, items: Iterable[TItems]) -> None:
-        def loop() -> Generator[TItems]:
-            for item in items:
-                yield item
-                
-                self.__Increment()
-        
-        self._GetInnerContainer().PushItems(loop())
+    def Extend(self, items: Iterable[TItems]) -> int:
+        count: int = self._GetInnerContainer().Extend(items)
+
+        self.__count += count
+
+        return count
     
     @final
     def TryPushItems(self, items: Iterable[TItems]|None) -> bool:
         if items is None:
             return False
         
-        self.__PushItems(items)
+        self.Extend(items)
 
         return True
     @final
@@ -476,11 +554,14 @@ class CountableBase[TItems, TList](CollectionBase[TItems, TList], Collections.Co
         if items is None: # type: ignore
             raise ValueError("No value provided.")
         
-        self.__PushItems(items)
+        self.Extend(items)
     
     @final
     def TryPeek(self) -> INullable[TItems]:
         return self._GetInnerContainer().TryPeek()
+    @final
+    def TryPeekValue[TDefault](self, default: TDefault) -> TItems|TDefault:
+        return self._GetInnerContainer().TryPeekValue(default)
     
     @final
     def TryPop(self) ->  INullable[TItems]:
@@ -490,6 +571,14 @@ class CountableBase[TItems, TList](CollectionBase[TItems, TList], Collections.Co
             self.__count -= 1
         
         return result
+    @final
+    def TryPopValue[TDefault](self, default: TDefault) -> TItems|TDefault:
+        if self._GetInnerContainer().IsEmpty():
+            return default
+        
+        self.__count -= 1
+
+        return self._GetInnerContainer().TryPopValue(default)
     
     @final
     def Clear(self) -> None:
@@ -104,6 +104,12 @@ def ForEachItemUntil[T](items: Iterable[T], predicate: Predicate[T]) -> bool|Non
         - True if predicate matched
         - False if completed without match.
     """
+    # Vectorization is only needed by the predicates that it can recognize, so it is not imported with this module, which WinCopies.IO imports.
+    from WinCopies.Collections import Vectorization
+
+    if (index := Vectorization.TryFindFirstIndex(items, predicate)) is not None:
+        return index >= 0 if len(items) > 0 else None # type: ignore
+    
     enumerator: Enumeration.IEnumerator[T] = Enumeration.Iterable[T].Create(items).GetEnumerator()
 
     for entry in enumerator.AsIterator():
@@ -179,6 +185,12 @@ def ForEachItem[T](items: Iterable[T], predicate: Predicate[T]) -> bool|None:
         - True if completed all items
         - False if stopped early.
     """
+    from WinCopies.Collections import Vectorization
+
+    # The negation of a comparison is not a comparison: the items are scanned for the first one that does not match it instead.
+    if (index := Vectorization.TryFindFirstIndex(items, predicate, expected = False)) is not None:
+        return index < 0 if len(items) > 0 else None # type: ignore
+    
     return WinCopies.Not(ForEachItemUntil(items, Delegates.GetNotPredicate(predicate)))
 def ForEachArg[T](predicate: Predicate[T], *values: T) -> bool|None:
     """Iterates over variadic values while the given predicate returns True.
@@ -0,0 +1,220 @@
+"""
+Multi-pattern matching over hashable items.
+
+A PatternMatcher compiles its patterns once into an Aho-Corasick automaton, then finds the occurrences of all of them in a single pass over some items, whatever the number of patterns. As the items are read only once, in order, they can come from any iterable, including a stream that cannot be read again.
+"""
+
+from collections import deque
+from collections.abc import Hashable, Iterable, Sequence
+from typing import final
+
+from WinCopies import Not
+from WinCopies.Collections import Generator
+from WinCopies.Collections.Iteration import TryEnumerate
+
+@final
+class PatternMatcher[T: Hashable]:
+    """An Aho-Corasick automaton that finds the occurrences of several sequences of hashable items.
+
+    The occurrences of a pattern can overlap, and each pattern is matched separately, even when it is given several times. A matcher can be used by several threads at once.
+    """
+    def __init__(self, patterns: Iterable[Sequence[T]]):
+        """Compiles patterns.
+
+        Args:
+            patterns: The sequences to find. Their index in this iterable identifies them in the results.
+
+        Raises:
+            ValueError: A pattern is empty.
+        """
+        super().__init__()
+
+        self.__patterns: tuple[tuple[T, ...], ...] = tuple(tuple(pattern) for pattern in patterns)
+        # The transitions of each state of the automaton, the state 0 being the root. The transitions that follow a failure are added once they are needed, for the items of the patterns only.
+        self.__transitions: list[dict[T, int]] = [{}]
+        ends: list[list[int]] = [[]]
+
+        for index, pattern in enumerate(self.__patterns):
+            if len(pattern) == 0:
+                raise ValueError("patterns cannot be empty.")
+
+            state: int = 0
+
+            for item in pattern:
+                nextState: int|None = self.__transitions[state].get(item)
+
+                if nextState is None:
+                    nextState = len(self.__transitions)
+
+                    self.__transitions[state][item] = nextState
+                    self.__transitions.append({})
+                    ends.append([])
+
+                state = nextState
+
+            ends[state].append(index)
+
+        self.__items: frozenset[T] = frozenset(item for pattern in self.__patterns for item in pattern)
+        # The state reached from each state when its next item does not match, which is the longest proper suffix of its path that is also a prefix of a pattern.
+        self.__failures: list[int] = [0] * len(self.__transitions)
+        # The patterns that end at each state, including the ones that end at its failures, from the longest one.
+        self.__matches: list[tuple[int, ...]] = [()] * len(self.__transitions)
+
+        states: deque[int] = deque()
+
+        for state in self.__transitions[0].values():
+            states.append(state)
+
+            self.__matches[state] = tuple(ends[state])
+
+        # The states are visited by depth, so that the failure of a state is always processed before it.
+        while len(states) > 0:
+            state = states.popleft()
+
+            for item, nextState in self.__transitions[state].items():
+                failure: int = self.__failures[state]
+
+                while failure != 0 and item not in self.__transitions[failure]:
+                    failure = self.__failures[failure]
+
+                self.__failures[nextState] = self.__transitions[failure].get(item, 0)
+                self.__matches[nextState] = tuple(ends[nextState]) + self.__matches[self.__failures[nextState]]
+
+                states.append(nextState)
+
+    def GetPatternCount(self) -> int:
+        """Returns the number of patterns."""
+        return len(self.__patterns)
+    def GetPattern(self, index: int) -> tuple[T, ...]:
+        """Returns the pattern at a given index."""
+        return self.__patterns[index]
+
+    def __EnumerateMatchingStates(self, items: Iterable[T]|None) -> Generator[tuple[int, tuple[int, ...]]]:
+        # Yields the index of each item at which patterns end, with these patterns.
+        transitions: list[dict[T, int]] = self.__transitions
+        failures: list[int] = self.__failures
+        matches: list[tuple[int, ...]] = self.__matches
+        patternItems: frozenset[T] = self.__items
+        state: int = 0
+
+        for index, item in enumerate(TryEnumerate(items)):
+            nextState: int|None = transitions[state].get(item)
+
+            if nextState is None:
+                if state == 0 or item not in patternItems:
+                    nextState = 0
+
+                else:
+                    failure: int = failures[state]
+
+                    while (nextState := transitions[failure].get(item)) is None and failure != 0:
+                        failure = failures[failure]
+
+                    if nextState is None:
+                        nextState = 0
+
+                    # The automaton is completed as the items are read, so that the failures are followed only once for each state and item.
+                    transitions[state][item] = nextState
+
+            state = nextState
+
+            if matches[state]:
+                yield (index, matches[state])
+
+    def EnumerateMatches(self, items: Iterable[T]|None) -> Generator[tuple[int, int]]:
+        """Finds all the occurrences of the patterns.
+
+        Args:
+            items: The items in which to find the patterns.
+
+        Yields:
+            The index of the first item of each occurrence and the index of its pattern, by index of its last item, then from the longest pattern.
+        """
+        for index, patterns in self.__EnumerateMatchingStates(items):
+            for pattern in patterns:
+                yield (index - len(self.__patterns[pattern]) + 1, pattern)
+
+    def GetCounts(self, items: Iterable[T]|None, maximum: int|None = None) -> list[int]:
+        """Counts the occurrences of each pattern.
+
+        Args:
+            items: The items in which to find the patterns.
+            maximum: The count after which the occurrences of a pattern are no longer counted. items are no longer read once it is reached for all patterns. There is no maximum if None.
+
+        Returns:
+            The number of occurrences of each pattern, by index of pattern.
+
+        Raises:
+            ValueError: maximum is less than or equal to zero.
+        """
+        if maximum is not None and maximum <= 0:
+            raise ValueError("maximum must be greater than zero.")
+
+        counts: list[int] = [0] * len(self.__patterns)
+
+        if maximum is None:
+            for _, patterns in self.__EnumerateMatchingStates(items):
+                for pattern in patterns:
+                    counts[pattern] += 1
+
+            return counts
+
+        remaining: int = len(counts)
+
+        for _, patterns in self.__EnumerateMatchingStates(items):
+            for pattern in patterns:
+                if counts[pattern] < maximum:
+                    counts[pattern] += 1
+
+                    if counts[pattern] == maximum:
+                        remaining -= 1
+
+            if remaining == 0:
+                break
+
+        return counts
+
+    def GetFirstIndices(self, items: Iterable[T]|None) -> list[int|None]:
+        """Finds the first occurrence of each pattern. items are no longer read once all the patterns are found.
+
+        Args:
+            items: The items in which to find the patterns.
+
+        Returns:
+            The index of the first item of the first occurrence of each pattern, or None if it does not occur, by index of pattern.
+        """
+        indices: list[int|None] = [None] * len(self.__patterns)
+        remaining: int = len(indices)
+
+        for index, patterns in self.__EnumerateMatchingStates(items):
+            for pattern in patterns:
+                if indices[pattern] is None:
+                    indices[pattern] = index - len(self.__patterns[pattern]) + 1
+
+                    remaining -= 1
+
+            if remaining == 0:
+                break
+
+        return indices
+
+    def ContainsMultipleTimes(self, items: Iterable[T]|None) -> list[bool|None]:
+        """Checks whether each pattern occurs more than once, as ContainsMultipleSequences does for a single one.
+
+        Args:
+            items: The items in which to find the patterns.
+
+        Returns:
+            For each pattern, True if it occurs more than once, False if it occurs once, or None if it does not occur.
+        """
+        return [None if count == 0 else count > 1 for count in self.GetCounts(items, 2)]
+    def ContainsOnlyOne(self, items: Iterable[T]|None) -> list[bool|None]:
+        """Checks whether each pattern occurs exactly once, as ContainsOneSequence does for a single one.
+
+        Args:
+            items: The items in which to find the patterns.
+
+        Returns:
+            For each pattern, True if it occurs once, False if it occurs more than once, or None if it does not occur.
+        """
+        return [Not(result) for result in self.ContainsMultipleTimes(items)]
@@ -0,0 +1,394 @@
+"""
+Parallel counterparts of the Iteration selection functions.
+
+Items are sent to an executor per chunk, so that a process pool does not pickle each item separately. The functions given to a process pool must be picklable, which excludes lambdas and local functions.
+
+EnumerateRecursively walks a tree with worker loops that share their nodes through work stealing; it needs a thread pool.
+"""
+
+import os
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
+from functools import partial
+from threading import Condition
+from typing import final
+
+from WinCopies.Collections import EnumerationOrder, Generator
+from WinCopies.Collections.Iteration import Batch
+from WinCopies.Typing.Delegate import Converter, Predicate
+
+def __Select[TIn, TOut](converter: Converter[TIn, TOut], items: list[TIn]) -> list[TOut]:
+    return list(map(converter, items))
+def __WhereSelect[TIn, TOut](predicate: Predicate[TIn], converter: Converter[TIn, TOut], items: list[TIn]) -> list[TOut]:
+    return [converter(item) for item in items if predicate(item)]
+def __SelectWhere[TIn, TOut](converter: Converter[TIn, TOut], predicate: Predicate[TOut], items: list[TIn]) -> list[TOut]:
+    return [result for result in map(converter, items) if predicate(result)]
+def __Include[T](predicate: Predicate[T], items: list[T]) -> list[T]:
+    return list(filter(predicate, items))
+def __Exclude[T](predicate: Predicate[T], items: list[T]) -> list[T]:
+    return [item for item in items if not predicate(item)]
+
+def __GetWorkerCount() -> int:
+    # The executors do not expose their number of workers, so the default values are based on the number of processors.
+    return os.cpu_count() or 1
+def __GetDefaultMaxPending() -> int:
+    return 2 * __GetWorkerCount()
+
+def __Run[TIn, TOut](items: Iterable[TIn]|None, func: Converter[list[TIn], list[TOut]], executor: Executor, chunkSize: int, ordered: bool, maxPending: int|None) -> Generator[TOut]:
+    if chunkSize <= 0:
+        raise ValueError("chunkSize must be greater than zero.")
+
+    if maxPending is None:
+        maxPending = __GetDefaultMaxPending()
+
+    elif maxPending <= 0:
+        raise ValueError("maxPending must be greater than zero.")
+
+    def run() -> Generator[TOut]:
+        chunks: Generator[list[TIn]] = Batch(items, chunkSize)
+        pending: deque[Future[list[TOut]]] = deque()
+
+        def submit() -> bool:
+            chunk: list[TIn]|None = next(chunks, None)
+
+            if chunk is None:
+                return False
+
+            pending.append(executor.submit(func, chunk))
+
+            return True
+
+        def getCompleted() -> Future[list[TOut]]:
+            if ordered:
+                return pending.popleft()
+
+            future: Future[list[TOut]] = next(iter(wait(pending, return_when = FIRST_COMPLETED).done))
+
+            pending.remove(future)
+
+            return future
+
+        try:
+            # No more than maxPending chunks are submitted at once, so that a slow consumer does not make the whole input be read.
+            while len(pending) < maxPending and submit():
+                pass
+
+            while len(pending) > 0:
+                # result raises the exception of the first failed chunk, in output order; the remaining chunks are cancelled below.
+                yield from getCompleted().result()
+
+                submit()
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+    return run()
+
+def Select[TIn, TOut](items: Iterable[TIn]|None, converter: Converter[TIn, TOut], executor: Executor, chunkSize: int = 1024, ordered: bool = True, maxPending: int|None = None) -> Generator[TOut]:
+    """Transforms items in parallel using a converter function.
+
+    Args:
+        items: The items to transform.
+        converter: The function to transform each item.
+        executor: The executor in which the chunks are transformed.
+        chunkSize: The number of items sent to the executor at once.
+        ordered: Whether the items are yielded in their original order, rather than as soon as their chunk is transformed.
+        maxPending: The maximum number of chunks submitted and not yet yielded. Defaults to twice the number of processors.
+
+    Yields:
+        Transformed items.
+
+    Raises:
+        ValueError: chunkSize or maxPending is less than or equal to zero.
+    """
+    return __Run(items, partial(__Select, converter), executor, chunkSize, ordered, maxPending)
+def WhereSelect[TIn, TOut](items: Iterable[TIn]|None, predicate: Predicate[TIn], converter: Converter[TIn, TOut], executor: Executor, chunkSize: int = 1024, ordered: bool = True, maxPending: int|None = None) -> Generator[TOut]:
+    """Filters then transforms items in parallel.
+
+    Args:
+        items: The items to process.
+        predicate: The filter function.
+        converter: The transformation function.
+        executor: The executor in which the chunks are processed.
+        chunkSize: The number of items sent to the executor at once.
+        ordered: Whether the items are yielded in their original order.
+        maxPending: The maximum number of chunks submitted and not yet yielded.
+
+    Yields:
+        Transformed items that passed the filter.
+    """
+    return __Run(items, partial(__WhereSelect, predicate, converter), executor, chunkSize, ordered, maxPending)
+def SelectWhere[TIn, TOut](items: Iterable[TIn]|None, converter: Converter[TIn, TOut], predicate: Predicate[TOut], executor: Executor, chunkSize: int = 1024, ordered: bool = True, maxPending: int|None = None) -> Generator[TOut]:
+    """Transforms then filters items in parallel.
+
+    Args:
+        items: The items to process.
+        converter: The transformation function.
+        predicate: The filter function applied to transformed items.
+        executor: The executor in which the chunks are processed.
+        chunkSize: The number of items sent to the executor at once.
+        ordered: Whether the items are yielded in their original order.
+        maxPending: The maximum number of chunks submitted and not yet yielded.
+
+    Yields:
+        Transformed items that passed the filter.
+    """
+    return __Run(items, partial(__SelectWhere, converter, predicate), executor, chunkSize, ordered, maxPending)
+
+def Include[T](items: Iterable[T]|None, predicate: Predicate[T], executor: Executor, chunkSize: int = 1024, ordered: bool = True, maxPending: int|None = None) -> Generator[T]:
+    """Includes only items that match a given predicate, which is evaluated in parallel.
+
+    Args:
+        items: The items to filter.
+        predicate: The function that determines which items to include.
+        executor: The executor in which the chunks are filtered.
+        chunkSize: The number of items sent to the executor at once.
+        ordered: Whether the items are yielded in their original order.
+        maxPending: The maximum number of chunks submitted and not yet yielded.
+
+    Yields:
+        Items that satisfy the predicate.
+    """
+    return __Run(items, partial(__Include, predicate), executor, chunkSize, ordered, maxPending)
+def Exclude[T](items: Iterable[T]|None, predicate: Predicate[T], executor: Executor, chunkSize: int = 1024, ordered: bool = True, maxPending: int|None = None) -> Generator[T]:
+    """Excludes items that match a given predicate, which is evaluated in parallel.
+
+    Args:
+        items: The items to filter.
+        predicate: The function that determines which items to exclude.
+        executor: The executor in which the chunks are filtered.
+        chunkSize: The number of items sent to the executor at once.
+        ordered: Whether the items are yielded in their original order.
+        maxPending: The maximum number of chunks submitted and not yet yielded.
+
+    Yields:
+        Items that do not satisfy the predicate.
+    """
+    return __Run(items, partial(__Exclude, predicate), executor, chunkSize, ordered, maxPending)
+
+@final
+class _RecursiveNode[T]:
+    __slots__ = ("Item", "Children")
+
+    def __init__(self, item: T):
+        self.Item: T = item
+        # Set once the node is expanded; always empty when the enumeration is unordered, as the children are then yielded as soon as they are found.
+        self.Children: list[_RecursiveNode[T]]|None = None
+
+@final
+class _RecursiveEnumeration[T]:
+    def __init__(self, getChildren: Converter[T, Iterable[T]|None], workerCount: int, ordered: bool):
+        self.__getChildren: Converter[T, Iterable[T]|None] = getChildren
+        self.__ordered: bool = ordered
+        # Each worker pushes and pops its own nodes at the right of its deque, depth first, and steals the oldest nodes of the others, at their left, which are the closest to the roots and so the most likely to have many descendants. Single deque operations are atomic, so that they do not need the lock.
+        self.__deques: list[deque[_RecursiveNode[T]]] = [deque() for _ in range(workerCount)]
+        self.__condition: Condition = Condition()
+        # The number of nodes not yet expanded.
+        self.__pending: int = 0
+        self.__output: deque[T] = deque()
+        self.__error: BaseException|None = None
+        self.__stopped: bool = False
+
+    def Start(self, items: list[T]) -> list[_RecursiveNode[T]]:
+        nodes: list[_RecursiveNode[T]] = [_RecursiveNode(item) for item in items]
+
+        with self.__condition:
+            for i, node in enumerate(nodes):
+                self.__deques[i % len(self.__deques)].append(node)
+
+            self.__pending = len(nodes)
+
+            if not self.__ordered:
+                self.__output.extend(items)
+
+        return nodes
+
+    def Stop(self) -> None:
+        with self.__condition:
+            self.__stopped = True
+
+            self.__condition.notify_all()
+
+    def __TryTake(self, worker: int) -> _RecursiveNode[T]|None:
+        try:
+            return self.__deques[worker].pop()
+
+        except IndexError:
+            pass
+
+        count: int = len(self.__deques)
+
+        for i in range(1, count):
+            try:
+                return self.__deques[(worker + i) % count].popleft()
+
+            except IndexError:
+                pass
+
+        return None
+
+    def Work(self, worker: int) -> None:
+        node: _RecursiveNode[T]|None
+
+        while True:
+            if (node := self.__TryTake(worker)) is None:
+                with self.__condition:
+                    # The nodes are added under the lock, so that no node can be added between this check and the wait.
+                    while not self.__stopped and self.__pending > 0 and (node := self.__TryTake(worker)) is None:
+                        self.__condition.wait()
+
+                if node is None:
+                    return
+
+            try:
+                # The children are listed outside of the lock: this is where a directory scan waits for the file system.
+                children: Iterable[T]|None = self.__getChildren(node.Item)
+                nodes: list[_RecursiveNode[T]] = [] if children is None else [_RecursiveNode(child) for child in children]
+
+            except BaseException as e:
+                with self.__condition:
+                    if self.__error is None:
+                        self.__error = e
+
+                    self.__stopped = True
+
+                    self.__condition.notify_all()
+
+                return
+
+            with self.__condition:
+                if self.__stopped:
+                    return
+
+                # The first child is popped first.
+                self.__deques[worker].extend(reversed(nodes))
+
+                self.__pending += len(nodes) - 1
+
+                if self.__ordered:
+                    node.Children = nodes
+
+                else:
+                    self.__output.extend(child.Item for child in nodes)
+
+                self.__condition.notify_all()
+
+    def __GetChildren(self, node: _RecursiveNode[T]) -> list[_RecursiveNode[T]]:
+        with self.__condition:
+            while node.Children is None and self.__error is None:
+                self.__condition.wait()
+
+            if self.__error is not None:
+                raise self.__error
+
+            children: list[_RecursiveNode[T]] = node.Children
+
+        # The consumer no longer needs the children once they are enumerated.
+        node.Children = []
+
+        return children
+
+    def EnumerateUnordered(self) -> Generator[T]:
+        items: deque[T]
+
+        while True:
+            with self.__condition:
+                while len(self.__output) == 0 and self.__pending > 0 and self.__error is None:
+                    self.__condition.wait()
+
+                if self.__error is not None:
+                    raise self.__error
+
+                if len(self.__output) == 0:
+                    return
+
+                items = self.__output
+                self.__output = deque()
+
+            yield from items
+
+    def EnumerateFIFO(self, nodes: list[_RecursiveNode[T]]) -> Generator[T]:
+        stack: list[Iterator[_RecursiveNode[T]]] = [iter(nodes)]
+        node: _RecursiveNode[T]|None
+
+        while len(stack) > 0:
+            if (node := next(stack[-1], None)) is None:
+                stack.pop()
+
+                continue
+
+            yield node.Item
+
+            stack.append(iter(self.__GetChildren(node)))
+
+    def EnumerateLIFO(self, nodes: list[_RecursiveNode[T]]) -> Generator[T]:
+        stack: list[tuple[_RecursiveNode[T]|None, Iterator[_RecursiveNode[T]]]] = [(None, iter(nodes))]
+        node: _RecursiveNode[T]|None
+
+        while len(stack) > 0:
+            if (node := next(stack[-1][1], None)) is None:
+                node = stack.pop()[0]
+
+                if node is not None:
+                    yield node.Item
+
+            else:
+                stack.append((node, iter(self.__GetChildren(node))))
+
+def EnumerateRecursively[T](items: Iterable[T]|None, getChildren: Converter[T, Iterable[T]|None], executor: Executor, enumerationOrder: EnumerationOrder = EnumerationOrder.Null, maxWorkers: int|None = None) -> Generator[T]:
+    """Enumerates items and their descendants, listing the children of the nodes in parallel.
+
+    Each worker expands the nodes it found itself first, depth first, and steals the nodes closest to the roots from the other workers when it has none left, so that all the workers stay busy on unbalanced trees. This suits trees whose children are slow to list, such as directories on a network share; the nodes are expanded regardless of the speed at which the items are consumed.
+
+    Args:
+        items: The roots of the tree.
+        getChildren: The function that lists the children of an item, or returns None if it has none. It is called from the worker threads, once per item.
+        executor: The thread pool in which the workers run. Process pools are not supported, as the workers share their nodes.
+        enumerationOrder: Null to yield the items as soon as they are found, in no particular order; FIFO to yield each item before its children and LIFO to yield it after them, in the same order as a sequential recursive enumeration. An ordered enumeration keeps the children of the nodes that are not yet enumerated.
+        maxWorkers: The number of workers submitted to executor. Defaults to the number of processors; the workers that executor cannot run at once wait for the others, which take over their nodes.
+
+    Yields:
+        The items and their descendants.
+
+    Raises:
+        ValueError: maxWorkers is less than or equal to zero.
+    """
+    if maxWorkers is None:
+        maxWorkers = __GetWorkerCount()
+
+    elif maxWorkers <= 0:
+        raise ValueError("maxWorkers must be greater than zero.")
+
+    def run() -> Generator[T]:
+        if items is None:
+            return
+
+        enumeration: _RecursiveEnumeration[T] = _RecursiveEnumeration[T](getChildren, maxWorkers, enumerationOrder != EnumerationOrder.Null)
+        nodes: list[_RecursiveNode[T]] = enumeration.Start(list(items))
+
+        if len(nodes) == 0:
+            return
+
+        workers: list[Future[None]] = [executor.submit(enumeration.Work, i) for i in range(maxWorkers)]
+
+        try:
+            match enumerationOrder:
+                case EnumerationOrder.Null:
+                    yield from enumeration.EnumerateUnordered()
+                case EnumerationOrder.FIFO:
+                    yield from enumeration.EnumerateFIFO(nodes)
+                case EnumerationOrder.LIFO:
+                    yield from enumeration.EnumerateLIFO(nodes)
+                case _:
+                    raise ValueError(enumerationOrder)
+
+        finally:
+            enumeration.Stop()
+
+            for worker in workers:
+                worker.cancel()
+
+    return run()
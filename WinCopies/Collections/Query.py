@@ -0,0 +1,374 @@
+"""
+Lazy queries built from the Iteration operators.
+
+A query records its operators and compiles them, when iterated, into a single generator in which the operators are inlined: adjacent predicates are merged into one condition, adjacent selectors are composed into one expression, and the operators that end the enumeration break the loop as soon as they are met. As such, an item goes through one generator frame, whatever the number of operators.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from enum import Enum
+from typing import final
+
+from WinCopies.Collections import Generator
+from WinCopies.Collections import Iteration
+from WinCopies.Collections.Enumeration import IterableBase, IteratorProvider
+from WinCopies.Typing import INullable
+from WinCopies.Typing.Delegate import Converter, Predicate
+
+@final
+class Query[T](IterableBase[T]):
+    """A lazy sequence of Iteration operators applied to some items.
+
+    Operators return a new query, so that a query can be shared and extended. Unlike the enumerators used by some Iteration functions, a query does not consider None items as the end of the enumeration.
+    """
+    @final
+    class __Operator(Enum):
+        Include = 0
+        Exclude = 1
+        Select = 2
+        IncludeWhile = 3
+        IncludeUntil = 4
+        DoIncludeWhile = 5
+        DoIncludeUntil = 6
+        ExcludeWhile = 7
+        ExcludeUntil = 8
+
+    # Compiled loops, by operators and start of their sources, so that queries of the same shape share their code.
+    __loops: dict[tuple[tuple[__Operator, ...], tuple[int, ...]], Callable[..., Generator[object]]] = {}
+
+    def __init__(self, items: Iterable[T]|None):
+        super().__init__()
+
+        # Each source is processed by the operators added after it, from the index given by __starts.
+        self.__sources: tuple[Iterable[object]|None, ...] = (items,)
+        self.__starts: tuple[int, ...] = (0,)
+        self.__operators: tuple[Query.__Operator, ...] = ()
+        self.__functions: tuple[Callable[[object], object], ...] = ()
+
+    @staticmethod
+    def __Compile(operators: tuple[__Operator, ...], starts: tuple[int, ...]) -> Callable[..., Generator[object]]:
+        Operator: type[Query.__Operator] = Query.__Operator
+        stopping: tuple[Query.__Operator, ...] = (Operator.IncludeWhile, Operator.IncludeUntil, Operator.DoIncludeWhile, Operator.DoIncludeUntil)
+        lines: list[str] = ["def run(" + ", ".join([f"s{i}" for i in range(len(starts))] + [f"f{j}" for j in range(len(operators))]) + "):"]
+
+        for j, operator in enumerate(operators):
+            if operator in stopping:
+                lines.append(f"    stopped{j} = False")
+
+            elif operator in (Operator.ExcludeWhile, Operator.ExcludeUntil):
+                lines.append(f"    skipping{j} = True")
+
+        for i, start in enumerate(starts):
+            indentation: str = "    "
+            guards: list[str] = [f"stopped{j}" for j in range(start, len(operators)) if operators[j] in stopping]
+
+            # A source is not read once an operator it goes through has ended the enumeration.
+            if len(guards) > 0:
+                lines.append(f"{indentation}if not ({' or '.join(guards)}):")
+
+                indentation += "    "
+
+            lines.append(f"{indentation}for item in s{i}:")
+
+            indentation += "    "
+            loopIndentation: str = indentation
+            conditions: list[str] = []
+            expression: str = "item"
+            deferredStops: list[int] = []
+
+            def flushConditions() -> None:
+                nonlocal indentation
+
+                if len(conditions) > 0:
+                    lines.append(f"{indentation}if {' and '.join(conditions)}:")
+                    conditions.clear()
+
+                    indentation += "    "
+
+            def flushExpression() -> None:
+                nonlocal expression
+
+                if expression != "item":
+                    lines.append(f"{indentation}item = {expression}")
+
+                    expression = "item"
+
+            for j in range(start, len(operators)):
+                match operators[j]:
+                    case Operator.Include:
+                        flushExpression()
+                        conditions.append(f"f{j}(item)")
+
+                    case Operator.Exclude:
+                        flushExpression()
+                        conditions.append(f"not f{j}(item)")
+
+                    case Operator.Select:
+                        flushConditions()
+
+                        expression = f"f{j}({expression})"
+
+                    case Operator.IncludeWhile | Operator.IncludeUntil | Operator.DoIncludeWhile | Operator.DoIncludeUntil as operator:
+                        flushConditions()
+                        flushExpression()
+
+                        lines.append(f"{indentation}if {'not ' if operator in (Operator.IncludeWhile, Operator.DoIncludeWhile) else ''}f{j}(item):")
+                        lines.append(f"{indentation}    stopped{j} = True")
+
+                        # The item that ends a DoInclude operator is still processed by the next operators, so the loop is broken after them.
+                        if operator in (Operator.IncludeWhile, Operator.IncludeUntil):
+                            lines.append(f"{indentation}    break")
+
+                        else:
+                            deferredStops.append(j)
+
+                    case Operator.ExcludeWhile | Operator.ExcludeUntil as operator:
+                        flushConditions()
+                        flushExpression()
+
+                        lines.append(f"{indentation}if skipping{j}:")
+                        lines.append(f"{indentation}    skipping{j} = {'' if operator == Operator.ExcludeWhile else 'not '}f{j}(item)")
+
+                        conditions.append(f"not skipping{j}")
+
+            flushConditions()
+            flushExpression()
+
+            lines.append(f"{indentation}yield item")
+            lines.extend(f"{loopIndentation}if stopped{j}:\n{loopIndentation}    break" for j in deferredStops)
+
+        namespace: dict[str, object] = {}
+
+        exec(compile("\n".join(lines), f"<{__name__}>", "exec"), namespace)
+
+        return namespace["run"] # type: ignore
+
+    @final
+    def __GetLoop(self) -> Callable[..., Generator[object]]:
+        key: tuple[tuple[Query.__Operator, ...], tuple[int, ...]] = (self.__operators, self.__starts)
+        loop: Callable[..., Generator[object]]|None = Query.__loops.get(key)
+
+        if loop is None:
+            Query.__loops[key] = loop = Query.__Compile(self.__operators, self.__starts)
+
+        return loop
+
+    @final
+    def __Create[TResult](self, sources: tuple[Iterable[object]|None, ...], starts: tuple[int, ...], operators: tuple[__Operator, ...], functions: tuple[Callable[[object], object], ...]) -> "Query[TResult]":
+        query: Query[TResult] = Query[TResult](None)
+
+        query.__sources = sources
+        query.__starts = starts
+        query.__operators = operators
+        query.__functions = functions
+
+        return query
+
+    @final
+    def __Add[TResult](self, operator: __Operator, function: Callable[[object], object]) -> "Query[TResult]":
+        return self.__Create(self.__sources, self.__starts, self.__operators + (operator,), self.__functions + (function,))
+
+    def _TryGetIterator(self) -> Iterator[T]|None:
+        return self.__GetLoop()(*map(Iteration.TryEnumerate, self.__sources), *self.__functions) # type: ignore
+
+    def Include(self, predicate: Predicate[T]) -> "Query[T]":
+        """Includes only items that match a given predicate.
+
+        Args:
+            predicate: The filter function.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.Include, predicate) # type: ignore
+    def Exclude(self, predicate: Predicate[T]) -> "Query[T]":
+        """Excludes items that match a given predicate.
+
+        Args:
+            predicate: The filter function.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.Exclude, predicate) # type: ignore
+
+    def Select[TOut](self, converter: Converter[T, TOut]) -> "Query[TOut]":
+        """Transforms items using a converter function.
+
+        Args:
+            converter: The function to transform each item.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.Select, converter) # type: ignore
+    def WhereSelect[TOut](self, predicate: Predicate[T], converter: Converter[T, TOut]) -> "Query[TOut]":
+        """Filters then transforms items.
+
+        Args:
+            predicate: The filter function.
+            converter: The transformation function.
+
+        Returns:
+            A new query.
+        """
+        return self.Include(predicate).Select(converter)
+    def SelectWhere[TOut](self, converter: Converter[T, TOut], predicate: Predicate[TOut]) -> "Query[TOut]":
+        """Transforms then filters items.
+
+        Args:
+            converter: The transformation function.
+            predicate: The filter function applied to transformed items.
+
+        Returns:
+            A new query.
+        """
+        return self.Select(converter).Include(predicate)
+
+    def IncludeWhile(self, predicate: Predicate[T]) -> "Query[T]":
+        """Includes items while they match a predicate (exclusive).
+
+        Args:
+            predicate: The condition to continue including.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.IncludeWhile, predicate) # type: ignore
+    def IncludeUntil(self, predicate: Predicate[T]) -> "Query[T]":
+        """Includes items until one matches a predicate (exclusive).
+
+        Args:
+            predicate: The condition to stop including.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.IncludeUntil, predicate) # type: ignore
+    def DoIncludeWhile(self, predicate: Predicate[T]) -> "Query[T]":
+        """Includes items while they match a predicate (inclusive).
+
+        Args:
+            predicate: The condition to continue including.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.DoIncludeWhile, predicate) # type: ignore
+    def DoIncludeUntil(self, predicate: Predicate[T]) -> "Query[T]":
+        """Includes items until one matches a predicate (inclusive).
+
+        Args:
+            predicate: The condition to stop including.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.DoIncludeUntil, predicate) # type: ignore
+
+    def ExcludeWhile(self, predicate: Predicate[T]) -> "Query[T]":
+        """Excludes items while they match a predicate, then includes the rest.
+
+        Args:
+            predicate: The condition to continue excluding.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.ExcludeWhile, predicate) # type: ignore
+    def ExcludeUntil(self, predicate: Predicate[T]) -> "Query[T]":
+        """Excludes items until one matches a predicate, then includes the rest.
+
+        Args:
+            predicate: The condition to stop excluding.
+
+        Returns:
+            A new query.
+        """
+        return self.__Add(Query.__Operator.ExcludeUntil, predicate) # type: ignore
+
+    def Append(self, values: Iterable[T]|None) -> "Query[T]":
+        """Appends values to the end of the items. The values are only processed by the operators added afterwards.
+
+        Args:
+            values: The values to append.
+
+        Returns:
+            A new query.
+        """
+        return self.__Create(self.__sources + (values,), self.__starts + (len(self.__operators),), self.__operators, self.__functions)
+    def AppendItem(self, value: T) -> "Query[T]":
+        """Appends a single item to the end of the items.
+
+        Args:
+            value: The item to append.
+
+        Returns:
+            A new query.
+        """
+        return self.Append((value,))
+    def AppendValues(self, *values: T) -> "Query[T]":
+        """Appends variadic values to the end of the items.
+
+        Args:
+            *values: The values to append.
+
+        Returns:
+            A new query.
+        """
+        return self.Append(values)
+    def AppendIterable(self, values: Iterable[Iterable[T]|None]|None) -> "Query[T]":
+        """Appends the items of several iterables to the end of the items.
+
+        Args:
+            values: The iterables to append.
+
+        Returns:
+            A new query.
+        """
+        return self.Append(IteratorProvider[T](lambda: Iteration.Concatenate(values)))
+
+    def Prepend(self, values: Iterable[T]|None) -> "Query[T]":
+        """Prepends values to the beginning of the items. The values are only processed by the operators added afterwards.
+
+        Args:
+            values: The values to prepend.
+
+        Returns:
+            A new query.
+        """
+        return self.__Create((values,) + self.__sources, (len(self.__operators),) + self.__starts, self.__operators, self.__functions)
+    def PrependItem(self, value: T) -> "Query[T]":
+        """Prepends a single item to the beginning of the items.
+
+        Args:
+            value: The item to prepend.
+
+        Returns:
+            A new query.
+        """
+        return self.Prepend((value,))
+    def PrependValues(self, *values: T) -> "Query[T]":
+        """Prepends variadic values to the beginning of the items.
+
+        Args:
+            *values: The values to prepend.
+
+        Returns:
+            A new query.
+        """
+        return self.Prepend(values)
+
+    def TryGetFirst(self) -> INullable[T]:
+        """Gets the first item of the query, if any.
+
+        Returns:
+            An INullable with the first item if found, or a null value if the query is empty.
+        """
+        return Iteration.TryGetFirst(self) # type: ignore
+    def Any(self) -> bool:
+        """Checks whether the query contains any items.
+
+        Returns:
+            True if any items exist, False otherwise.
+        """
+        return Iteration.Any(self) is True
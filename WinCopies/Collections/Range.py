@@ -5,7 +5,7 @@ from WinCopies.Collections import IList, ReverseIndex
 from WinCopies.Collections.Abstraction.Collection import Tuple
 from WinCopies.Collections.Enumeration import ICountableEnumerable
 from WinCopies.Collections.Extensions import ITuple
-from WinCopies.Collections.Linked.Singly import CountableQueue, EnumerableStack
+from WinCopies.Collections.Linked.Singly import CountableQueue
 
 def GetItems[T](l: ITuple[T], index: SupportsIndex|slice) -> T|Sequence[T]:
     return l.GetAt(int(index)) if isinstance(index, SupportsIndex) else l.SliceAt(index).AsSequence()
@@ -102,7 +102,8 @@ def RemoveValues[T](lst: IList[T], key: slice) -> None:
     if i >= l:
         raise IndexError()
     
-    for index in EnumerableStack(*range(i, l, s)):
+    # The indices are removed from the last one, so that removing an item does not shift the next ones.
+    for index in reversed(range(i, l, s)):
         lst.RemoveAt(index)
 def RemoveItems[T](lst: IList[T], index: SupportsIndex|slice) -> None:
     if isinstance(index, SupportsIndex):
@@ -0,0 +1,185 @@
+"""
+Scans of numeric buffers in native code.
+
+The items of an array.array, of a one-dimensional memoryview or of a one-dimensional NumPy array are compared to a value without running Python code for each of them, either by the methods of the buffer or by C iterators, or by NumPy for its arrays. The scans return the same indices as a Python loop would, but only work for the comparisons described by a Comparison; the other predicates are left to the caller.
+
+NumPy is optional and never imported by this module: an ndarray can only be given once NumPy has been imported by its owner.
+"""
+
+import sys
+
+from array import array
+from collections.abc import Callable
+from enum import Enum
+from itertools import compress, count, islice, repeat
+from operator import eq, ne, lt, le, gt, ge, not_
+from typing import final
+
+class ComparisonOperator(Enum):
+    Equal = 0
+    NotEqual = 1
+    Less = 2
+    LessOrEqual = 3
+    Greater = 4
+    GreaterOrEqual = 5
+
+    def GetFunction(self) -> Callable[[object, object], bool]:
+        """Returns the function that compares an item, as its first argument, to a value with this operator."""
+        match self:
+            case ComparisonOperator.Equal:
+                return eq
+            case ComparisonOperator.NotEqual:
+                return ne
+            case ComparisonOperator.Less:
+                return lt
+            case ComparisonOperator.LessOrEqual:
+                return le
+            case ComparisonOperator.Greater:
+                return gt
+            case ComparisonOperator.GreaterOrEqual:
+                return ge
+
+@final
+class Comparison[T]:
+    """A predicate that compares items to a value, which the scans of this module can run in native code.
+
+    It can also be called as any other predicate: comparison(item) is item compared to the value with the operator, as in item < value for ComparisonOperator.Less.
+    """
+    __slots__ = ("__operator", "__value", "__function")
+
+    def __init__(self, operator: ComparisonOperator, value: T):
+        super().__init__()
+
+        self.__operator: ComparisonOperator = operator
+        self.__value: T = value
+        self.__function: Callable[[object, object], bool] = operator.GetFunction()
+
+    def GetOperator(self) -> ComparisonOperator:
+        return self.__operator
+    def GetValue(self) -> T:
+        return self.__value
+
+    def __call__(self, item: T) -> bool:
+        return self.__function(item, self.__value)
+
+# The number of items that NumPy compares at once, so that a scan that ends early does not compare all the items.
+__ChunkSize: int = 1 << 18
+
+# The formats of the memoryviews whose items are numbers.
+__Formats: frozenset[str] = frozenset(prefix + code for prefix in ("", "@") for code in "bBhHiIlLqQnNefd?")
+
+def __TryGetOperand(numpy: object, dtype: object, value: int|float) -> object|None:
+    # The value is only compared in native code when it is represented exactly in the type it is compared in, so that the comparisons are those of Python; otherwise, None is returned and the items are left to Python.
+    if dtype.kind == 'f': # type: ignore
+        # The items, such as float32 ones, are compared as float64, which represents all of them exactly, as Python does.
+        if isinstance(value, int):
+            try:
+                if int(float(value)) != value:
+                    return None
+
+            except OverflowError:
+                return None
+
+        return numpy.float64(value) # type: ignore
+
+    if isinstance(value, float):
+        if not value.is_integer():
+            return None
+
+        value = int(value)
+
+    # The items are integers, compared in their own type, so that those greater than 2 ** 53 are not rounded to a float.
+    if dtype.kind == 'b': # type: ignore
+        return value if value in (0, 1) else None
+
+    info: object = numpy.iinfo(dtype) # type: ignore
+
+    return dtype.type(value) if info.min <= value <= info.max else None # type: ignore
+
+def __TryFindInNdarray(numpy: object, items: object, operator: ComparisonOperator, value: object, start: int, stop: int, expected: bool) -> int|None:
+    if items.ndim != 1 or items.dtype.kind not in "biuf" or not isinstance(value, (int, float)): # type: ignore
+        return None
+
+    if (operand := __TryGetOperand(numpy, items.dtype, value)) is None: # type: ignore
+        return None
+
+    function: Callable[[object, object], object] = getattr(numpy, ("equal", "not_equal", "less", "less_equal", "greater", "greater_equal")[operator.value])
+
+    for chunkStart in range(start, stop, __ChunkSize):
+        matches: object = function(items[chunkStart:min(chunkStart + __ChunkSize, stop)], operand) # type: ignore
+
+        if not expected:
+            numpy.logical_not(matches, out = matches) # type: ignore
+
+        index: int = int(matches.argmax()) # type: ignore
+
+        if matches[index]: # type: ignore
+            return chunkStart + index
+
+    return -1
+
+def __TryFind(items: object, operator: ComparisonOperator, value: object, start: int, stop: int|None, expected: bool) -> int|None:
+    numpy: object|None = sys.modules.get("numpy")
+
+    if numpy is not None and isinstance(items, numpy.ndarray): # type: ignore
+        start, stop, _ = slice(start, stop).indices(len(items)) # type: ignore
+
+        return __TryFindInNdarray(numpy, items, operator, value, start, stop, expected)
+
+    if isinstance(items, array):
+        start, stop, _ = slice(start, stop).indices(len(items))
+
+        if operator == ComparisonOperator.Equal and expected:
+            try:
+                return items.index(value, start, stop)
+
+            except ValueError:
+                return -1
+
+        source: object = islice(items, start, stop)
+
+    elif isinstance(items, memoryview) and items.ndim == 1 and items.format in __Formats:
+        start, stop, _ = slice(start, stop).indices(len(items))
+
+        # The slices of a memoryview are not copied.
+        source = items[start:stop]
+
+    else:
+        return None
+
+    # The items are compared by C iterators, without any Python frame.
+    matches: object = map(operator.GetFunction(), source, repeat(value)) # type: ignore
+
+    if not expected:
+        matches = map(not_, matches) # type: ignore
+
+    return next(compress(count(start), matches), -1) # type: ignore
+
+def TryGetIndexOf[T](items: object, value: T, start: int = 0, stop: int|None = None) -> int|None:
+    """Finds the first item equal to a value in native code, if items can be scanned so.
+
+    Args:
+        items: The items to scan.
+        value: The value to find.
+        start: The index of the first item to compare.
+        stop: The index after the last item to compare, or None to compare the items until the end.
+
+    Returns:
+        The index of the first item equal to value, -1 if there is none, or None if items cannot be scanned in native code.
+    """
+    return __TryFind(items, ComparisonOperator.Equal, value, start, stop, True)
+
+def TryFindFirstIndex[T](items: object, predicate: Callable[[T], object], start: int = 0, stop: int|None = None, expected: bool = True) -> int|None:
+    """Finds the first item for which a predicate returns a given result in native code, if items and predicate can be scanned so.
+
+    Args:
+        items: The items to scan.
+        predicate: The predicate to evaluate; only a Comparison can be evaluated in native code.
+        start: The index of the first item to check.
+        stop: The index after the last item to check, or None to check the items until the end.
+        expected: Whether to find the first item that matches predicate, rather than the first one that does not.
+
+    Returns:
+        The index of the first item found, -1 if there is none, or None if items or predicate cannot be scanned in native code.
+    """
+    return __TryFind(items, predicate.GetOperator(), predicate.GetValue(), start, stop, expected) if isinstance(predicate, Comparison) else None
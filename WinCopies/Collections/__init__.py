@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from bisect import bisect_left
 from collections.abc import Generator as GeneratorBase, Sized, Iterable, Container, Sequence, MutableSequence
 from contextlib import AbstractContextManager
 from enum import Enum
@@ -126,6 +127,76 @@ def TryGetIndex[T](l: Sequence[T], index: int, ifTrue: Converter[int, T], ifFals
 def TryGetItem[TIn, TOut](l: Sequence[TIn], index: int, ifTrue: Converter[TIn, TOut], ifFalse: Function[TOut]) -> TOut:
     return ifTrue(l[index]) if ValidateIndex(index, len(l)) else ifFalse()
 
+@final
+class SequenceIndex[T]:
+    # The sorted positions of each value of an immutable sequence, so that the queries on a value do not scan the sequence. The values must be hashable; they are compared as by a dictionary, so only the values equal to an item and with the same hash are found.
+    __slots__ = ("__count", "__positions")
+
+    def __init__(self, items: Iterable[T]):
+        positions: dict[T, list[int]] = {}
+        count: int = 0
+
+        for item in items:
+            if (itemPositions := positions.get(item)) is None:
+                positions[item] = [count]
+            
+            else:
+                itemPositions.append(count)
+            
+            count += 1
+        
+        self.__count: int = count
+        self.__positions: dict[T, tuple[int, ...]] = {item: tuple(itemPositions) for item, itemPositions in positions.items()}
+    
+    def __GetPositions(self, value: T|object) -> tuple[int, ...]:
+        try:
+            return self.__positions.get(value, ()) # type: ignore
+        
+        except TypeError:
+            # An unhashable value cannot be indexed.
+            return ()
+    
+    def __GetRange(self, positions: tuple[int, ...], start: int, stop: int|None) -> tuple[int, int]:
+        return (bisect_left(positions, start), len(positions) if stop is None else bisect_left(positions, stop))
+    
+    def GetCount(self) -> int:
+        return self.__count
+    
+    def Contains(self, value: T|object) -> bool:
+        return len(self.__GetPositions(value)) > 0
+    
+    def GetCountOf(self, value: T|object, start: int = 0, stop: int|None = None) -> int:
+        first, last = self.__GetRange(self.__GetPositions(value), start, stop)
+
+        return max(last - first, 0)
+    
+    def GetIndices(self, value: T|object) -> tuple[int, ...]:
+        return self.__GetPositions(value)
+    
+    def GetFirstIndex(self, value: T|object, start: int = 0, stop: int|None = None) -> int|None:
+        positions: tuple[int, ...] = self.__GetPositions(value)
+        first, last = self.__GetRange(positions, start, stop)
+
+        return positions[first] if first < last else None
+    def GetLastIndex(self, value: T|object, start: int = 0, stop: int|None = None) -> int|None:
+        positions: tuple[int, ...] = self.__GetPositions(value)
+        first, last = self.__GetRange(positions, start, stop)
+
+        return positions[last - 1] if first < last else None
+    
+    def GetNthIndex(self, value: T|object, n: int) -> int|None:
+        positions: tuple[int, ...] = self.__GetPositions(value)
+
+        return positions[n] if Between(-len(positions), n, len(positions) - 1) else None
+
+class ISequenceIndexProvider[T](IInterface):
+    def __init__(self):
+        super().__init__()
+    
+    @abstractmethod
+    def TryGetSequenceIndex(self) -> SequenceIndex[T]|None:
+        pass
+
 def GetIndexOf[T](l: Sequence[T], value: T, i: int = 0, length: int|None = None, predicate: EqualityComparison[T]|None = None) -> DualNullableValueInfo[int, int]|None:
     def getReturnValue(value: int|None, info: int) -> DualNullableValueInfo[int, int]:
         return DualNullableValueInfo[int, int](value, info)
@@ -142,6 +213,15 @@ def GetIndexOf[T](l: Sequence[T], value: T, i: int = 0, length: int|None = None,
         return getNullValue(length)
     
     if predicate is None:
+        if isinstance(l, ISequenceIndexProvider) and (index := l.TryGetSequenceIndex()) is not None:
+            return getReturnValue(index.GetFirstIndex(value, i, length), length)
+        
+        # Vectorization is only needed by the searches without a predicate, so it is not imported with this package.
+        from WinCopies.Collections import Vectorization
+        
+        if (nativeIndex := Vectorization.TryGetIndexOf(l, value, i, length)) is not None:
+            return getReturnValue(None if nativeIndex < 0 else nativeIndex, length)
+        
         predicate = CompareEquality
     
     while i < length:
@@ -160,39 +240,134 @@ def IndexOf[T](l: Sequence[T], value: T, predicate: EqualityComparison[T]|None =
     
     return result.GetKey()
 
-def GetIndexOfSequence[T](l: Sequence[T], values: Sequence[T], i: int = 0) -> tuple[int|None, int, int]:
-    length: int = len(l)
-    valuesLength: int = len(values)
+def __AsBytes(l: object) -> bytes|bytearray|None:
+    if isinstance(l, (bytes, bytearray)):
+        return l
     
-    def getResult(result: int|None) -> tuple[int|None, int, int]:
-        return (result, length, valuesLength)
+    # Only the views whose items are the bytes themselves can be searched as bytes.
+    return l.tobytes() if isinstance(l, memoryview) and l.ndim == 1 and l.format == 'B' else None
 
-    if length == 0 or valuesLength == 0 or valuesLength > length:
-        return getResult(None)
-    
-    if valuesLength == 1:
-        result: DualNullableValueInfo[int, int]|None = GetIndexOf(l, values[0])
-        
-        if result is None:
-            raise NotImplementedError() # Should not end up here
+def __TryGetIndexOf[T](l: Sequence[T], value: T, i: int) -> int|None:
+    if isinstance(l, (list, tuple)):
+        try:
+            return l.index(value, i)
         
-        return (result.GetKey(), result.GetValue(), valuesLength)
+        except ValueError:
+            return None
     
+    result: DualNullableValueInfo[int, int]|None = GetIndexOf(l, value, i)
+
+    return None if result is None else result.GetKey()
+
+def __GetKnuthMorrisPrattIndex[T](l: Sequence[T], values: Sequence[T], i: int) -> int|None:
+    valuesLength: int = len(values)
+    # The length of the longest proper prefix of values[:j + 1] that is also a suffix of it, for each j.
+    prefixes: list[int] = [0] * valuesLength
     j: int = 0
 
-    while i < length:
-        if l[i] == values[j]:
+    for k in range(1, valuesLength):
+        while j > 0 and not values[k] == values[j]:
+            j = prefixes[j - 1]
+        
+        if values[k] == values[j]:
             j += 1
-
-            if j == valuesLength:
-                return getResult(i)
+        
+        prefixes[k] = j
+    
+    length: int = len(l)
+    index: int|None = i
+    j = 0
+
+    while index < length:
+        if j == 0:
+            # No item is matched: the next candidate is the next occurrence of the first value.
+            if (index := __TryGetIndexOf(l, values[0], index)) is None:
+                return None
+            
+            j = 1
         
         else:
-            j = 0
+            item: T = l[index]
 
-        i += 1
+            while j > 0 and not item == values[j]:
+                j = prefixes[j - 1]
+            
+            if item == values[j]:
+                j += 1
+        
+        if j == valuesLength:
+            return index - valuesLength + 1
+        
+        index += 1
+    
+    return None
+
+def __GetHorspoolIndex[T](l: Sequence[T], values: Sequence[T], i: int, shifts: dict[T, int]) -> int|None:
+    length: int = len(l)
+    valuesLength: int = len(values)
+    last: int = valuesLength - 1
+    lastValue: T = values[last]
+    # The number of items compared after a match of the last value, which is quadratic in the worst case: the search goes on in linear time once it exceeds the length of l.
+    compared: int = 0
+    k: int = i + last
+
+    while k < length:
+        item: T = l[k]
+
+        if item == lastValue:
+            start: int = k - last
+            j: int = 0
+
+            while j < last and l[start + j] == values[j]:
+                j += 1
+            
+            if j == last:
+                return start
+            
+            if (compared := compared + j) > length:
+                return __GetKnuthMorrisPrattIndex(l, values, start + 1)
+        
+        k += shifts.get(item, valuesLength)
+    
+    return None
+
+def __GetIndexOfSequence[T](l: Sequence[T], values: Sequence[T], i: int) -> int|None:
+    index: int
+
+    if isinstance(l, str):
+        if isinstance(values, str):
+            return None if (index := l.find(values, i)) < 0 else index
+    
+    elif (items := __AsBytes(l)) is not None and (_values := __AsBytes(values)) is not None:
+        return None if (index := items.find(_values, i)) < 0 else index
+    
+    if len(values) == 1:
+        return __TryGetIndexOf(l, values[0], i)
+    
+    shifts: dict[T, int] = {}
+
+    try:
+        # The shift of the window of l when its last item is a given value: the distance between the last occurrence of this value in values, before the last one, and the end of values.
+        for k in range(len(values) - 1):
+            shifts[values[k]] = len(values) - 1 - k
+        
+        return __GetHorspoolIndex(l, values, i, shifts)
+    
+    except TypeError:
+        # The items are not hashable: they are only compared.
+        return __GetKnuthMorrisPrattIndex(l, values, i)
+
+def GetIndexOfSequence[T](l: Sequence[T], values: Sequence[T], i: int = 0) -> tuple[int|None, int, int]:
+    length: int = len(l)
+    valuesLength: int = len(values)
+    
+    def getResult(result: int|None) -> tuple[int|None, int, int]:
+        return (result, length, valuesLength)
+
+    if valuesLength == 0 or i < 0 or valuesLength > length - i:
+        return getResult(None)
     
-    return getResult(None)
+    return getResult(__GetIndexOfSequence(l, values, i))
 
 def IndexOfSequence[T](l: Sequence[T], values: Sequence[T]) -> int|None:
     return GetIndexOfSequence(l, values)[0]
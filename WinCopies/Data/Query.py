@@ -19,6 +19,7 @@ from WinCopies.Collections.Linked import Singly
 from WinCopies.Collections.Linked.Singly import ICountableEnumerableList, Queue, CountableQueue, CountableEnumerableQueue
 
 from WinCopies.Typing import InvalidOperationError
+from WinCopies.Typing.Delegate import Predicate
 from WinCopies.Typing.Object import IValueItem, IString
 from WinCopies.Typing.Pairing import IKeyValuePair, DualResult
 
@@ -249,8 +250,8 @@ class SelectionQuery(SelectionQueryBase, NullableQuery[ISelectionQueryExecutionR
         
         @final
         class __Enumerator(RecursivelyEnumerable[ISubselectionQuery].StackedEnumerator):
-            def __init__(self, enumerable: RecursivelyEnumerable[ISubselectionQuery], enumerator: IEnumerator[ISubselectionQuery], queryBuilder: ISelectionQueryBuilder):
-                super().__init__(enumerable, enumerator)
+            def __init__(self, enumerable: RecursivelyEnumerable[ISubselectionQuery], enumerator: IEnumerator[ISubselectionQuery], queryBuilder: ISelectionQueryBuilder, maxDepth: int|None = None, prune: Predicate[ISubselectionQuery]|None = None):
+                super().__init__(enumerable, enumerator, maxDepth = maxDepth, prune = prune)
 
                 self.__queryBuilder: ISelectionQueryBuilder = queryBuilder
             
@@ -278,10 +279,10 @@ class SelectionQuery(SelectionQueryBase, NullableQuery[ISelectionQueryExecutionR
         def _AsRecursivelyEnumerable(self, container: ISubselectionQuery) -> IEnumerable[ISubselectionQuery]:
             return SelectionQuery.__Enumerable.__EnumerableSelectionQuery(container)
         
-        def _TryGetRecursiveStackedEnumerator(self, enumerator: IEnumerator[ISubselectionQuery], enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[ISubselectionQuery]|None = None) -> IEnumerator[ISubselectionQuery]|None:
-            return SelectionQuery.__Enumerable.__Enumerator(self, enumerator, self.__queryBuilder)
-        def _TryGetRecursiveEnumerator(self, enumerator: IEnumerator[ISubselectionQuery], handler: IRecursiveEnumerationHandler[ISubselectionQuery]|None = None) -> IEnumerator[ISubselectionQuery]|None:
-            return self._TryGetRecursiveStackedEnumerator(enumerator)
+        def _TryGetRecursiveStackedEnumerator(self, enumerator: IEnumerator[ISubselectionQuery], enumerationOrder: EnumerationOrder = EnumerationOrder.FIFO, handler: IRecursiveStackedEnumerationHandler[ISubselectionQuery]|None = None, maxDepth: int|None = None, prune: Predicate[ISubselectionQuery]|None = None) -> IEnumerator[ISubselectionQuery]|None:
+            return SelectionQuery.__Enumerable.__Enumerator(self, enumerator, self.__queryBuilder, maxDepth, prune)
+        def _TryGetRecursiveEnumerator(self, enumerator: IEnumerator[ISubselectionQuery], handler: IRecursiveEnumerationHandler[ISubselectionQuery]|None = None, maxDepth: int|None = None, prune: Predicate[ISubselectionQuery]|None = None) -> IEnumerator[ISubselectionQuery]|None:
+            return self._TryGetRecursiveStackedEnumerator(enumerator, maxDepth = maxDepth, prune = prune)
         
         def TryGetEnumerator(self) -> IEnumerator[ISubselectionQuery]|None:
             return self.__queries.TryGetEnumerator()
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from collections.abc import Iterable
-from typing import final, Callable, Self
+from typing import final, Callable, Self, TYPE_CHECKING
 
 
 
@@ -16,8 +16,6 @@ from WinCopies.Collections.Extensions import IDictionary
 from WinCopies.Collections.Iteration import Select
 from WinCopies.Collections.Linked.Singly import ICountableEnumerableList, CountableEnumerableQueue
 
-from WinCopies.IO.Stream import IMemoryTextStream, MemoryTextStream
-
 from WinCopies.Typing.Delegate import Converter, Method
 from WinCopies.Typing.Pairing import IKeyValuePair, DualResult
 
@@ -27,6 +25,10 @@ from WinCopies.Data import IOperandValue, IColumn, IQueryBuilder
 from WinCopies.Data.Misc import JoinType, IQueryBase
 from WinCopies.Data.Parameter import IArgument, ITableParameter
 
+# The stream is only needed once a query is built, so that importing the data layer does not import WinCopies.IO.
+if TYPE_CHECKING:
+    from WinCopies.IO.Stream import IMemoryTextStream
+
 class IConditionalQueryWriter(IQueryBuilder):
     def __init__(self):
         super().__init__()
@@ -178,6 +180,8 @@ class ConditionalQueryBuilder(IConditionalQueryBuilder):
     def __init__(self, query: IQueryBase[object]):
         super().__init__()
 
+        from WinCopies.IO.Stream import MemoryTextStream
+
         self.__query: IQueryBase[object] = query
         self.__stream: IMemoryTextStream = MemoryTextStream()
         self.__args: ICountableEnumerableList[object] = CountableEnumerableQueue[object]()
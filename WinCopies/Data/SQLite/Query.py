@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator as SystemIterator, Sequence
 from typing import final
 
 import sqlite3
 
 from WinCopies import String, Abstract
-from WinCopies.Collections import Enumeration, CreateList
+from WinCopies.Collections import Enumeration, Generator, CreateList
 from WinCopies.Collections.Enumeration import IEnumerable, ICountableEnumerable, IEnumerator, Enumerable
 from WinCopies.Collections.Extensions import IDictionary
 from WinCopies.Typing.Object import IString
@@ -72,10 +72,28 @@ class SelectionQuery(Query.SelectionQuery, __IQuery):
 
                 super().__init__(cursor)
 
+                self.__cursor: sqlite3.Cursor = cursor
                 self.__enumeratorUpdater: Action = enumeratorUpdater
             
             def _OnEnded(self) -> None:
                 self.__enumeratorUpdater()
+            
+            def _TryGetNativeIterator(self) -> SystemIterator[Sequence[object]]|None:
+                def iterate() -> Generator[Sequence[object]]:
+                    yield from self._GetIterator()
+
+                    self.__enumeratorUpdater()
+                
+                return iterate()
+            
+            def _MoveNextBatchOverride(self, items: list[Sequence[object]], count: int) -> int:
+                rows: list[Sequence[object]] = self.__cursor.fetchmany(count)
+
+                items.extend(rows)
+
+                self._SetCurrent(rows[-1] if len(rows) > 0 else None)
+
+                return len(rows)
         
         @final
         class FunctionUpdater(ValueFunctionUpdater[IEnumerator[Sequence[object]]|None]):
@@ -1,4 +1,6 @@
-from WinCopies.Collections import Generator
+from concurrent.futures import Executor
+
+from WinCopies.Collections import EnumerationOrder, Generator, Parallel
 from WinCopies.Collections.Enumeration import IEnumerator
 from WinCopies.IO import IDirEntry
 from WinCopies.IO.DirEntry import DirEntry
@@ -13,4 +15,10 @@ def GetEnumeratorFromPath(path: str) -> IEnumerator[IDirEntry]:
     return DirEntry.FromPath(path).GetRecursiveEnumerator()
 
 def EnumerateFromPath(path: str) -> Generator[IDirEntry]:
-    return Enumerate(DirEntry.FromPath(path))
\ No newline at end of file
+    return Enumerate(DirEntry.FromPath(path))
+
+def EnumerateInParallel(dirEntry: IDirEntry, executor: Executor, enumerationOrder: EnumerationOrder = EnumerationOrder.Null, maxWorkers: int|None = None) -> Generator[IDirEntry]:
+    # The directories are scanned by maxWorkers threads of executor, so that the scans that wait for the file system, such as on a network share, overlap.
+    return Parallel.EnumerateRecursively(dirEntry.AsIterable(), lambda entry: entry.AsIterable(), executor, enumerationOrder, maxWorkers)
+def EnumerateFromPathInParallel(path: str, executor: Executor, enumerationOrder: EnumerationOrder = EnumerationOrder.Null, maxWorkers: int|None = None) -> Generator[IDirEntry]:
+    return EnumerateInParallel(DirEntry.FromPath(path), executor, enumerationOrder, maxWorkers)
@@ -7,21 +7,31 @@ from WinCopies.Typing import IDisposable, IEquatable, IEquatableItem
 from WinCopies.Typing.Reflection import EnsureDirectModuleCall
 
 class IEquatableObject[T](IEquatable[T], IEquatableItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
 class IItem(IEquatableItem, IStringable):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
 class IObject[T](IEquatableObject[T], IItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 class Object[T](Abstract, IObject[T]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
 class IValueProvider(IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -29,6 +39,8 @@ class IValueProvider(IInterface):
     def GetUnderlyingValue(self) -> object:
         pass
 class IValueItem(IItem, IValueProvider):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -36,6 +48,8 @@ class IValueItem(IItem, IValueProvider):
     def GetValue(self) -> object:
         pass
 class IValueObject[TValue, TObject](IObject[TObject], IValueItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -43,6 +57,8 @@ class IValueObject[TValue, TObject](IObject[TObject], IValueItem):
     def GetValue(self) -> TValue:
         pass
 class ValueObjectBase[TValue, TUnderlying, TObject](Object[TObject], IValueObject[TValue, TObject]):
+    __slots__ = ("__value",)
+
     def __init__(self, value: TValue):
         super().__init__()
 
@@ -56,6 +72,8 @@ class ValueObjectBase[TValue, TUnderlying, TObject](Object[TObject], IValueObjec
     def GetUnderlyingValue(self) -> TUnderlying:
         pass
 class ValueObject[TValue, TObject](ValueObjectBase[TValue, TValue, TObject]):
+    __slots__ = ()
+
     def __init__(self, value: TValue):
         super().__init__(value)
     
@@ -111,9 +129,13 @@ def GetFalseObject() -> IBoolean:
     return __false
 
 class IInteger(IValueObject[int, 'IInteger']):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 class Integer(ValueObject[int, IInteger], IInteger):
+    __slots__ = ()
+
     def __init__(self, value: int):
         super().__init__(value)
     
@@ -157,9 +179,13 @@ class EnumValue[T: Enum](ValueObjectBase[T, int, IEnumValue[T]], IEnumValue[T]):
         return str(self.GetValue().name)
 
 class IString(IValueObject[str, 'IString']):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 class String(ValueObject[str, IString], IString):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value)
     
@@ -7,6 +7,8 @@ from WinCopies.Typing import IEquatable
 from WinCopies.Typing.BoolProvider import IBoolProvider, INullableBoolProvider
 
 class IKeyValuePair[TKey, TValue](IEquatable[Self]): # type: ignore
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -30,6 +32,8 @@ class IKeyValuePair[TKey, TValue](IEquatable[Self]): # type: ignore
         return self._Equals(item) and item.IsKeyValuePair() == self.IsKeyValuePair() and item.GetKey() == self.GetKey() and item.GetValue() == self.GetValue() # type: ignore
 
 class KeyValuePairBase[TKey, TValue](IKeyValuePair[TKey, TValue]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -40,6 +44,8 @@ class KeyValuePairBase[TKey, TValue](IKeyValuePair[TKey, TValue]):
     def _Equals(self, item: IKeyValuePair[TKey, TValue]|object) -> bool:
         return isinstance(item, KeyValuePairBase)
 class KeyValuePair[TKey, TValue](KeyValuePairBase[TKey, TValue]):
+    __slots__ = ("__key", "__value")
+
     def __init__(self, key: TKey, value: TValue):
         super().__init__()
 
@@ -59,6 +65,8 @@ class KeyValuePair[TKey, TValue](KeyValuePairBase[TKey, TValue]):
         return isinstance(item, KeyValuePair)
 
 class DualResult[TValue, TInfo](IKeyValuePair[TValue, TInfo]):
+    __slots__ = ("__value", "__info")
+
     def __init__(self, value: TValue, info: TInfo):
         super().__init__()
         
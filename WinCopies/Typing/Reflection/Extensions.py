@@ -1,24 +1,29 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from ast import Import, ImportFrom, Module, parse, walk
 from importlib import import_module
-from inspect import FrameInfo, Traceback, getframeinfo, getsource
-from pkgutil import ModuleInfo, walk_packages
 from sys import modules
 from types import ModuleType, FrameType
-from typing import Sequence, final
+from typing import Sequence, final, TYPE_CHECKING
 
 from WinCopies.Collections import Generator
 from WinCopies.Collections.Extensions import IArray
 from WinCopies.Collections.Abstraction.Collection import Array
 from WinCopies.Typing import Reflection, IInterface, INullable, IDisposableInfo, IDisposableProvider, DisposableProvider, GetNullable, GetNullValue, TryGetValue, GetDisposedError
 
+# ast, inspect and pkgutil are imported by the functions that use them, so that importing this module does not import them.
+if TYPE_CHECKING:
+    from ast import Module
+    from inspect import FrameInfo, Traceback
+    from pkgutil import ModuleInfo
+
 def ImportModule(package: ModuleType|str) -> ModuleType:
     return import_module(package) if isinstance(package, str) else package
 
 def EnumerateSubmodules(package: ModuleType|str, includePrivate: bool = False) -> Generator[ModuleInfo]:
     def enumerateSubmodules(package: ModuleType) -> Generator[ModuleInfo]:
+        from pkgutil import walk_packages
+
         for moduleInfo in walk_packages(package.__path__, package.__name__ + '.'):
             if includePrivate or not moduleInfo.name.split('.')[-1].startswith('_'):
                 yield moduleInfo
@@ -26,6 +31,9 @@ def EnumerateSubmodules(package: ModuleType|str, includePrivate: bool = False) -
     return enumerateSubmodules(ImportModule(package))
 
 def TryEnumerateImports(module: ModuleType) -> Generator[str]|None:
+    from ast import Import, ImportFrom, parse, walk
+    from inspect import getsource
+
     try:
         source: str = getsource(module)
         tree: Module = parse(source)
@@ -261,6 +269,8 @@ class __FrameInspector(IFrameInspector):
 def CreateFrameInspector(frameInfo: FrameInfo) -> IFrameInspector:
     return __FrameInspector(__FrameInfo(frameInfo))
 def CreateFrameInspectorFromFrame(frame: FrameType) -> IFrameInspector:
+    from inspect import getframeinfo
+
     return __FrameInspector(__Traceback(frame, getframeinfo(frame)))
 
 @final
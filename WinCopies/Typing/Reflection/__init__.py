@@ -1,31 +1,46 @@
+from abc import ABCMeta, get_cache_token
 from collections.abc import Iterable
+from functools import wraps
 from importlib import import_module
-from inspect import FrameInfo, stack, getfile, getmembers, ismethod
 from os import path, sep
-from sys import modules, builtin_module_names
+from sys import modules, builtin_module_names, _getframe
 from types import ModuleType, FrameType, MethodType
-from typing import List, Type
+from typing import final, Callable, Type, TYPE_CHECKING
+from weakref import WeakKeyDictionary, ref
 
-from WinCopies.Assertion import TryEnsureTrue, EnsureTrue
+from WinCopies.Assertion import AreGuardsEnabled, TryEnsureTrue, EnsureTrue
 from WinCopies.Collections import Generator
 from WinCopies.String import SplitFromLast
 from WinCopies.Typing import InvalidOperationError, INullable, GetNullable, GetNullValue, TryGetValue
-from WinCopies.Typing.Delegate import Converter, Selector
+from WinCopies.Typing.Delegate import Converter, Function, Selector
 from WinCopies.Typing.Pairing import KeyValuePair
 
+# inspect is imported by the functions that use it, so that importing this module does not import it.
+if TYPE_CHECKING:
+    from inspect import FrameInfo
+
 def __IsDirectCall(index: int, selector: Selector[str]) -> bool|None:
-    frames: List[FrameInfo] = stack()
-    
-    nextIndex: int = index + 1
+    # Only the two compared frames are fetched: no FrameInfo is built and no source line is read.
+    try:
+        frame: FrameType = _getframe(index)
+    except ValueError:
+        return None
 
-    if len(frames) > nextIndex:
-        def getName(index: int) -> str:
-            return selector(path.abspath(frames[index].filename))
-        
-        return getName(index) == getName(nextIndex)
-    
-    else:
+    nextFrame: FrameType|None = frame.f_back
+
+    if nextFrame is None:
         return None
+
+    fileName: str = frame.f_code.co_filename
+    nextFileName: str = nextFrame.f_code.co_filename
+
+    if fileName == nextFileName:
+        return True
+
+    def getName(fileName: str) -> str:
+        return selector(path.abspath(fileName))
+
+    return getName(fileName) == getName(nextFileName)
 def __EnsureDirectCall(index: int, selector: Converter[int, bool|None]) -> None:
     if not TryEnsureTrue(selector(index) == True):
         raise ValueError(index)
@@ -45,6 +60,8 @@ def IsDirectModuleCall() -> bool|None:
 def EnsureDirectModuleCall() -> None:
     """Ensures the caller is directly calling from the same module.
 
+    Does nothing when the guards are disabled; see WinCopies.Assertion.AreGuardsEnabled.
+
     Raises:
         AssertionError: If the call is not direct or if insufficient stack frames.
     """
@@ -60,6 +77,8 @@ def IsDirectPackageCall() -> bool|None:
 def EnsureDirectPackageCall() -> None:
     """Ensures the caller is directly calling from the same package.
 
+    Does nothing when the guards are disabled; see WinCopies.Assertion.AreGuardsEnabled.
+
     Raises:
         AssertionError: If the call is not direct or if insufficient stack frames.
     """
@@ -127,6 +146,8 @@ def IsModuleInPackage(module: ModuleType, package: ModuleType) -> bool:
     Raises:
         TypeError: If module or package is built-in and has no file path.
     """
+    from inspect import getfile
+
     return path.abspath(getfile(module)).startswith(path.abspath(path.dirname(getfile(package))) + sep)
 def TryIsModuleInPackage(module: ModuleType, package: ModuleType) -> bool|None:
     """Tries to check if a module's file is located under a package's directory.
@@ -180,15 +201,91 @@ def TryGetModuleNameFromFrame(frame: FrameType) -> INullable[str]|None:
 
     return None if moduleName is None else (GetNullable(moduleName) if isinstance(moduleName, str) else GetNullValue())
 
-def TryGetModuleFromFrame(frame: FrameType) -> INullable[ModuleType]|None:
-    """Tries to get the module from a frame.
+@final
+class __ModuleCache:
+    def __init__(self):
+        self.__count: int = -1
+        self.__fileNames: dict[str, tuple[str, ModuleType]]|None = None
+        self.__modules: dict[str, INullable[ModuleType]] = {}
+        self.__packages: dict[tuple[str, ModuleType|str], tuple[ModuleType|None, ModuleType|None, bool]] = {}
+    
+    def Clear(self) -> None:
+        self.__count = len(modules)
+        self.__fileNames = None
+        self.__modules.clear()
+        self.__packages.clear()
+    
+    def __Validate(self) -> None:
+        # Any import or removal changes the length of sys.modules and drops every cached answer. The replacements and reloads, which do not change it, are detected by each lookup below.
+        if len(modules) != self.__count:
+            self.Clear()
+    
+    # The answers are keyed by module name rather than by code object, as the same code can be run with the globals of different modules, and each of them is only returned while sys.modules still holds the module it was computed for.
+    def GetModule(self, name: str) -> INullable[ModuleType]:
+        self.__Validate()
 
-    Args:
-        frame: The frame to extract the module from.
+        module: ModuleType|None = modules.get(name)
+        result: INullable[ModuleType]|None = self.__modules.get(name)
 
-    Returns:
-        None if module name not found; or INullable with the module if found or null value if module not in sys.modules.
+        if result is None or result.TryGetValue() is not module:
+            self.__modules[name] = result = GetNullValue() if module is None else GetNullable(module)
+
+        return result
+    
+    def IsInPackage(self, name: str, package: ModuleType|str, func: Function[bool]) -> bool:
+        self.__Validate()
+
+        module: ModuleType|None = modules.get(name)
+        packageModule: ModuleType|None = modules.get(package) if isinstance(package, str) else None
+        entry: tuple[ModuleType|None, ModuleType|None, bool]|None = self.__packages.get((name, package))
+
+        if entry is not None and entry[0] is module and entry[1] is packageModule:
+            return entry[2]
+        
+        result: bool = func()
+
+        # The package is only imported by func when it is given by name, so it is looked up again.
+        self.__packages[(name, package)] = (module, modules.get(package) if isinstance(package, str) else None, result)
+
+        return result
+    
+    def __IndexFileNames(self) -> dict[str, tuple[str, ModuleType]]:
+        self.__fileNames = {}
+
+        for name, module in list(modules.items()):
+            if hasattr(module, '__file__') and isinstance(module.__file__, str):
+                self.__fileNames.setdefault(module.__file__, (name, module))
+        
+        return self.__fileNames
+    
+    def FindModule(self, fileName: str) -> ModuleType|None:
+        self.__Validate()
+
+        fileNames: dict[str, tuple[str, ModuleType]] = self.__IndexFileNames() if self.__fileNames is None else self.__fileNames
+        entry: tuple[str, ModuleType]|None = fileNames.get(fileName)
+
+        # A miss is answered by the index until the length of sys.modules changes, so that looking up a file that is not a module does not scan sys.modules each time.
+        if entry is None:
+            return None
+        
+        if modules.get(entry[0]) is entry[1] and getattr(entry[1], '__file__', None) == fileName:
+            return entry[1]
+        
+        # A stale entry rebuilds the index, as its module may have been replaced by one with another file.
+        entry = self.__IndexFileNames().get(fileName)
+
+        return None if entry is None else entry[1]
+
+__moduleCache: __ModuleCache = __ModuleCache()
+
+def ClearModuleCache() -> None:
+    """Clears the cached module lookups.
+
+    The cache is invalidated automatically whenever the number of entries in sys.modules changes, and its answers are checked against the modules of sys.modules, so that replaced modules are not returned. A file name that is not found is not looked up again until then, so this function must be called after replacing a module of sys.modules by one with another file, for this file to be found.
     """
+    __moduleCache.Clear()
+
+def __TryGetModuleFromFrame(frame: FrameType) -> INullable[ModuleType]|None:
     moduleName: str|None = TryGetValue(TryGetModuleNameFromFrame(frame))
 
     if moduleName is None:
@@ -197,21 +294,33 @@ def TryGetModuleFromFrame(frame: FrameType) -> INullable[ModuleType]|None:
     module: ModuleType|None = modules.get(moduleName)
 
     return GetNullValue() if module is None else GetNullable(module)
+def TryGetModuleFromFrame(frame: FrameType) -> INullable[ModuleType]|None:
+    """Tries to get the module from a frame.
+
+    The result is cached per module name.
+
+    Args:
+        frame: The frame to extract the module from.
+
+    Returns:
+        None if module name not found; or INullable with the module if found or null value if module not in sys.modules.
+    """
+    moduleName: object|None = frame.f_globals.get('__name__')
+
+    return __moduleCache.GetModule(moduleName) if isinstance(moduleName, str) else __TryGetModuleFromFrame(frame)
 
 def TryFindModuleFromFileName(fileName: str) -> ModuleType|None:
     """Tries to find a module by its file name in sys.modules.
 
+    The file name index is built once and reused, for the files it does not hold too, until the length of sys.modules changes; see ClearModuleCache.
+
     Args:
         fileName: The file name to search for.
 
     Returns:
         The module if found, None otherwise.
     """
-    for _, module in modules.items():
-        if hasattr(module, '__file__') and module.__file__ == fileName:
-            return module
-
-    return None
+    return __moduleCache.FindModule(fileName)
 
 def TryGetPackageNameFromFrame(frame: FrameType) -> str|None:
     """Tries to get the package name from a frame.
@@ -236,16 +345,7 @@ def TryGetPackageNameFromFrame(frame: FrameType) -> str|None:
 
     return SplitFromLast(module, '.')[0] if isinstance(module, str) else None
 
-def TryIsModuleInPackageFromFrame(frame: FrameType, package: ModuleType|str) -> bool:
-    """Tries to check if the module from a frame is in a package.
-
-    Args:
-        frame: The frame to extract the module from.
-        package: The package (as ModuleType or string name).
-
-    Returns:
-        True if the module is in the package, False otherwise.
-    """
+def __TryIsModuleInPackageFromFrame(frame: FrameType, package: ModuleType|str) -> bool:
     module: ModuleType|None = TryGetValue(TryGetModuleFromFrame(frame))
 
     if module is None:
@@ -263,6 +363,21 @@ def TryIsModuleInPackageFromFrame(frame: FrameType, package: ModuleType|str) ->
             return getattr(module, "__name__", '')
 
         return IsSubmoduleFromNames(getName(module), getName(package))
+def TryIsModuleInPackageFromFrame(frame: FrameType, package: ModuleType|str) -> bool:
+    """Tries to check if the module from a frame is in a package.
+
+    The result is cached per module name and package.
+
+    Args:
+        frame: The frame to extract the module from.
+        package: The package (as ModuleType or string name).
+
+    Returns:
+        True if the module is in the package, False otherwise.
+    """
+    moduleName: object|None = frame.f_globals.get('__name__')
+
+    return __moduleCache.IsInPackage(moduleName, package, lambda: __TryIsModuleInPackageFromFrame(frame, package)) if isinstance(moduleName, str) else __TryIsModuleInPackageFromFrame(frame, package)
 
 def __TryOnModuleNameFromFrame[T](frame: FrameType, func: Converter[str, T]) -> INullable[T]|None:
     result: INullable[str]|None = TryGetModuleNameFromFrame(frame)
@@ -315,17 +430,19 @@ def TryIsBuiltin(frame: FrameType) -> INullable[bool]|None:
     """
     return __TryOnModuleNameFromFrame(frame, IsBuiltin)
 
-def EnumerateFromCallStack() -> Generator[FrameInfo]:
+def EnumerateFromCallStack() -> Generator['FrameInfo']:
     """Enumerates all frames from the call stack.
 
     Yields:
         FrameInfo objects from the call stack.
     """
+    from inspect import stack
+
     for frame in stack():
         yield frame
 
 def __CheckCallerPackage(targetPackage: ModuleType|str, index: int) -> bool:
-    return TryIsModuleInPackageFromFrame(stack()[index].frame, targetPackage)
+    return TryIsModuleInPackageFromFrame(_getframe(index), targetPackage)
 
 def CheckCallerPackage(targetPackage: ModuleType|str) -> bool:
     """Checks if the caller is from a specific package.
@@ -340,6 +457,8 @@ def CheckCallerPackage(targetPackage: ModuleType|str) -> bool:
 def EnsureCallerPackage(targetPackage: ModuleType|str) -> None:
     """Ensures the caller is from a specific package.
 
+    Does nothing when the guards are disabled; see WinCopies.Assertion.AreGuardsEnabled.
+
     Args:
         targetPackage: The package to check (as ModuleType or string name).
 
@@ -349,6 +468,152 @@ def EnsureCallerPackage(targetPackage: ModuleType|str) -> None:
     if not __CheckCallerPackage(targetPackage, 2):
         raise InvalidOperationError(f"This function can only be called from {targetPackage}.")
 
+if not AreGuardsEnabled():
+    # Guards are disabled for the whole process: the guards are swapped for no-ops before any module imports them. The no-ops keep the docstrings of the guards they replace.
+    @wraps(EnsureDirectModuleCall)
+    def EnsureDirectModuleCall() -> None:
+        pass
+    @wraps(EnsureDirectPackageCall)
+    def EnsureDirectPackageCall() -> None:
+        pass
+    @wraps(EnsureCallerPackage)
+    def EnsureCallerPackage(targetPackage: ModuleType|str) -> None:
+        pass
+
+def __IsSubclass[T](cls: Type[T], types: Iterable[Type[T]]) -> bool:
+    for type in types:
+        if issubclass(cls, type):
+            return True
+
+    return False
+def __Implements[T](cls: Type[T], types: Iterable[Type[T]]) -> bool:
+    for type in types:
+        if not issubclass(cls, type):
+            return False
+
+    return True
+
+@final
+class __PredicateCache:
+    def __init__(self, predicate: Callable[[type, tuple[type, ...]], bool]):
+        self.__predicate: Callable[[type, tuple[type, ...]], bool] = predicate
+        self.__token: object = get_cache_token()
+        # WeakKeyDictionary lookups run in Python and cost about as much as a few subclass checks, so the results are stored in a plain dictionary keyed by weak references that remove their entry when their class is collected.
+        self.__results: dict[ref[type], dict[tuple[type, ...], bool]] = {}
+    
+    def Clear(self) -> None:
+        self.__token = get_cache_token()
+        self.__results.clear()
+    
+    def Get(self, cls: type, types: tuple[type, ...]) -> bool:
+        # Registering a virtual subclass of any ABC changes the ABC cache token and may change any cached answer.
+        if get_cache_token() != self.__token:
+            self.Clear()
+
+        try:
+            results: dict[tuple[type, ...], bool]|None = self.__results.get(ref(cls))
+            result: bool|None = None if results is None else results.get(types)
+        except TypeError:
+            # cls is not a class or types are not hashable: there is nothing to cache and the predicate raises the usual error, if any.
+            return self.__predicate(cls, types)
+        
+        if result is None:
+            result = self.__predicate(cls, types)
+
+            # The results hold the types they are checked against, so they are only cached if these types live as long as the process.
+            if all(map(self.__IsStatic, types)):
+                if results is None:
+                    self.__results[ref(cls, self.__Remove)] = results = {}
+                
+                results[types] = result
+        
+        return result
+    
+    def __Remove(self, key: ref[type]) -> None:
+        self.__results.pop(key, None)
+    
+    @staticmethod
+    def __IsStatic(cls: type) -> bool:
+        # A builtin type, or a type bound to the name it was defined with in its module; the other types, such as the classes created by functions, can be collected.
+        module: ModuleType|None = modules.get(cls.__module__)
+
+        return module is not None and (cls.__module__ == "builtins" or getattr(module, cls.__qualname__, None) is cls)
+
+@final
+class __TypeCache:
+    def __init__(self):
+        self.__values: WeakKeyDictionary[type, dict[object, object]] = WeakKeyDictionary()
+    
+    def Clear(self) -> None:
+        self.__values.clear()
+    
+    def Get[T](self, cls: type, key: object, func: Function[T]) -> T:
+        values: dict[object, object]|None = self.__values.get(cls)
+
+        if values is None:
+            self.__values[cls] = values = {}
+        
+        if key in values:
+            return values[key] # type: ignore
+        
+        values[key] = value = func()
+
+        return value
+
+__subclassCache: __PredicateCache = __PredicateCache(__IsSubclass)
+__implementationCache: __PredicateCache = __PredicateCache(__Implements)
+__typeCache: __TypeCache = __TypeCache()
+
+def ClearTypeCache() -> None:
+    """Clears the cached method tables, subclass checks and class values.
+
+    The cached subclass checks are invalidated automatically when a virtual subclass is registered to an ABC. This function is only needed when the bases or the methods of a class are changed after it was first inspected.
+    """
+    __subclassCache.Clear()
+    __implementationCache.Clear()
+    __typeCache.Clear()
+
+def GetTypeCacheValue[T](cls: type, key: object, func: Function[T]) -> T:
+    """Gets a value computed from a class, computing it only the first time it is requested for this class and key.
+
+    The values are dropped when their class is collected and by ClearTypeCache, which must be called if the members of the class are changed afterwards.
+
+    Args:
+        cls: The class from which the value is computed.
+        key: The key of the value, unique to the function that computes it. Neither the key nor the value may reference the class, which would keep it alive.
+        func: The function that computes the value.
+
+    Returns:
+        The cached value, or the value returned by func if there is none.
+    """
+    return __typeCache.Get(cls, key, func)
+
+# For these metaclasses, an instance check only depends on the class of the instance, so it can be answered by the cached subclass checks.
+__instanceCheckMetaclasses: tuple[type, ...] = (type, ABCMeta)
+
+def __AreInstances(cls: type, values: tuple[object, ...]) -> bool:
+    types: tuple[type] = (cls,)
+    checked: type|None = None
+
+    for value in values:
+        valueType: type = type(value)
+
+        # Consecutive values of a type that was already checked are not checked again.
+        if valueType is checked:
+            continue
+        
+        # __class__ can be overridden to differ from the actual type of the value, in which case isinstance checks both.
+        if value.__class__ is valueType:
+            if not IsSubclass(valueType, types):
+                return False
+            
+            checked = valueType
+        
+        elif not isinstance(value, cls):
+            return False
+    
+    return True
+
 def IsSubclass[T](cls: Type[T], types: Iterable[Type[T]]) -> bool:
     """Checks if a class is a subclass of any type in an iterable.
 
@@ -359,11 +624,8 @@ def IsSubclass[T](cls: Type[T], types: Iterable[Type[T]]) -> bool:
     Returns:
         True if the class is a subclass of at least one type, False otherwise.
     """
-    for type in types:
-        if issubclass(cls, type):
-            return True
-
-    return False
+    # Only tuples are cached, since other iterables would have to be consumed to build a key.
+    return __subclassCache.Get(cls, types) if type(types) is tuple else __IsSubclass(cls, types)
 def IsSubclassOf[T](cls: Type[T], *types: Type[T]) -> bool:
     """Checks if a class is a subclass of any type in variadic arguments.
 
@@ -409,11 +671,7 @@ def Implements[T](cls: Type[T], types: Iterable[Type[T]]) -> bool:
     Returns:
         True if the class is a subclass of all types, False otherwise.
     """
-    for type in types:
-        if not issubclass(cls, type):
-            return False
-
-    return True
+    return __implementationCache.Get(cls, types) if type(types) is tuple else __Implements(cls, types)
 def ImplementsAll[T](cls: Type[T], *types: Type[T]) -> bool:
     """Checks if a class implements all types in variadic arguments.
 
@@ -459,11 +717,32 @@ def AreInstances(type: type, *values: object) -> bool:
     Returns:
         True if all values are instances of the type, False otherwise.
     """
-    for value in values:
-        if not isinstance(value, type):
-            return False
+    if type.__class__ not in __instanceCheckMetaclasses:
+        for value in values:
+            if not isinstance(value, type):
+                return False
 
-    return True
+        return True
+    
+    return __AreInstances(type, values)
 
 def GetMethods(obj: object) -> Generator[KeyValuePair[str, MethodType]]:
-    return (KeyValuePair(method_name, method) for (method_name, method) in getmembers(obj.__class__, ismethod))
\ No newline at end of file
+    """Enumerates the methods bound to the class of an object.
+
+    The names of the methods are computed once per class; ClearTypeCache must be called if methods are added to or removed from the class afterwards.
+
+    Args:
+        obj: The object whose class is inspected.
+
+    Returns:
+        The name and the method of each member of the class for which inspect.ismethod returns True, sorted by name.
+    """
+    cls: type = obj.__class__
+
+    def getMethodNames() -> tuple[str, ...]:
+        from inspect import getmembers, ismethod
+
+        return tuple(name for (name, _) in getmembers(cls, ismethod))
+    
+    # Only the names are stored: bound methods would keep the class alive.
+    return (KeyValuePair(name, getattr(cls, name)) for name in __typeCache.Get(cls, GetMethods, getMethodNames))
\ No newline at end of file
@@ -32,6 +32,8 @@ class InvalidOperationError(Exception):
         super().__init__(*args)
 
 class IEquatableValue(IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -43,6 +45,8 @@ class IEquatableValue(IInterface):
     def __eq__(self, value: object) -> bool:
         return self.Equals(value)
 class IEquatableItem(IEquatableValue):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -55,6 +59,8 @@ class IEquatableItem(IEquatableValue):
         return self.Hash()
 
 class IEquatable[T](IEquatableValue):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -82,6 +88,8 @@ class IDisposableInfo(IDisposable):
         pass
 
 class __IGenericConstraint[TContainer, TInterface](IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -89,6 +97,8 @@ class __IGenericConstraint[TContainer, TInterface](IInterface):
     def _AsContainer(self, container: TContainer) -> TInterface:
         pass
 class __IGenericSpecializedConstraint[TContainer, TOverridden, TInterface, TSpecialized](__IGenericConstraint[TContainer, TInterface]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -97,6 +107,8 @@ class __IGenericSpecializedConstraint[TContainer, TOverridden, TInterface, TSpec
         pass
 
 class IGenericConstraint[TContainer, TInterface](__IGenericConstraint[TContainer, TInterface]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -104,6 +116,8 @@ class IGenericConstraint[TContainer, TInterface](__IGenericConstraint[TContainer
     def _TryAsContainer(self, container: TContainer|None) -> TInterface|None:
         return None if container is None else self._AsContainer(container)
 class IGenericSpecializedConstraint[TContainer, TInterface, TSpecialized](IGenericConstraint[TContainer, TInterface], __IGenericSpecializedConstraint[TContainer, TContainer, TInterface, TSpecialized]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -112,6 +126,8 @@ class IGenericSpecializedConstraint[TContainer, TInterface, TSpecialized](IGener
         return None if container is None else self._AsSpecialized(container)
 
 class GenericConstraint[TContainer, TInterface](IGenericConstraint[TContainer, TInterface]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -122,6 +138,8 @@ class GenericConstraint[TContainer, TInterface](IGenericConstraint[TContainer, T
     def _GetInnerContainer(self) -> TInterface:
         return self._AsContainer(self._GetContainer())
 class GenericSpecializedConstraint[TContainer, TInterface, TSpecialized](GenericConstraint[TContainer, TInterface], IGenericSpecializedConstraint[TContainer, TInterface, TSpecialized]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -130,6 +148,8 @@ class GenericSpecializedConstraint[TContainer, TInterface, TSpecialized](Generic
         return self._AsSpecialized(self._GetContainer())
 
 class IGenericConstraintImplementation[T](__IGenericConstraint[T, T]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -137,6 +157,8 @@ class IGenericConstraintImplementation[T](__IGenericConstraint[T, T]):
     def _AsContainer(self, container: T) -> T:
         return container
 class IGenericSpecializedConstraintImplementation[TInterface, TSpecialized](IGenericConstraintImplementation[TInterface], __IGenericSpecializedConstraint[TInterface, TSpecialized, TInterface, TSpecialized]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -145,6 +167,8 @@ class IGenericSpecializedConstraintImplementation[TInterface, TSpecialized](IGen
         return container
 
 class INullable[T](IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     
@@ -179,6 +203,8 @@ class INullable[T](IInterface):
 
 @final
 class __Nullable[T](INullable[T]):
+    __slots__ = ("__value",)
+
     def __init__(self, value: T):
         super().__init__()
         
@@ -13,10 +13,14 @@ from types import TracebackType
 from typing import final, Self
 
 class IInterface:
+    __slots__ = ()
+
     def __init__(self):
         pass
 
 class Abstract(ABC, IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -112,6 +116,8 @@ class IDisposable(IInterface):
         return False
 
 class IStringable(IInterface):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
     